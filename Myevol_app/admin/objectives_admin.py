@@ -5,6 +5,7 @@ from django.utils.timezone import now
 from datetime import timedelta
 
 from ..models.objective_model import Objective
+from ..services.objective_progress_service import annotate_progress
 
 @admin.register(Objective)
 class ObjectiveAdmin(admin.ModelAdmin):
@@ -29,6 +30,10 @@ class ObjectiveAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Progression annotée : aucune requête COUNT par ligne de la liste."""
+        return annotate_progress(super().get_queryset(request).select_related('user'))
+
     def user_link(self, obj):
         """Affiche un lien vers l'utilisateur."""
         url = reverse("admin:Myevol_app_user_change", args=[obj.user.id])
@@ -11,6 +11,10 @@ class MyevolAppConfig(AppConfig):
         import Myevol_app.signals.journal_signals
         import Myevol_app.signals.objective_signals
         import Myevol_app.signals.quote_signals
+        import Myevol_app.signals.search_signals
         import Myevol_app.signals.stats_signals
+        import Myevol_app.signals.streak_signals
         import Myevol_app.signals.user_signals
+        import Myevol_app.signals.user_counter_signals
+        import Myevol_app.signals.user_cache_signals
         import Myevol_app.signals.userpreference_signals
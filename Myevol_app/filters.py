@@ -0,0 +1,16 @@
+from rest_framework.filters import SearchFilter
+
+from .services.search_service import get_search_backend
+
+
+class JournalSearchFilter(SearchFilter):
+    """
+    Filtre `?search=` des entrées de journal, servi par l'index plein texte
+    (voir `search_service`) plutôt que par `ILIKE '%terme%'`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        return get_search_backend().filter(queryset, query)
@@ -0,0 +1,38 @@
+# management/commands/purge_old_records.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from Myevol_app.services.purge_service import PURGE_POLICIES, run_policy
+
+
+class Command(BaseCommand):
+    help = "Applique les politiques de rétention (suppression par lots, avec reprise)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--policy", action="append", dest="policies",
+                            help=f"Politique à appliquer (répétable) : {', '.join(PURGE_POLICIES)}. Par défaut : toutes.")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Affiche le nombre de lignes purgeables sans rien supprimer.")
+        parser.add_argument("--batch-size", type=int, help="Nombre de lignes supprimées par lot.")
+        parser.add_argument("--max-batches", type=int,
+                            help="Nombre maximal de lots par politique (la purge reprendra au prochain passage).")
+
+    def handle(self, *args, **options):
+        names = options["policies"] or list(PURGE_POLICIES)
+        unknown = [name for name in names if name not in PURGE_POLICIES]
+        if unknown:
+            raise CommandError(f"Politique(s) inconnue(s) : {', '.join(unknown)}")
+
+        for name in names:
+            if options["dry_run"]:
+                report = run_policy(name, dry_run=True)
+                self.stdout.write(f"{name:<14} {report['candidates']} ligne(s) purgeable(s) (avant {report['cutoff']})")
+                continue
+
+            report = run_policy(name, max_batches=options["max_batches"], size=options["batch_size"])
+            status = "terminée" if report["completed"] else "interrompue"
+            self.stdout.write(
+                f"{name:<14} {report['deleted']} ligne(s) supprimée(s) en {report['batches']} lot(s), "
+                f"{report['duration']:.2f}s ({report['rate']:.0f}/s) — {status}"
+            )
+        self.stdout.write(self.style.SUCCESS("Purge terminée." if not options["dry_run"] else "Simulation terminée."))
@@ -0,0 +1,25 @@
+# management/commands/rebuild_search_index.py
+
+from django.core.management.base import BaseCommand
+
+from Myevol_app.models import JournalEntry
+from Myevol_app.services.search_service import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Reconstruit l'index de recherche plein texte des entrées de journal."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids",
+                            help="Identifiant d'utilisateur à réindexer (répétable). Par défaut : tous.")
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        queryset = None
+        if options["user_ids"]:
+            queryset = JournalEntry.objects.filter(user_id__in=options["user_ids"])
+
+        indexed = backend.rebuild(queryset)
+        self.stdout.write(self.style.SUCCESS(
+            f"{indexed} entrée(s) indexée(s) ({type(backend).__name__})."
+        ))
@@ -0,0 +1,28 @@
+# management/commands/rebuild_stats.py
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from Myevol_app.services.stats_service import rebuild_user_stats
+
+
+class Command(BaseCommand):
+    help = "Reconstruit entièrement les statistiques (jour, semaine, mois, année) à partir des entrées de journal."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids",
+                            help="Identifiant d'utilisateur à reconstruire (répétable). Par défaut : tous.")
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.all().order_by("pk")
+        if options["user_ids"]:
+            users = users.filter(pk__in=options["user_ids"])
+
+        total_users = total_rows = 0
+        for user in users.iterator():
+            total_rows += rebuild_user_stats(user)
+            total_users += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{total_rows} ligne(s) de statistiques reconstruite(s) pour {total_users} utilisateur(s)."
+        ))
@@ -0,0 +1,24 @@
+# management/commands/user_cache_stats.py
+
+from django.core.management.base import BaseCommand
+
+from Myevol_app.services.user_cache_service import get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = "Affiche les compteurs de succès / échecs du cache des métriques utilisateur."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true",
+                            help="Remet les compteurs à zéro après affichage.")
+
+    def handle(self, *args, **options):
+        for namespace, counters in get_stats().items():
+            self.stdout.write(
+                f"{namespace:<22} hits={counters['hits']:<8} misses={counters['misses']:<8} "
+                f"taux={counters['hit_rate']}%"
+            )
+
+        if options["reset"]:
+            reset_stats()
+            self.stdout.write(self.style.SUCCESS("Compteurs remis à zéro."))
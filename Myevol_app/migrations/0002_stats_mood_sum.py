@@ -0,0 +1,33 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='annualstat',
+            name='mood_sum',
+            field=models.IntegerField(blank=True, editable=False, help_text="Somme des humeurs de l'année (cumul incrémental)", null=True),
+        ),
+        migrations.AddField(
+            model_name='dailystat',
+            name='mood_sum',
+            field=models.IntegerField(blank=True, editable=False, help_text='Somme des humeurs de la journée (cumul incrémental)', null=True),
+        ),
+        migrations.AddField(
+            model_name='monthlystat',
+            name='mood_sum',
+            field=models.IntegerField(blank=True, editable=False, help_text='Somme des humeurs du mois (cumul incrémental)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weeklystat',
+            name='mood_sum',
+            field=models.IntegerField(blank=True, editable=False, help_text='Somme des humeurs de la semaine (cumul incrémental)', null=True),
+        ),
+    ]
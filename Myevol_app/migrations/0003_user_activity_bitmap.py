@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0002_stats_mood_sum'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='activity_bitmap',
+            field=models.BinaryField(default=bytes, help_text='Jours actifs (bit i = activity_origin + i jours).'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='activity_origin',
+            field=models.DateField(blank=True, editable=False, help_text='Jour correspondant au premier bit de activity_bitmap.', null=True),
+        ),
+    ]
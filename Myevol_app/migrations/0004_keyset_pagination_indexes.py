@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0003_user_activity_bitmap'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventlog',
+            index=models.Index(fields=['user', 'created_at'], name='Myevol_app__user_id_699921_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'created_at'], name='Myevol_app__user_id_b1bde6_idx'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:52
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+FTS_TABLE = "myevol_journal_fts"
+
+
+def create_search_index(apps, schema_editor):
+    """
+    PostgreSQL : index GIN sur le tsvector, puis calcul pour les entrées existantes.
+    SQLite : table FTS5 alimentée avec les entrées existantes.
+    """
+    connection = schema_editor.connection
+    JournalEntry = apps.get_model("Myevol_app", "JournalEntry")
+    table = JournalEntry._meta.db_table
+
+    if connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX journal_search_vector_gin ON {table} USING gin (search_vector)"
+        )
+        schema_editor.execute(
+            f"UPDATE {table} SET search_vector = "
+            f"setweight(to_tsvector('french', coalesce(content, '')), 'A') || "
+            f"setweight(to_tsvector('french', coalesce(category, '')), 'B')"
+        )
+    elif connection.vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"content, category, user_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, content, category, user_id) "
+            f"SELECT id, content, category, user_id FROM {table}"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS journal_search_vector_gin")
+    elif connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0004_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='journalentry',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Index plein texte (PostgreSQL), voir search_service', null=True),
+        ),
+        # L'index GIN n'existe que sous PostgreSQL ; les autres bases utilisent leur propre index
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='journalentry',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='journal_search_vector_gin'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
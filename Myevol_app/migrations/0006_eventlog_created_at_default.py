@@ -0,0 +1,19 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:55
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0005_journal_full_text_search'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='eventlog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text="Horodatage de l’événement (fixé à sa création, même si l'écriture est différée)"),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0006_eventlog_created_at_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventLogBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Heure'), ('day', 'Jour')], help_text='Taille de la tranche', max_length=4)),
+                ('bucket_start', models.DateTimeField(help_text='Début de la tranche')),
+                ('action', models.CharField(help_text="Type d'action agrégé", max_length=255)),
+                ('severity', models.CharField(choices=[('INFO', 'Information'), ('WARN', 'Warning'), ('ERROR', 'Error'), ('CRITICAL', 'Critical')], help_text='Niveau de gravité', max_length=10)),
+                ('count', models.PositiveIntegerField(default=0, help_text="Nombre d'événements dans la tranche")),
+                ('user', models.ForeignKey(blank=True, help_text='Utilisateur concerné (vide pour les événements système)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='event_log_buckets', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': "Agrégat d'événements",
+                'verbose_name_plural': "Agrégats d'événements",
+                'ordering': ['-bucket_start'],
+                'indexes': [models.Index(fields=['granularity', 'bucket_start'], name='Myevol_app__granula_bcfb8f_idx'), models.Index(fields=['user', 'granularity', 'bucket_start'], name='Myevol_app__user_id_f89228_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-18 11:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0007_eventlog_buckets'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['scheduled_at', 'is_read', 'archived'], name='Myevol_app__schedul_8973c7_idx'),
+        ),
+    ]
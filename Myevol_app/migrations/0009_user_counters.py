@@ -0,0 +1,49 @@
+# Generated by Django 4.2.20 on 2026-10-18 11:28
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    """Initialise les compteurs à partir des lignes existantes (une requête)."""
+    User = apps.get_model('Myevol_app', 'User')
+
+    def count(model_name, condition=Q()):
+        rows = (
+            apps.get_model('Myevol_app', model_name).objects.filter(condition, user=OuterRef('pk'))
+            .order_by().values('user').annotate(total=Count('pk')).values('total')
+        )
+        return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+    User.objects.update(
+        entries_count=count('JournalEntry'),
+        badges_count=count('Badge'),
+        unread_notifications_count=count('Notification', Q(is_read=False, archived=False)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0008_notification_scheduled_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='badges_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Nombre de badges obtenus.'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='entries_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text="Nombre d'entrées de journal."),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='unread_notifications_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Nombre de notifications non lues et non archivées.'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
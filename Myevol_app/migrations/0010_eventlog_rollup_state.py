@@ -0,0 +1,26 @@
+# Generated by Django 4.2.20 on 2026-10-18 11:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0009_user_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventLogRollupState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour_mark', models.DateTimeField(blank=True, help_text='Fin de la dernière heure agrégée', null=True)),
+                ('day_mark', models.DateTimeField(blank=True, help_text='Fin du dernier jour agrégé', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Date de la dernière agrégation')),
+            ],
+            options={
+                'verbose_name': "État de l'agrégation des événements",
+                'verbose_name_plural': "États de l'agrégation des événements",
+            },
+        ),
+    ]
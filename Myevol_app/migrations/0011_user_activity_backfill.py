@@ -0,0 +1,78 @@
+# Generated by Django 4.2.20 on 2026-10-18 14:05
+
+from django.db import migrations
+from django.db.models.functions import TruncDate
+from django.utils.timezone import localdate
+
+
+# Copies figées des fonctions de services/streak_service.py : la migration ne doit pas
+# dépendre du code applicatif courant.
+
+def int_to_bitmap(value):
+    return value.to_bytes((value.bit_length() + 7) // 8, 'little')
+
+
+def longest_run(value):
+    if not value:
+        return 0
+    return max(len(run) for run in bin(value)[2:].split('0'))
+
+
+def set_day(value, origin, day):
+    """Active un jour dans le bitmap (bit i = origin + i jours), en décalant l'origine si besoin."""
+    if origin is None:
+        origin = day
+    if day < origin:
+        value <<= (origin - day).days
+        origin = day
+    return value | (1 << (day - origin).days), origin
+
+
+def backfill_activity(apps, schema_editor):
+    """
+    Initialise le bitmap des jours actifs des comptes qui n'en ont pas encore, afin que
+    sa lecture n'ait jamais à l'écrire (une requête pour les jours, écritures par lots).
+    """
+    User = apps.get_model('Myevol_app', 'User')
+    JournalEntry = apps.get_model('Myevol_app', 'JournalEntry')
+
+    pending = User.objects.filter(activity_origin__isnull=True)
+    activity = {user_id: (0, None) for user_id in pending.values_list('pk', flat=True)}
+    if not activity:
+        return
+
+    days = (
+        JournalEntry.objects.filter(user__activity_origin__isnull=True)
+        .annotate(day=TruncDate('created_at'))
+        .order_by('user_id', 'day')
+        .values_list('user_id', 'day')
+        .distinct()
+    )
+    for user_id, day in days:
+        activity[user_id] = set_day(*activity[user_id], day)
+
+    today = localdate()
+    User.objects.bulk_update(
+        [
+            User(
+                pk=user_id,
+                activity_bitmap=int_to_bitmap(value),
+                activity_origin=origin or today,
+                longest_streak=longest_run(value),
+            )
+            for user_id, (value, origin) in activity.items()
+        ],
+        ['activity_bitmap', 'activity_origin', 'longest_streak'],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Myevol_app', '0010_eventlog_rollup_state'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
@@ -5,7 +5,8 @@ from django.utils.timezone import now
 from django.urls import reverse
 from django.conf import settings
 
-from ..services.levels_services import get_user_level, get_user_progress
+from ..services.levels_services import get_user_progress
+from ..services.badge_rule_service import build_user_metrics, evaluate
 
 User = settings.AUTH_USER_MODEL
 
@@ -83,6 +84,7 @@ class BadgeTemplate(models.Model):
     - GET /api/badges/templates/ : Liste tous les modèles de badges
     - GET /api/badges/templates/{id}/ : Détail d’un modèle
     - GET /api/badges/templates/{id}/progress/ : Progression vers ce badge
+    - GET /api/badges/templates/progress/ : Progression vers tous les badges (ETag)
     - POST /api/badges/sync/ : Vérifie quels badges peuvent être débloqués
 
     Champs utiles pour l’API :
@@ -144,36 +146,40 @@ class BadgeTemplate(models.Model):
             pass
         return None
 
-    def check_unlock(self, user):
-        """Vérifie si l'utilisateur peut débloquer ce badge."""
-        total = user.total_entries()
-        mood_avg = user.mood_average(7)
-
-        conditions = {
-            "Première entrée": total >= 1,
-            "Régulier": user.has_entries_every_day(5),
-            "Discipline": user.has_entries_every_day(10),
-            "Résilience": user.has_entries_every_day(15),
-            "Légende du Journal": user.has_entries_every_day(30),
-            "Ambassadeur d'humeur": mood_avg and mood_avg >= 9,
-            "Productivité": user.entries_today() >= 3,
-            "Objectif rempli !": user.all_objectives_achieved(),
-            "Persévérance": total >= 100,
-        }
-
-        if self.name in conditions:
-            return conditions[self.name]
-
-        level_number = self.extract_level_number()
-        if level_number:
-            return get_user_level(total) >= level_number
-
-        return False
-
-    def get_progress(self, user):
-        """Calcule la progression d’un utilisateur vers ce badge."""
-        total = user.total_entries()
-        unlocked = user.badges.filter(name=self.name).exists()
+    def check_unlock(self, user, metrics=None):
+        """
+        Vérifie si l'utilisateur peut débloquer ce badge.
+
+        La règle du modèle (voir `badge_rule_service.BADGE_RULES`) est évaluée en mémoire
+        sur un instantané des métriques de l'utilisateur.
+
+        Args:
+            user (User): Utilisateur concerné
+            metrics (dict, optional): Instantané déjà calculé (évite une requête par modèle)
+        """
+        if metrics is None:
+            metrics = build_user_metrics(user)
+        return evaluate(self, metrics)
+
+    def get_progress(self, user, metrics=None, earned_names=None):
+        """
+        Calcule la progression d’un utilisateur vers ce badge.
+
+        Args:
+            user (User): Utilisateur concerné
+            metrics (dict, optional): Instantané des métriques (voir `build_user_metrics`)
+            earned_names (set, optional): Noms des badges déjà obtenus par l'utilisateur
+
+        Pour un calcul sur tous les modèles, passer l'instantané et les noms obtenus
+        évite toute requête par modèle (voir `badge_service.get_badges_progress`).
+        """
+        if metrics is None:
+            metrics = build_user_metrics(user)
+        if earned_names is None:
+            earned_names = set(user.badges.values_list("name", flat=True))
+
+        total = metrics["total_entries"]
+        unlocked = self.name in earned_names
 
         if unlocked:
             level_number = self.extract_level_number()
@@ -206,7 +212,7 @@ class BadgeTemplate(models.Model):
                 "target": progress_data["next_threshold"]
             }
 
-        is_unlocked = self.check_unlock(user)
+        is_unlocked = self.check_unlock(user, metrics=metrics)
         return {
             "percent": 100 if is_unlocked else 0,
             "unlocked": is_unlocked,
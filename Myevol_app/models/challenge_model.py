@@ -173,11 +173,11 @@ class ChallengeProgress(models.Model):
         """
         is_new = self.pk is None
         super().save(*args, **kwargs)
-        from ..models.event_log_model import EventLog
+        from ..services.event_log_service import log_event
 
         if not is_new and self.completed and self.completed_at is None:
             self.completed_at = now()
-            EventLog.log_action(
+            log_event(
                 action="defi_termine",
                 description=f"{self.user.username} a complété le défi '{self.challenge.title}'",
                 user=self.user,
@@ -35,7 +35,8 @@ class EventLog(models.Model):
     - résumé (action + date)
     
     📦 Services liés :
-    - Peut être appelé depuis n’importe quel service via `EventLog.log_action(...)`
+    - `event_log_service.log_event(...)` : écriture différée et groupée (chemin recommandé)
+    - `EventLog.log_action(...)` : écriture immédiate
     """
     
     SEVERITY_CHOICES = [
@@ -62,8 +63,9 @@ class EventLog(models.Model):
         help_text="Détail ou message libre sur l'événement"
     )
     created_at = models.DateTimeField(
-        auto_now_add=True,
-        help_text="Horodatage de l’événement (généré automatiquement)"
+        default=now,
+        editable=False,
+        help_text="Horodatage de l’événement (fixé à sa création, même si l'écriture est différée)"
     )
     metadata = models.JSONField(
         null=True,
@@ -83,6 +85,7 @@ class EventLog(models.Model):
         verbose_name_plural = "Événements"
         indexes = [
             models.Index(fields=["user", "action"]),
+            models.Index(fields=["user", "created_at"]),
             models.Index(fields=["created_at"]),
         ]
 
@@ -148,3 +151,69 @@ class EventLog(models.Model):
         """Validation renforcée pour garantir la cohérence du champ severity."""
         if self.severity not in dict(self.SEVERITY_CHOICES):
             raise ValidationError({'severity': f"Invalid severity: {self.severity}"})
+
+
+class EventLogBucket(models.Model):
+    """
+    Compteur agrégé d'événements sur une tranche de temps (heure ou jour),
+    par (action, gravité, utilisateur).
+
+    Alimenté par `event_analytics_service.rollup_events` à partir des événements bruts ;
+    sert les statistiques de `/api/logs/statistics/` sans parcourir la table EventLog,
+    dont les lignes anciennes sont purgées.
+    """
+
+    HOUR = "hour"
+    DAY = "day"
+    GRANULARITY_CHOICES = [
+        (HOUR, "Heure"),
+        (DAY, "Jour"),
+    ]
+
+    granularity = models.CharField(max_length=4, choices=GRANULARITY_CHOICES, help_text="Taille de la tranche")
+    bucket_start = models.DateTimeField(help_text="Début de la tranche")
+    action = models.CharField(max_length=255, help_text="Type d'action agrégé")
+    severity = models.CharField(max_length=10, choices=EventLog.SEVERITY_CHOICES, help_text="Niveau de gravité")
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="event_log_buckets",
+        help_text="Utilisateur concerné (vide pour les événements système)"
+    )
+    count = models.PositiveIntegerField(default=0, help_text="Nombre d'événements dans la tranche")
+
+    class Meta:
+        ordering = ['-bucket_start']
+        verbose_name = "Agrégat d'événements"
+        verbose_name_plural = "Agrégats d'événements"
+        indexes = [
+            models.Index(fields=["granularity", "bucket_start"]),
+            models.Index(fields=["user", "granularity", "bucket_start"]),
+        ]
+
+    def __str__(self):
+        return f"{self.bucket_start:%Y-%m-%d %H:%M} ({self.granularity}) - {self.action} x{self.count}"
+
+
+class EventLogRollupState(models.Model):
+    """
+    État de l'agrégation des événements (ligne unique) : fin de la dernière heure et du
+    dernier jour agrégés.
+
+    Les marques sont conservées ici plutôt que déduites des tranches : les tranches
+    horaires sont purgées après leur rétention, et une période sans événement ne doit
+    pas faire revenir l'agrégation (ni les statistiques) sur des événements déjà comptés.
+    """
+
+    hour_mark = models.DateTimeField(null=True, blank=True, help_text="Fin de la dernière heure agrégée")
+    day_mark = models.DateTimeField(null=True, blank=True, help_text="Fin du dernier jour agrégé")
+    updated_at = models.DateTimeField(auto_now=True, help_text="Date de la dernière agrégation")
+
+    class Meta:
+        verbose_name = "État de l'agrégation des événements"
+        verbose_name_plural = "États de l'agrégation des événements"
+
+    def __str__(self):
+        return f"Agrégation : heures jusqu'au {self.hour_mark}, jours jusqu'au {self.day_mark}"
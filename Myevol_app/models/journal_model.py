@@ -2,6 +2,8 @@
 
 import logging
 from datetime import timedelta
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
 from django.utils.timezone import now
@@ -52,6 +54,7 @@ class JournalEntry(models.Model):
     category = models.CharField(max_length=100, verbose_name="Catégorie", help_text="La catégorie de l'entrée (ex : Travail, Santé)")
     created_at = models.DateTimeField(default=now, help_text="Date et heure de création de l’entrée")
     updated_at = models.DateTimeField(auto_now=True, help_text="Date et heure de la dernière mise à jour")
+    search_vector = SearchVectorField(null=True, editable=False, help_text="Index plein texte (PostgreSQL), voir search_service")
 
     class Meta:
         verbose_name = "Entrée de journal"
@@ -60,6 +63,7 @@ class JournalEntry(models.Model):
         indexes = [
             models.Index(fields=['user', 'created_at']),
             models.Index(fields=['category']),
+            GinIndex(fields=['search_vector'], name='journal_search_vector_gin'),
         ]
     
     def __str__(self):
@@ -103,30 +107,19 @@ class JournalEntry(models.Model):
 
     def save(self, *args, **kwargs):
         """
-        Surcharge de save : met à jour les stats, badges, streaks, défis.
+        Surcharge de save : statistiques et séries sont tenues à jour par les signaux
+        (`stats_signals`, `streak_signals`), badges et défis sont planifiés via
+        `journal_pipeline_service`.
+
+        Les valeurs stockées avant modification sont lues une seule fois, avant tout signal,
+        dans `previous_values` : (humeur, catégorie, date de création), ou None à la création.
         """
-        is_new = self.pk is None
+        self.previous_values = (
+            JournalEntry.objects.filter(pk=self.pk).values_list("mood", "category", "created_at").first()
+            if self.pk else None
+        )
         super().save(*args, **kwargs)
 
-        if is_new:
-            # Import local pour éviter les imports circulaires
-            from Myevol_app.models.stats_model import DailyStat
-            
-            # Importation locale de la fonction check_challenges
-            from Myevol_app.services.challenge_service import check_challenges
-
-            # Mise à jour des statistiques journalières
-            DailyStat.generate_for_user(self.user, self.created_at.date())
-
-            # Vérification des défis
-            check_challenges(self.user)
-
-            # Mise à jour des badges
-            self.user.update_badges()
-
-            # Mise à jour des séries de jours consécutifs
-            self.user.update_streaks()
-
     @staticmethod
     def count_today(user, reference_date=None):
         """
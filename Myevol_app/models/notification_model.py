@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.utils.timezone import now
 import logging
@@ -7,6 +7,62 @@ from django.core.exceptions import ValidationError
 User = settings.AUTH_USER_MODEL
 logger = logging.getLogger(__name__)
 
+UNREAD_COUNTER = "unread_notifications_count"
+
+
+class NotificationQuerySet(models.QuerySet):
+    """
+    Tient `User.unread_notifications_count` à jour lors des opérations de masse
+    (update, delete, bulk_create), qui ne déclenchent aucun signal : la variation est
+    calculée par services/user_counter_service.py à partir de la condition de l'opération.
+    """
+
+    COUNTED_FIELDS = {"is_read", "archived", "user", "user_id"}
+
+    def update(self, **kwargs):
+        if not self.COUNTED_FIELDS.intersection(kwargs):
+            return super().update(**kwargs)
+        from ..services.user_counter_service import refresh_counters, shift_unread_for_update
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            if "user" not in kwargs and "user_id" not in kwargs and shift_unread_for_update(self, kwargs):
+                return super().update(**kwargs)
+
+            # Changement de propriétaire ou valeurs calculées : recomptage des utilisateurs concernés
+            user_ids = set(self.order_by().values_list("user_id", flat=True).distinct())
+            count = super().update(**kwargs)
+            new_user = kwargs.get("user_id", kwargs.get("user"))
+            if new_user is not None:
+                user_ids.add(getattr(new_user, "pk", new_user))
+            refresh_counters(user_ids, [UNREAD_COUNTER])
+            return count
+    update.alters_data = True
+
+    def delete(self):
+        from ..services.user_counter_service import shift_unread_for_delete
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            shift_unread_for_delete(self)
+            return super().delete()
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from ..services.user_counter_service import increment_many, refresh_counters
+
+        objs = super().bulk_create(objs, *args, **kwargs)
+        unread = [obj for obj in objs if obj.is_unread]
+        if kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts"):
+            # Lignes réellement insérées inconnues : recomptage
+            refresh_counters({obj.user_id for obj in unread}, [UNREAD_COUNTER])
+        else:
+            deltas = {}
+            for obj in unread:
+                deltas[obj.user_id] = deltas.get(obj.user_id, 0) + 1
+            increment_many(deltas, UNREAD_COUNTER)
+        return objs
+
+
 class Notification(models.Model):
     """
     Modèle représentant une notification envoyée à un utilisateur.
@@ -46,10 +102,14 @@ class Notification(models.Model):
     scheduled_at = models.DateTimeField(null=True, blank=True, help_text="Date programmée pour afficher la notification")
     temporary_field = models.BooleanField(default=False)  # TEMPORAIRE
 
+    objects = NotificationQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'is_read', 'archived']),
+            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['scheduled_at', 'is_read', 'archived']),
         ]
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
@@ -60,6 +120,29 @@ class Notification(models.Model):
         """
         return f"{self.user.username} - {self.message[:50]}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # État compté dans User.unread_notifications_count au chargement (voir user_counter_signals)
+        if not instance.get_deferred_fields() & {"is_read", "archived"}:
+            instance._counted_unread = instance.is_unread
+        return instance
+
+    @property
+    def is_unread(self):
+        """Notification comptée comme non lue (ni lue, ni archivée)."""
+        return not self.is_read and not self.archived
+
+    def delete(self, *args, **kwargs):
+        """Supprime la notification et décrémente le compteur de non-lues si elle y figurait."""
+        from ..services.user_counter_service import increment
+
+        counted = getattr(self, "_counted_unread", self.is_unread)
+        result = super().delete(*args, **kwargs)
+        if counted:
+            increment(self.user_id, UNREAD_COUNTER, -1)
+        return result
+
     @property
     def type_display(self):
         """
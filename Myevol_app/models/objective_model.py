@@ -60,8 +60,28 @@ class Objective(models.Model):
         if self.target_date < now().date():
             raise ValidationError("La date cible ne peut pas être dans le passé.")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Clé d'une éventuelle progression annotée au chargement (voir objective_progress_service)
+        if not instance.get_deferred_fields() & {"user_id", "category", "target_date"}:
+            instance._entries_done_key = instance.progress_key()
+        return instance
+
+    def progress_key(self):
+        """Clé (utilisateur, catégorie, date cible) des entrées comptées pour cet objectif"""
+        return (self.user_id, self.category, self.target_date)
+
+    def set_entries_done(self, count):
+        """Mémorise le nombre d'entrées calculé pour la catégorie et la date cible actuelles"""
+        self.entries_done_count = count
+        self._entries_done_key = self.progress_key()
+
     def entries_done(self):
         """Compte le nombre d'entrées correspondant à la catégorie de cet objectif pour la date cible"""
+        # Valeur annotée ou mémorisée, tant que la catégorie et la date cible n'ont pas changé
+        if "entries_done_count" in self.__dict__ and getattr(self, "_entries_done_key", None) == self.progress_key():
+            return self.entries_done_count
         return self.user.entries.filter(
             category=self.category,
             created_at__date=self.target_date
@@ -90,7 +110,8 @@ class Objective(models.Model):
         Surcharge pour mettre à jour l'état 'done' automatiquement si l'objectif est atteint.
         La notification est désormais gérée par un signal externe.
         """
-        self.full_clean()  # Appelle clean()
+        # Appelle clean() ; la clé étrangère est garantie par la base (pas de requête de validation)
+        self.full_clean(exclude=["user"])
 
         logger.info(f"Sauvegarde de l'objectif: {self.title} (État: {'Complété' if self.done else 'En cours'})")
 
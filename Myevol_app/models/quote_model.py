@@ -1,11 +1,8 @@
 # MyEvol_app/models/quote_model.py
 
-import random
 import logging
-import hashlib
-import datetime
 from django.db import models
-from django.db.models import Avg, Count, Case, When, IntegerField
+from django.db.models import Count
 from django.conf import settings
 from django.core.exceptions import ValidationError
 
@@ -67,49 +64,14 @@ class Quote(models.Model):
     @classmethod
     def get_random(cls, mood_tag=None):
         """ Retourne une citation aléatoire, optionnellement filtrée par mood_tag. """
-        queryset = cls.objects.all()
-        if mood_tag:
-            queryset = queryset.filter(mood_tag=mood_tag)
-        
-        count = queryset.count()
-        if count == 0:
-            return None
-            
-        random_index = random.randint(0, count - 1)
-        return queryset[random_index]
+        from ..services.quote_service import get_random_quote
+        return get_random_quote(mood_tag)
 
     @classmethod
     def get_daily_quote(cls, user=None):
         """ Retourne la citation du jour, potentiellement personnalisée selon l'utilisateur. """
-        today = datetime.date.today().strftime("%Y%m%d")
-        mood_filter = None
-
-        if user:
-            recent_entries = user.entries.filter(
-                created_at__gte=datetime.datetime.now() - datetime.timedelta(days=3)
-            )
-            if recent_entries.exists():
-                avg_mood = recent_entries.aggregate(avg=Avg('mood'))['avg']
-                if avg_mood is not None:
-                    if avg_mood < 4:
-                        mood_filter = 'low'
-                    elif avg_mood > 7:
-                        mood_filter = 'positive'
-                    else:
-                        mood_filter = 'neutral'
-        
-        quotes = cls.objects.all()
-        if mood_filter:
-            quotes = quotes.filter(mood_tag=mood_filter)
-
-        count = quotes.count()
-        if count == 0:
-            return None
-
-        hash_obj = hashlib.md5(today.encode())
-        hash_int = int(hash_obj.hexdigest(), 16)
-        index = hash_int % count
-        return quotes[index]
+        from ..services.quote_service import get_daily_quote
+        return get_daily_quote(user)
 
     @classmethod
     def get_authors_list(cls):
@@ -17,6 +17,7 @@ class WeeklyStat(models.Model):
     week_start = models.DateField(help_text="Premier jour de la semaine (lundi)")
     entries_count = models.PositiveIntegerField(help_text="Nombre total d'entrées pour la semaine")
     mood_average = models.FloatField(null=True, blank=True, help_text="Moyenne des humeurs de la semaine")
+    mood_sum = models.IntegerField(null=True, blank=True, editable=False, help_text="Somme des humeurs de la semaine (cumul incrémental)")
     categories = models.JSONField(default=dict, blank=True, help_text="Répartition des entrées par catégorie")
 
     class Meta:
@@ -74,6 +75,7 @@ class DailyStat(models.Model):
     date = models.DateField(help_text="La date des statistiques")
     entries_count = models.PositiveIntegerField(default=0, help_text="Nombre total d'entrées pour la journée")
     mood_average = models.FloatField(null=True, blank=True, help_text="Moyenne des humeurs de la journée")
+    mood_sum = models.IntegerField(null=True, blank=True, editable=False, help_text="Somme des humeurs de la journée (cumul incrémental)")
     categories = models.JSONField(default=dict, blank=True, help_text="Répartition des entrées par catégorie")
 
     class Meta:
@@ -124,6 +126,7 @@ class MonthlyStat(models.Model):
     month_start = models.DateField(help_text="Premier jour du mois")
     entries_count = models.PositiveIntegerField(help_text="Nombre total d'entrées pour le mois")
     mood_average = models.FloatField(null=True, blank=True, help_text="Moyenne des humeurs du mois")
+    mood_sum = models.IntegerField(null=True, blank=True, editable=False, help_text="Somme des humeurs du mois (cumul incrémental)")
     categories = models.JSONField(default=dict, blank=True, help_text="Répartition des entrées par catégorie")
 
     class Meta:
@@ -166,6 +169,7 @@ class AnnualStat(models.Model):
     year_start = models.DateField(help_text="Premier jour de l'année")
     entries_count = models.PositiveIntegerField(help_text="Nombre total d'entrées pour l'année")
     mood_average = models.FloatField(null=True, blank=True, help_text="Moyenne des humeurs de l'année")
+    mood_sum = models.IntegerField(null=True, blank=True, editable=False, help_text="Somme des humeurs de l'année (cumul incrémental)")
     categories = models.JSONField(default=dict, blank=True, help_text="Répartition des entrées par catégorie")
 
     class Meta:
@@ -20,6 +20,14 @@ class UserPreference(models.Model):
     Chaque utilisateur a exactement une instance de ce modèle (relation one-to-one).
     """
     
+    # Préférence qui autorise chaque type de notification (types absents : refusés)
+    NOTIFICATION_FIELDS = {
+        'badge': 'notif_badge',
+        'objectif': 'notif_objectif',
+        'info': 'notif_info',
+        'statistique': 'notif_statistique',
+    }
+
     # Relation one-to-one avec l'utilisateur
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL, 
@@ -242,13 +250,8 @@ class UserPreference(models.Model):
             if user.preferences.should_send_notification('badge'):
                 send_badge_notification(user, badge)
         """
-        mapping = {
-            'badge': self.notif_badge,
-            'objectif': self.notif_objectif,
-            'info': self.notif_info,
-            'statistique': self.notif_statistique
-        }
-        result = mapping.get(notif_type, False)
+        field = self.NOTIFICATION_FIELDS.get(notif_type)
+        result = getattr(self, field) if field else False
         logger.debug(f"Vérification de la notification '{notif_type}' pour l'utilisateur {self.user.username}: {result}")
         return result
     
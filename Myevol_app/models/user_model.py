@@ -5,12 +5,8 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db.models import Count
-from django.utils.timezone import now
+from django.utils.timezone import localdate, now
 from collections import defaultdict
-from functools import wraps
-from django.core.cache import cache
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
 
 from ..services.levels_services import get_user_progress
 
@@ -18,27 +14,10 @@ from ..services.badge_service import update_user_badges
 from ..services.streak_service import update_user_streak
 from ..services.userpreference_service import create_or_update_preferences
 from ..services.user_stats_service import compute_current_streak, compute_mood_average
+from ..services.user_cache_service import cached_user_metric
 
 logger = logging.getLogger(__name__)
 
-def cache_result(timeout=60):
-    """
-    Décorateur pour mettre en cache le résultat d'une méthode d'instance 
-    pendant une durée donnée (en secondes).
-    """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            cache_key = f"user_{self.pk}_entries_by_category_{args}_{kwargs}"
-            cached_result = cache.get(cache_key)
-            if cached_result is not None:
-                return cached_result
-            result = func(self, *args, **kwargs)
-            cache.set(cache_key, result, timeout)
-            return result
-        return wrapper
-    return decorator
-
 class User(AbstractUser):
     """
     Modèle personnalisé d'utilisateur.
@@ -49,6 +28,12 @@ class User(AbstractUser):
     longest_streak = models.PositiveIntegerField(default=0, editable=False, help_text="Plus longue série de jours consécutifs.")
     avatar_url = models.URLField(blank=True, null=True, help_text="URL de l'avatar de l'utilisateur.")
     xp = models.PositiveIntegerField(default=0, help_text="Points d'expérience accumulés.")
+    activity_bitmap = models.BinaryField(default=bytes, editable=False, help_text="Jours actifs (bit i = activity_origin + i jours).")
+    activity_origin = models.DateField(null=True, blank=True, editable=False, help_text="Jour correspondant au premier bit de activity_bitmap.")
+    # Compteurs dénormalisés (voir services/user_counter_service.py)
+    entries_count = models.PositiveIntegerField(default=0, editable=False, help_text="Nombre d'entrées de journal.")
+    badges_count = models.PositiveIntegerField(default=0, editable=False, help_text="Nombre de badges obtenus.")
+    unread_notifications_count = models.PositiveIntegerField(default=0, editable=False, help_text="Nombre de notifications non lues et non archivées.")
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
@@ -89,9 +74,10 @@ class User(AbstractUser):
 
     @property
     def total_entries(self):
-        """Retourne le nombre total d'entrées de journal de l'utilisateur."""
-        return self.entries.count()
+        """Retourne le nombre total d'entrées de journal de l'utilisateur (compteur dénormalisé)."""
+        return self.entries_count
 
+    @cached_user_metric("mood_average")
     def mood_average(self, days=7, category=None):
         return compute_mood_average(self, days, category)
 
@@ -100,7 +86,7 @@ class User(AbstractUser):
         return compute_current_streak(self, reference_date)
 
 
-    @cache_result(timeout=300)
+    @cached_user_metric("entries_by_category")
     def entries_by_category(self, days=None):
         """
         Calcule la répartition des entrées de journal par catégorie 
@@ -116,6 +102,7 @@ class User(AbstractUser):
             .values_list('category', 'count')
         )
 
+    @cached_user_metric("level")
     def level(self):
         """
         Retourne le niveau actuel de l'utilisateur basé sur le nombre d'entrées.
@@ -123,6 +110,7 @@ class User(AbstractUser):
         progress = get_user_progress(self.total_entries)
         return progress['level']
 
+    @cached_user_metric("level_progress")
     def level_progress(self):
         """
         Retourne la progression du niveau actuel en pourcentage.
@@ -130,12 +118,15 @@ class User(AbstractUser):
         progress = get_user_progress(self.total_entries)
         return progress['progress']
 
-    def update_badges(self):
+    def update_badges(self, changed_metrics=None):
         """
         Met à jour les badges de l'utilisateur via le badge_service.
+
+        Args:
+            changed_metrics (iterable, optional): Métriques modifiées (None = toutes les règles)
         """
         try:
-            update_user_badges(self)
+            update_user_badges(self, changed_metrics=changed_metrics)
             logger.info(f"Badges mis à jour pour {self.username} (ID: {self.id})")
         except Exception as e:
             logger.error(f"Erreur lors de la mise à jour des badges pour {self.username} : {e}")
@@ -185,6 +176,20 @@ class User(AbstractUser):
         Sauvegarde personnalisée : crée les préférences par défaut à la création.
         """
         is_new = self.pk is None
+        if self._state.adding and self.activity_origin is None:
+            # Bitmap des jours actifs initialisé dès la création : aucune entrée encore
+            self.activity_origin = localdate()
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # Les compteurs ne sont écrits que par incréments atomiques : une sauvegarde
+            # complète ne doit pas les écraser avec une valeur lue plus tôt. Les champs
+            # différés (only()/defer()) restent exclus, comme le fait Django par défaut.
+            from ..services.user_counter_service import COUNTERS
+
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in COUNTERS and field.attname not in deferred
+            ]
         super().save(*args, **kwargs)
         if is_new:
             self.create_default_preferences()
@@ -206,14 +211,11 @@ class User(AbstractUser):
     def has_entries_every_day(self, days):
         """
         Vérifie si l'utilisateur a fait au moins une entrée par jour 
-        durant les X derniers jours.
+        durant les X derniers jours (lecture du bitmap des jours actifs).
         """
-        from ..models.journal_model import JournalEntry
-        start_date = now().date() - timedelta(days=days - 1)
-        entries = self.entries.filter(created_at__date__gte=start_date)
-        active_days = entries.values_list("created_at__date", flat=True).distinct()
-        return len(active_days) >= days
+        return self.current_streak() >= days
 
+    @cached_user_metric("entries_today")
     def entries_today(self):
         """Retourne le nombre d'entrées créées aujourd'hui."""
         return self.entries.filter(created_at__date=now().date()).count()
@@ -224,15 +226,3 @@ class User(AbstractUser):
         """
         from ..models.objective_model import Objective
         return not Objective.objects.filter(user=self, done=False).exists()
-
-    @receiver(post_save, sender='Myevol_app.User')
-    @receiver(post_delete, sender='Myevol_app.User')
-    
-    def invalidate_cache(sender, instance, **kwargs):
-        """
-        Invalide le cache des statistiques par catégorie lors d'une sauvegarde
-        ou suppression de l'utilisateur.
-        """
-        cache_key = f"user_{instance.pk}_entries_by_category_()_{{}}"
-        cache.delete(cache_key)
-        logger.info(f"Cache invalidé pour {instance.username} (ID: {instance.id})")
@@ -1,4 +1,10 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema_field, OpenApiTypes
 
@@ -41,3 +47,210 @@ class MyEvolPagination(PageNumberPagination):
             },
             'results': data
         })
+
+
+class MyEvolCursorPagination(CursorPagination):
+    """
+    Pagination par curseur (keyset) sur le couple (created_at, id) :
+    `WHERE created_at < c OR (created_at = c AND id < i) ORDER BY created_at DESC, id DESC`.
+
+    Le curseur encode les deux valeurs de la dernière ligne de la page : le couple étant
+    unique, aucune page ne repose sur un décalage (OFFSET), même quand de nombreuses lignes
+    partagent le même horodatage (insertions groupées).
+
+    S'appuie sur l'index (user, created_at) : le coût d'une page ne dépend pas de sa
+    profondeur, et aucun COUNT(*) n'est exécuté par défaut. L'ordre est fixe
+    (le paramètre `ordering` est ignoré dans ce mode).
+
+    Paramètre `count` :
+    - absent ou `none` : pas de total (`meta.count` vaut null) ;
+    - `exact` : COUNT(*) ;
+    - `estimate` : estimation du planificateur (PostgreSQL), COUNT(*) sur les autres bases.
+    """
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    count_query_param = 'count'
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count, self.count_is_estimate = self.get_count(queryset, request)
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*(
+                order[1:] if order.startswith('-') else f'-{order}' for order in self.ordering
+            ))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = queryset.filter(self._keyset_filter(queryset.model, current_position, reverse))
+
+        # Une ligne de plus que la page : indique s'il existe une page suivante
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = list(results[:self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def _get_position_from_instance(self, instance, ordering):
+        """Position = valeurs de tous les champs de tri (JSON), et non du seul premier."""
+        values = []
+        for order in ordering:
+            field_name = order.lstrip('-')
+            value = instance[field_name] if isinstance(instance, dict) else getattr(instance, field_name)
+            values.append(str(value))
+        return json.dumps(values)
+
+    def _keyset_filter(self, model, position, reverse):
+        """
+        Condition de comparaison lexicographique sur les champs de tri :
+        (a, b) < (x, y)  ⇔  a < x OU (a = x ET b < y).
+        """
+        try:
+            raw_values = json.loads(position)
+            fields = [order.lstrip('-') for order in self.ordering]
+            if not isinstance(raw_values, list) or len(raw_values) != len(fields):
+                raise ValueError(position)
+            values = [model._meta.get_field(name).to_python(raw) for name, raw in zip(fields, raw_values)]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        condition = Q()
+        equal = {}
+        for order, field_name, value in zip(self.ordering, fields, values):
+            # Tri décroissant parcouru vers l'avant (ou croissant à rebours) : valeurs inférieures
+            lookup = 'lt' if order.startswith('-') != reverse else 'gt'
+            condition |= Q(**equal, **{f'{field_name}__{lookup}': value})
+            equal[field_name] = value
+        return condition
+
+    def get_count(self, queryset, request):
+        """Retourne (total, estimé ?) selon le paramètre `count`."""
+        mode = request.query_params.get(self.count_query_param, 'none')
+        if mode == 'exact':
+            return queryset.count(), False
+        if mode == 'estimate':
+            estimate = estimate_count(queryset)
+            if estimate is not None:
+                return estimate, True
+            return queryset.count(), False
+        return None, False
+
+    @extend_schema_field(
+        {
+            "type": "object",
+            "properties": {
+                "success": {"type": "boolean", "example": True},
+                "meta": {
+                    "type": "object",
+                    "properties": {
+                        "count": {"type": "integer", "nullable": True, "example": None},
+                        "count_is_estimate": {"type": "boolean", "example": False},
+                        "next": {"type": "string", "nullable": True, "example": "https://api.myevol.app/api/logs/?cursor=cD0yMDI1"},
+                        "previous": {"type": "string", "nullable": True, "example": None},
+                        "page_size": {"type": "integer", "example": 10},
+                    }
+                },
+                "results": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                },
+            },
+        }
+    )
+    def get_paginated_response(self, data):
+        return Response({
+            'success': True,
+            'meta': {
+                'count': self.count,
+                'count_is_estimate': self.count_is_estimate,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'page_size': self.page_size,
+            },
+            'results': data
+        })
+
+
+class MyEvolHybridPagination(MyEvolPagination):
+    """
+    Pagination par numéro de page (par défaut) ou par curseur.
+
+    Le mode curseur est choisi avec `?pagination=cursor` ; les liens `next`/`previous`
+    qu'il renvoie contiennent `cursor`, qui suffit ensuite à rester dans ce mode.
+    Les clients existants (`?page=N`) ne sont pas affectés.
+    """
+    cursor_pagination_class = MyEvolCursorPagination
+    mode_query_param = 'pagination'
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+def estimate_count(queryset):
+    """
+    Nombre de lignes estimé par le planificateur PostgreSQL (EXPLAIN), sans COUNT(*).
+
+    Returns:
+        int | None: None si la base n'est pas PostgreSQL
+    """
+    if connections[queryset.db].vendor != 'postgresql':
+        return None
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
@@ -5,6 +5,7 @@ from django.db.models import Count
 from collections import defaultdict
 
 from ..models.badge_model import Badge, BadgeTemplate
+from ..services.badge_rule_service import build_user_metrics
 
 User = get_user_model()
 
@@ -100,7 +101,8 @@ class BadgeTemplateWithProgressSerializer(BadgeTemplateSerializer):
         """
         user = self._get_user()
         if user and user.is_authenticated:
-            return obj.get_progress(user)
+            metrics, earned_names = self._get_snapshot(user)
+            return obj.get_progress(user, metrics=metrics, earned_names=earned_names)
         return {"percent": 0, "unlocked": False, "current": 0, "target": 0}
     
     def get_can_unlock(self, obj):
@@ -109,7 +111,8 @@ class BadgeTemplateWithProgressSerializer(BadgeTemplateSerializer):
         """
         user = self._get_user()
         if user and user.is_authenticated:
-            return obj.check_unlock(user)
+            metrics, _ = self._get_snapshot(user)
+            return obj.check_unlock(user, metrics=metrics)
         return False
     
     def get_is_unlocked(self, obj):
@@ -118,9 +121,22 @@ class BadgeTemplateWithProgressSerializer(BadgeTemplateSerializer):
         """
         user = self._get_user()
         if user and user.is_authenticated:
-            return user.badges.filter(name=obj.name).exists()
+            _, earned_names = self._get_snapshot(user)
+            return obj.name in earned_names
         return False
     
+    def _get_snapshot(self, user):
+        """
+        Instantané des métriques et noms des badges obtenus, calculés une seule fois
+        et partagés par tous les modèles sérialisés (context).
+        """
+        if "badge_snapshot" not in self.context:
+            self.context["badge_snapshot"] = (
+                build_user_metrics(user),
+                set(user.badges.values_list("name", flat=True)),
+            )
+        return self.context["badge_snapshot"]
+
     def _get_user(self):
         """
         Récupère l'utilisateur à partir du contexte.
@@ -157,7 +173,7 @@ class UserBadgeStatsSerializer(serializers.Serializer):
     
     def get_total_badges(self, user):
         """Nombre total de badges obtenus par l'utilisateur."""
-        return user.badges.count()
+        return user.badges_count
     
     def get_recent_badges(self, user):
         """Badges obtenus au cours des 7 derniers jours."""
@@ -171,7 +187,7 @@ class UserBadgeStatsSerializer(serializers.Serializer):
         total_templates = BadgeTemplate.objects.count()
         if total_templates == 0:
             return 0
-        return round((user.badges.count() / total_templates) * 100, 1)
+        return round((user.badges_count / total_templates) * 100, 1)
     
     def get_badges_by_category(self, user):
         """Badges groupés par catégorie/type."""
@@ -196,10 +212,11 @@ class UserBadgeStatsSerializer(serializers.Serializer):
         unlocked_names = user.badges.values_list('name', flat=True)
         available_templates = BadgeTemplate.objects.exclude(name__in=unlocked_names)
         
-        # On vérifie lesquels peuvent être débloqués
+        # On vérifie lesquels peuvent être débloqués (un seul instantané des métriques)
+        metrics = build_user_metrics(user)
         next_badges = []
         for template in available_templates:
-            if template.check_unlock(user):
+            if template.check_unlock(user, metrics=metrics):
                 next_badges.append(template)
         
         return BadgeTemplateWithProgressSerializer(
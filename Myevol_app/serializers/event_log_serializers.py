@@ -1,10 +1,10 @@
 from rest_framework import serializers
 from django.utils import timezone
-from django.db.models import Count
 from datetime import timedelta
 from django.contrib.auth import get_user_model
 
 from ..models.event_log_model import EventLog
+from ..services.event_analytics_service import get_event_statistics
 
 User = get_user_model()
 
@@ -134,6 +134,7 @@ class EventLogStatisticsSerializer(serializers.Serializer):
     Serializer pour produire des statistiques sur les événements enregistrés.
     
     Donne des infos sur le volume, la répartition et les tendances des événements.
+    Les compteurs sont lus dans les agrégats horaires / journaliers (voir `event_analytics_service`).
     """
     period_days = serializers.IntegerField(default=30)
     total_events = serializers.SerializerMethodField()
@@ -142,63 +143,36 @@ class EventLogStatisticsSerializer(serializers.Serializer):
     events_by_time = serializers.SerializerMethodField()
     most_recent = serializers.SerializerMethodField()
     
+    def _stats(self, obj):
+        """Statistiques agrégées (une seule lecture des compteurs par représentation)."""
+        key = ('event_statistics', obj.get('period_days', 30), getattr(obj.get('user'), 'pk', None))
+        if key not in self.context:
+            self.context[key] = get_event_statistics(obj.get('period_days', 30), user=obj.get('user'))
+        return self.context[key]
+
     def get_total_events(self, obj):
         """
         Retourne le nombre total d'événements sur la période demandée.
         """
-        user = obj.get('user')
-        period_days = obj.get('period_days', 30)
-        since = timezone.now() - timedelta(days=period_days)
-        query = EventLog.objects.filter(created_at__gte=since)
-
-        if user:
-            query = query.filter(user=user)
-
-        return query.count()
+        return self._stats(obj)['total_events']
 
     def get_events_by_action(self, obj):
         """
         Retourne la répartition des événements par action.
         """
-        user = obj.get('user')
-        period_days = obj.get('period_days', 30)
-        return EventLog.get_action_counts(days=period_days, user=user)
+        return self._stats(obj)['events_by_action']
 
     def get_events_by_severity(self, obj):
         """
         Retourne la répartition des événements par niveau de gravité.
         """
-        user = obj.get('user')
-        period_days = obj.get('period_days', 30)
-        since = timezone.now() - timedelta(days=period_days)
-        query = EventLog.objects.filter(created_at__gte=since)
-
-        if user:
-            query = query.filter(user=user)
-
-        aggregated = query.values('severity').annotate(total=Count('id'))
-        return {item['severity']: item['total'] for item in aggregated}
+        return self._stats(obj)['events_by_severity']
 
     def get_events_by_time(self, obj):
         """
         Retourne la répartition temporelle (24h, 7j, 30j).
         """
-        user = obj.get('user')
-        now = timezone.now()
-
-        last_day = now - timedelta(days=1)
-        last_week = now - timedelta(days=7)
-        last_month = now - timedelta(days=30)
-
-        query = EventLog.objects
-        if user:
-            query = query.filter(user=user)
-
-        return {
-            'last_24h': query.filter(created_at__gte=last_day).count(),
-            'last_7d': query.filter(created_at__gte=last_week).count(),
-            'last_30d': query.filter(created_at__gte=last_month).count()
-        }
+        return self._stats(obj)['events_by_time']
 
     def get_most_recent(self, obj):
         """
@@ -2,9 +2,9 @@ from rest_framework import serializers
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from datetime import timedelta
-from django.db.models import Avg, Count
 
 from ..models.journal_model import JournalEntry, JournalMedia
+from ..services.journal_analytics_service import get_journal_stats
 
 User = get_user_model()
 
@@ -109,6 +109,18 @@ class JournalEntrySerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class JournalEntrySearchResultSerializer(JournalEntrySerializer):
+    """
+    Résultat de recherche plein texte : l'entrée, son score de pertinence
+    et un extrait du contenu avec les termes trouvés entre <mark>.
+    """
+    rank = serializers.FloatField(source='search_rank', read_only=True)
+    highlight = serializers.CharField(source='search_highlight', read_only=True)
+
+    class Meta(JournalEntrySerializer.Meta):
+        fields = JournalEntrySerializer.Meta.fields + ['rank', 'highlight']
+
+
 class JournalEntryDetailSerializer(JournalEntrySerializer):
     """
     Serializer détaillé pour une entrée de journal.
@@ -179,28 +191,24 @@ class JournalEntryCreateSerializer(serializers.ModelSerializer):
 
 
 
-class JournalEntryCalendarSerializer(serializers.ModelSerializer):
+class JournalEntryCalendarSerializer(serializers.Serializer):
     """
     Serializer pour affichage des entrées sous forme de calendrier.
     
-    Fournit des métriques condensées (nombre, humeur, catégories).
+    Fournit des métriques condensées par jour (nombre, humeur, catégories),
+    agrégées en base par `journal_service.get_calendar`.
     """
-    day = serializers.SerializerMethodField()
+    day = serializers.DateField(read_only=True)
     count = serializers.IntegerField(read_only=True)
     mood_avg = serializers.FloatField(read_only=True)
-    categories = serializers.ListField(read_only=True)
-
-    class Meta:
-        model = JournalEntry
-        fields = ['day', 'count', 'mood_avg', 'categories']
-    
-    def get_day(self, obj):
-        """Retourne la date sans l'heure à partir de created_at."""
-        return obj.created_at.date()
+    categories = serializers.ListField(child=serializers.CharField(), read_only=True)
 
 class JournalStatsSerializer(serializers.Serializer):
     """
     Serializer pour générer des statistiques sur les entrées de journal d'un utilisateur.
+
+    Toutes les valeurs proviennent d'un unique calcul (deux requêtes, mis en cache par
+    utilisateur) : voir `journal_analytics_service.get_journal_stats`.
     """
     total_entries = serializers.SerializerMethodField()
     entries_per_category = serializers.SerializerMethodField()
@@ -208,111 +216,37 @@ class JournalStatsSerializer(serializers.Serializer):
     monthly_entries = serializers.SerializerMethodField()
     average_mood = serializers.SerializerMethodField()
     entries_streak = serializers.SerializerMethodField()
+
+    def _stats(self, user):
+        """Statistiques calculées une seule fois par utilisateur sérialisé."""
+        cache = self.context.setdefault('journal_stats', {})
+        if user.pk not in cache:
+            cache[user.pk] = get_journal_stats(user)
+        return cache[user.pk]
     
     def get_total_entries(self, user):
         """Retourne le nombre total d'entrées."""
-        return user.entries.count()
+        return self._stats(user)['total_entries']
     
     def get_entries_per_category(self, user):
         """Retourne la répartition des entrées par catégorie."""
-        categories = user.entries.values('category').annotate(
-            count=Count('id')
-        ).order_by('-count')
-        
-        return {cat['category']: cat['count'] for cat in categories}
+        return self._stats(user)['entries_per_category']
     
     def get_mood_distribution(self, user):
         """Retourne la distribution des notes d'humeur."""
-        moods = user.entries.values('mood').annotate(
-            count=Count('id')
-        ).order_by('mood')
-        
-        distribution = {str(i): 0 for i in range(1, 11)}
-        for mood in moods:
-            distribution[str(mood['mood'])] = mood['count']
-        
-        return distribution
+        return self._stats(user)['mood_distribution']
     
     def get_monthly_entries(self, user):
         """Retourne la distribution des entrées par mois sur 1 an."""
-        today = timezone.now().date()
-        start_date = today - timedelta(days=365)
-        
-        entries = user.entries.filter(
-            created_at__date__gte=start_date
-        ).extra({'month': "to_char(created_at, 'YYYY-MM')"}).values('month').annotate(
-            count=Count('id')
-        ).order_by('month')
-        
-        months = {}
-        for i in range(12):
-            month_date = today - timedelta(days=30 * i)
-            month_key = month_date.strftime('%Y-%m')
-            months[month_key] = 0
-        
-        for entry in entries:
-            months[entry['month']] = entry['count']
-        
-        return months
+        return self._stats(user)['monthly_entries']
     
     def get_average_mood(self, user):
         """Retourne l'humeur moyenne actuelle et son évolution."""
-        result = {'overall': 0, 'last_week': 0, 'last_month': 0, 'trend': 'stable'}
-        today = timezone.now().date()
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
-        two_months_ago = today - timedelta(days=60)
-        
-        overall = user.entries.aggregate(avg=Avg('mood'))
-        last_week = user.entries.filter(created_at__date__gte=week_ago).aggregate(avg=Avg('mood'))
-        last_month = user.entries.filter(created_at__date__gte=month_ago).aggregate(avg=Avg('mood'))
-        previous_month = user.entries.filter(
-            created_at__date__gte=two_months_ago,
-            created_at__date__lt=month_ago
-        ).aggregate(avg=Avg('mood'))
-        
-        result['overall'] = round(overall['avg'] or 0, 1)
-        result['last_week'] = round(last_week['avg'] or 0, 1)
-        result['last_month'] = round(last_month['avg'] or 0, 1)
-        
-        if previous_month['avg'] and last_month['avg']:
-            diff = last_month['avg'] - previous_month['avg']
-            if diff > 0.5:
-                result['trend'] = 'up'
-            elif diff < -0.5:
-                result['trend'] = 'down'
-        
-        return result
+        return self._stats(user)['average_mood']
     
-    # ✅ Correction dans get_entries_streak
     def get_entries_streak(self, user):
         """Retourne la série actuelle et maximale de jours avec au moins une entrée."""
-        today = timezone.now().date()
-        dates_with_entries = user.entries.values('created_at__date').distinct().order_by('created_at__date')
-        
-        if not dates_with_entries:
-            return {'current': 0, 'max': 0, 'dates': []}
-        
-        dates = [entry['created_at__date'] for entry in dates_with_entries]
-        
-        max_streak = 1
-        current_streak = 1
-        
-        for i in range(1, len(dates)):
-            if (dates[i] - dates[i-1]).days == 1:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 1
-        
-        current_active = dates[-1] in (today, today - timedelta(days=1))
-        
-        return {
-            'current': current_streak if current_active else 0,
-            'max': max_streak,
-            'current_active': current_active,
-            'last_entry_date': dates[-1].isoformat()
-        }
+        return self._stats(user)['entries_streak']
 
 
 class CategorySuggestionSerializer(serializers.Serializer):
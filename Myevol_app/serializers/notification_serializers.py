@@ -3,6 +3,7 @@ from django.utils import timezone
 from django.contrib.auth import get_user_model
 
 from ..models.notification_model import Notification
+from ..services.notification_service import get_notification_counts
 
 User = get_user_model()
 
@@ -114,31 +115,33 @@ class NotificationUpdateSerializer(serializers.ModelSerializer):
 class NotificationCountSerializer(serializers.Serializer):
     """
     Serializer pour compter les notifications par statut et type.
+
+    Toutes les valeurs proviennent d'une seule requête (agrégation conditionnelle) :
+    voir `notification_service.get_notification_counts`.
     """
     total = serializers.SerializerMethodField()
     unread = serializers.SerializerMethodField()
     today = serializers.SerializerMethodField()
     by_type = serializers.SerializerMethodField()
 
+    def _counts(self, user):
+        """Compteurs calculés une seule fois par utilisateur sérialisé."""
+        cache = self.context.setdefault('notification_counts', {})
+        if user.pk not in cache:
+            cache[user.pk] = get_notification_counts(user)
+        return cache[user.pk]
+
     def get_total(self, user):
-        return user.notifications.filter(archived=False).count()
+        return self._counts(user)['total']
 
     def get_unread(self, user):
-        return user.notifications.filter(is_read=False, archived=False).count()
+        return self._counts(user)['unread']
 
     def get_today(self, user):
-        today = timezone.now().date()
-        return user.notifications.filter(created_at__date=today, archived=False).count()
+        return self._counts(user)['today']
 
     def get_by_type(self, user):
-        result = {}
-        for notif_type, _ in Notification.NOTIF_TYPES:
-            notifications = user.notifications.filter(notif_type=notif_type, archived=False)
-            result[notif_type] = {
-                'total': notifications.count(),
-                'unread': notifications.filter(is_read=False).count()
-            }
-        return result
+        return self._counts(user)['by_type']
 
 
 class NotificationBulkActionSerializer(serializers.Serializer):
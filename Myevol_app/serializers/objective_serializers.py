@@ -5,6 +5,7 @@ from datetime import timedelta
 from django.db.models import Count
 
 from ..models.objective_model import Objective
+from ..services.objective_progress_service import annotate_progress
 
 User = get_user_model()
 
@@ -55,7 +56,10 @@ class ObjectiveSerializer(serializers.ModelSerializer):
         return obj.is_due_today()
     
     def get_entries_done(self, obj):
-        """Compte le nombre d'entrées correspondant à la catégorie de cet objectif."""
+        """
+        Nombre d'entrées correspondant à la catégorie de cet objectif (annotation
+        `entries_done_count` du queryset si présente, voir objective_progress_service).
+        """
         return obj.entries_done()
     
     def get_status(self, obj):
@@ -203,7 +207,7 @@ class ObjectiveStatsSerializer(serializers.Serializer):
     def get_recent_completions(self, user):
         """Liste des objectifs récemment complétés (7 derniers jours)."""
         last_week = timezone.now().date() - timedelta(days=7)
-        recent = user.objectives.filter(done=True, target_date__gte=last_week).order_by('-target_date')[:5]
+        recent = annotate_progress(user.objectives.filter(done=True, target_date__gte=last_week)).order_by('-target_date')[:5]
         return ObjectiveListSerializer(recent, many=True).data
 
 
@@ -218,8 +222,8 @@ class ObjectiveUpcomingSerializer(serializers.Serializer):
     this_month = serializers.SerializerMethodField()
 
     def get_queryset(self, user):
-        """Base queryset filtré sur l'utilisateur et non terminé."""
-        return Objective.objects.filter(user=user, done=False)
+        """Base queryset filtré sur l'utilisateur et non terminé, annoté de la progression."""
+        return annotate_progress(Objective.objects.filter(user=user, done=False))
 
     def get_today(self, user):
         """Objectifs dus aujourd'hui."""
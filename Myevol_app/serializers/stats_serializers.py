@@ -6,6 +6,7 @@ from collections import OrderedDict
 from django.contrib.auth import get_user_model
 
 from ..models.stats_model import DailyStat, WeeklyStat, MonthlyStat, AnnualStat
+from ..services import stats_read_service
 
 User = get_user_model()
 
@@ -147,7 +148,12 @@ class AnnualStatSerializer(serializers.ModelSerializer):
 
 
 class StatsOverviewSerializer(serializers.Serializer):
-    """Serializer pour afficher un résumé global des statistiques."""
+    """
+    Serializer pour afficher un résumé global des statistiques.
+
+    Lecture seule : les statistiques stockées sont servies via `stats_read_service`,
+    aucune ligne n'est créée ni mise à jour.
+    """
     daily = serializers.SerializerMethodField()
     weekly = serializers.SerializerMethodField()
     monthly = serializers.SerializerMethodField()
@@ -156,22 +162,22 @@ class StatsOverviewSerializer(serializers.Serializer):
 
     def get_daily(self, user):
         today = timezone.now().date()
-        stat = DailyStat.generate_for_user(user, today)
+        stat = stats_read_service.get_period_stat(user, "daily", today)
         return DailyStatSerializer(stat).data
 
     def get_weekly(self, user):
         today = timezone.now().date()
-        stat = WeeklyStat.generate_for_user(user, today)
+        stat = stats_read_service.get_period_stat(user, "weekly", today)
         return WeeklyStatSerializer(stat).data
 
     def get_monthly(self, user):
         today = timezone.now().date()
-        stat = MonthlyStat.generate_for_user(user, today)
+        stat = stats_read_service.get_period_stat(user, "monthly", today)
         return MonthlyStatSerializer(stat).data
 
     def get_annual(self, user):
         today = timezone.now().date()
-        stat = AnnualStat.generate_for_user(user, today)
+        stat = stats_read_service.get_period_stat(user, "annual", today)
         return AnnualStatSerializer(stat).data
 
     def get_trends(self, user):
@@ -228,7 +234,7 @@ class StatsOverviewSerializer(serializers.Serializer):
 
 
 class StatsCategoryAnalysisSerializer(serializers.Serializer):
-    """Serializer pour l'analyse des catégories."""
+    """Serializer pour l'analyse des catégories (lecture seule, voir `stats_read_service`)."""
     period = serializers.ChoiceField(choices=['week', 'month', 'year', 'all'], default='month')
 
     def to_representation(self, instance):
@@ -241,29 +247,23 @@ class StatsCategoryAnalysisSerializer(serializers.Serializer):
         today = timezone.now().date()
 
         if period == 'week':
-            stat = WeeklyStat.generate_for_user(user, today)
+            stat = stats_read_service.get_period_stat(user, "weekly", today)
             start_date = stat.week_start
         elif period == 'month':
-            stat = MonthlyStat.generate_for_user(user, today)
+            stat = stats_read_service.get_period_stat(user, "monthly", today)
             start_date = stat.month_start
         elif period == 'year':
-            stat = AnnualStat.generate_for_user(user, today)
+            stat = stats_read_service.get_period_stat(user, "annual", today)
             start_date = stat.year_start
         else:  # all
-            stats = AnnualStat.objects.filter(user=user)
-            if not stats.exists():
+            total_entries, categories = stats_read_service.get_all_time_categories(user)
+            if not total_entries:
                 return {
                     'title': "Analyse de toutes les entrées",
                     'categories': {},
                     'total_entries': 0,
                     'period': period
                 }
-            categories = {}
-            total_entries = 0
-            for stat in stats:
-                total_entries += stat.entries_count
-                for category, count in stat.categories.items():
-                    categories[category] = categories.get(category, 0) + count
             return {
                 'title': "Analyse de toutes les entrées",
                 'categories': OrderedDict(sorted({
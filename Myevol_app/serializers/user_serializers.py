@@ -5,6 +5,9 @@ from datetime import timedelta
 from collections import OrderedDict
 from django.db.models import Count
 
+from ..services.levels_services import get_user_progress
+from ..services.profile_service import compute_profile_metrics
+
 User = get_user_model()
 
 
@@ -60,7 +63,10 @@ class UserProfileSerializer(UserSerializer):
     Serializer pour le profil complet d'un utilisateur.
     
     Étend UserSerializer avec des statistiques supplémentaires.
+    Les compteurs sont calculés une seule fois par utilisateur, en une requête
+    (voir `profile_service.compute_profile_metrics`).
     """
+    total_entries = serializers.SerializerMethodField()
     mood_average = serializers.SerializerMethodField()
     stats_summary = serializers.SerializerMethodField()
     activity_summary = serializers.SerializerMethodField()
@@ -71,12 +77,32 @@ class UserProfileSerializer(UserSerializer):
             'mood_average', 'stats_summary', 'activity_summary',
             'badges_count'
         ]
+
+    def _metrics(self, obj):
+        """Compteurs du profil, calculés une fois par utilisateur sérialisé."""
+        cache = self.context.setdefault('profile_metrics', {})
+        if obj.pk not in cache:
+            cache[obj.pk] = compute_profile_metrics(obj)
+        return cache[obj.pk]
+
+    def get_total_entries(self, obj):
+        """Retourne le nombre total d'entrées de journal."""
+        return self._metrics(obj)['total_entries']
+
+    def get_level(self, obj):
+        """Retourne le niveau actuel de l'utilisateur."""
+        return get_user_progress(self._metrics(obj)['total_entries'])['level']
+
+    def get_level_progress(self, obj):
+        """Retourne la progression du niveau actuel en pourcentage."""
+        return get_user_progress(self._metrics(obj)['total_entries'])['progress']
     
     def get_mood_average(self, obj):
         """Retourne la moyenne d'humeur sur différentes périodes."""
-        mood_7d = obj.mood_average(days=7)
-        mood_30d = obj.mood_average(days=30)
-        mood_all = obj.mood_average(days=None)
+        metrics = self._metrics(obj)
+        mood_7d = metrics['mood_week']
+        mood_30d = metrics['mood_month']
+        mood_all = metrics['mood_all']
         
         return {
             'week': round(mood_7d, 1) if mood_7d is not None else None,
@@ -87,54 +113,42 @@ class UserProfileSerializer(UserSerializer):
     def get_stats_summary(self, obj):
         """Retourne un résumé des statistiques de l'utilisateur."""
         return {
-            'total_entries': obj.total_entries,
+            'total_entries': self._metrics(obj)['total_entries'],
             'current_streak': obj.current_streak(),
             'longest_streak': obj.longest_streak,
-            'level': obj.level(),
+            'level': self.get_level(obj),
             'xp': obj.xp
         }
     
     def get_activity_summary(self, obj):
         """Retourne un résumé de l'activité récente de l'utilisateur."""
-        today = timezone.now().date()
-        entries_today = obj.entries_today()
-        
-        # Calculer les entrées des 7 derniers jours
-        last_week = today - timedelta(days=7)
-        entries_last_week = obj.entries.filter(
-            created_at__date__gte=last_week
-        ).count()
-        
-        # Calculer les entrées des 30 derniers jours
-        last_month = today - timedelta(days=30)
-        entries_last_month = obj.entries.filter(
-            created_at__date__gte=last_month
-        ).count()
+        metrics = self._metrics(obj)
+        entries_today = metrics['entries_today']
         
         # Déterminer si l'utilisateur est actif
         is_active = entries_today > 0
         
         return {
             'entries_today': entries_today,
-            'entries_last_week': entries_last_week,
-            'entries_last_month': entries_last_month,
+            'entries_last_week': metrics['entries_last_week'],
+            'entries_last_month': metrics['entries_last_month'],
             'is_active_today': is_active,
             'days_since_last_entry': 0 if is_active else self._days_since_last_entry(obj)
         }
     
     def get_badges_count(self, obj):
         """Retourne le nombre de badges de l'utilisateur."""
-        return obj.badges.count()
+        return self._metrics(obj)['badges_count']
     
     def _days_since_last_entry(self, obj):
         """Calcule le nombre de jours depuis la dernière entrée."""
         today = timezone.now().date()
-        last_entry = obj.entries.order_by('-created_at').first()
+        last_entry_at = self._metrics(obj)['last_entry_at']
         
-        if not last_entry:
+        if not last_entry_at:
             return None
             
-        last_date = last_entry.created_at.date()
+        last_date = last_entry_at.date()
         return (today - last_date).days
 
 
@@ -0,0 +1,111 @@
+# services/badge_rule_service.py
+
+import logging
+from collections import namedtuple
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Avg, Count, Exists, OuterRef, Q
+from django.utils.timezone import localdate, now
+
+from .levels_services import get_user_level
+
+logger = logging.getLogger(__name__)
+
+# Une règle déclare les métriques dont elle dépend et le prédicat évalué sur l'instantané.
+BadgeRule = namedtuple("BadgeRule", ["metrics", "check"])
+
+# Métriques modifiées par l'écriture d'une entrée de journal
+ENTRY_METRICS = frozenset({"total_entries", "mood_average_7d", "entries_today", "current_streak"})
+# Métriques modifiées par la création / complétion d'un objectif
+OBJECTIVE_METRICS = frozenset({"has_pending_objectives"})
+
+BADGE_RULES = {
+    "Première entrée": BadgeRule({"total_entries"}, lambda m: m["total_entries"] >= 1),
+    "Régulier": BadgeRule({"current_streak"}, lambda m: m["current_streak"] >= 5),
+    "Discipline": BadgeRule({"current_streak"}, lambda m: m["current_streak"] >= 10),
+    "Résilience": BadgeRule({"current_streak"}, lambda m: m["current_streak"] >= 15),
+    "Légende du Journal": BadgeRule({"current_streak"}, lambda m: m["current_streak"] >= 30),
+    "Ambassadeur d'humeur": BadgeRule({"mood_average_7d"}, lambda m: (m["mood_average_7d"] or 0) >= 9),
+    "Productivité": BadgeRule({"entries_today"}, lambda m: m["entries_today"] >= 3),
+    "Objectif rempli !": BadgeRule({"has_pending_objectives"}, lambda m: not m["has_pending_objectives"]),
+    "Persévérance": BadgeRule({"total_entries"}, lambda m: m["total_entries"] >= 100),
+}
+
+# Métriques utilisées par au moins une règle (badges "Niveau N" compris)
+RULE_METRICS = frozenset({"total_entries"}).union(*(rule.metrics for rule in BADGE_RULES.values()))
+
+
+def get_rule(template):
+    """
+    Retourne la règle associée à un modèle de badge, ou None si aucune règle ne s'applique.
+
+    Les modèles "Niveau N" reçoivent une règle basée sur le nombre total d'entrées.
+    """
+    rule = BADGE_RULES.get(template.name)
+    if rule is not None:
+        return rule
+
+    level_number = template.extract_level_number()
+    if level_number:
+        return BadgeRule({"total_entries"}, lambda m: get_user_level(m["total_entries"]) >= level_number)
+    return None
+
+
+def is_affected(template, changed_metrics=None):
+    """
+    Indique si la règle d'un modèle doit être réévaluée après un changement de métriques.
+
+    Args:
+        template (BadgeTemplate): Modèle de badge
+        changed_metrics (iterable, optional): Métriques modifiées. None = toutes.
+    """
+    if changed_metrics is None:
+        return True
+    rule = get_rule(template)
+    return rule is not None and not rule.metrics.isdisjoint(changed_metrics)
+
+
+def evaluate(template, metrics):
+    """
+    Évalue en mémoire la règle d'un modèle de badge sur un instantané de métriques.
+
+    Returns:
+        bool: True si le badge peut être débloqué
+    """
+    rule = get_rule(template)
+    return bool(rule and rule.check(metrics))
+
+
+def build_user_metrics(user):
+    """
+    Construit l'instantané des métriques d'un utilisateur utilisées par les règles de badges.
+
+    Une seule requête agrégée (entrées + existence d'objectifs en cours) ; la série
+    actuelle est lue dans le bitmap des jours actifs, sans requête.
+
+    Returns:
+        dict: total_entries, mood_average_7d, entries_today, current_streak, has_pending_objectives
+    """
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Objective = apps.get_model("Myevol_app", "Objective")
+
+    row = (
+        User.objects.filter(pk=user.pk)
+        .annotate(
+            total_entries=Count("entries"),
+            mood_average_7d=Avg("entries__mood", filter=Q(entries__created_at__gte=now() - timedelta(days=7))),
+            entries_today=Count("entries", filter=Q(entries__created_at__date=localdate())),
+            has_pending_objectives=Exists(Objective.objects.filter(user=OuterRef("pk"), done=False)),
+        )
+        .values("total_entries", "mood_average_7d", "entries_today", "has_pending_objectives")
+        .first()
+    ) or {"total_entries": 0, "mood_average_7d": None, "entries_today": 0, "has_pending_objectives": False}
+
+    if row["mood_average_7d"] is not None:
+        row["mood_average_7d"] = round(row["mood_average_7d"], 1)
+    row["current_streak"] = user.current_streak()
+
+    logger.debug(f"[BADGE] Instantané des métriques pour {user.username} : {row}")
+    return row
@@ -3,18 +3,26 @@
 import logging
 from typing import List, Optional
 from ..models.badge_model import Badge, BadgeTemplate
-from ..models.event_log_model import EventLog
+from .badge_rule_service import RULE_METRICS, build_user_metrics, is_affected
 
 logger = logging.getLogger(__name__)
 
-def update_user_badges(user, *, log_events: bool = True, return_new_badges: bool = False) -> Optional[List[Badge]]:
+def update_user_badges(user, *, log_events: bool = True, return_new_badges: bool = False,
+                       changed_metrics=None) -> Optional[List[Badge]]:
     """
     Vérifie tous les BadgeTemplates disponibles et attribue les badges éligibles à l’utilisateur.
 
+    Les règles sont évaluées en mémoire sur un unique instantané des métriques de
+    l'utilisateur (voir `badge_rule_service`).
+
     Args:
         user (User): L'utilisateur pour lequel vérifier et attribuer les badges.
-        log_events (bool, optional): Si True, un EventLog est créé pour chaque badge attribué. (Défaut: True)
+        log_events (bool, optional): Si True, journalise l'absence de nouveau badge. (Défaut: True)
+            L'EventLog 'attribution_badge' de chaque badge est écrit une seule fois, par le
+            signal post_save de Badge (`event_log_signals`).
         return_new_badges (bool, optional): Si True, retourne la liste des nouveaux badges créés. (Défaut: False)
+        changed_metrics (iterable, optional): Métriques modifiées depuis la dernière vérification ;
+            seuls les modèles dont la règle en dépend sont réévalués. None = tous les modèles.
 
     Returns:
         Optional[List[Badge]]: Liste des badges nouvellement créés si return_new_badges est True.
@@ -23,35 +31,33 @@ def update_user_badges(user, *, log_events: bool = True, return_new_badges: bool
     Comportement :
         - Récupère les badges déjà obtenus par l'utilisateur.
         - Parcourt tous les BadgeTemplates :
-            - Ignore ceux déjà obtenus.
-            - Vérifie si les conditions d'obtention sont remplies.
+            - Ignore ceux déjà obtenus ou non concernés par les métriques modifiées.
+            - Vérifie si les conditions d'obtention sont remplies (instantané calculé une fois).
             - Crée un nouveau Badge si éligible.
-            - Logue l'événement et une entrée dans EventLog si demandé.
+            - Logue l'attribution (l'EventLog est écrit par le signal post_save de Badge).
         - En cas d'erreur à la création d'un badge, retourne une liste vide immédiatement.
         - Si aucun nouveau badge n'est créé, logue une info.
 
     Exemple d'usage :
         >>> update_user_badges(user, log_events=True, return_new_badges=True)
     """
+    if changed_metrics is not None and RULE_METRICS.isdisjoint(changed_metrics):
+        return [] if return_new_badges else None  # Aucune règle ne dépend de ces métriques
+
     existing_badge_names = set(user.badges.values_list("name", flat=True))
     new_badges = []
 
-    for template in BadgeTemplate.objects.all():
-        if template.name in existing_badge_names:
-            continue  # L'utilisateur a déjà ce badge
+    candidates = [
+        template for template in BadgeTemplate.objects.all()
+        if template.name not in existing_badge_names and is_affected(template, changed_metrics)
+    ]
+    metrics = build_user_metrics(user) if candidates else None
 
-        if template.check_unlock(user):
+    for template in candidates:
+        if template.check_unlock(user, metrics=metrics):
             try:
                 badge = __create_badge(user, template)
                 new_badges.append(badge)
-
-                if log_events:
-                    EventLog.objects.create(
-                        user=user,
-                        action="attribution_auto_badge",
-                        description=f"Badge automatique '{template.name}' attribué à {user.username}"
-                    )
-
                 logger.info(f"[BADGE] ✅ {user.username} a débloqué : {template.name}")
 
             except Exception as e:
@@ -66,7 +72,42 @@ def update_user_badges(user, *, log_events: bool = True, return_new_badges: bool
 
     return new_badges if return_new_badges else None
 
-    
+
+def get_badges_progress(user, templates=None) -> List[dict]:
+    """
+    Calcule la progression de l'utilisateur vers tous les modèles de badges.
+
+    Le coût est constant quel que soit le nombre de modèles : un instantané des
+    métriques, une lecture des noms de badges obtenus et la liste des modèles.
+
+    Args:
+        user (User): Utilisateur concerné
+        templates (iterable, optional): Modèles à évaluer. Par défaut, tous (triés par nom).
+
+    Returns:
+        List[dict]: Pour chaque modèle, ses informations et sa progression
+            (`percent`, `unlocked`, `current`, `target`).
+    """
+    if templates is None:
+        templates = BadgeTemplate.objects.order_by("name")
+
+    metrics = build_user_metrics(user)
+    earned_names = set(user.badges.values_list("name", flat=True))
+
+    return [
+        {
+            "id": template.id,
+            "name": template.name,
+            "description": template.description,
+            "icon": template.icon,
+            "level": template.level,
+            "color_theme": template.color_theme,
+            "level_number": template.extract_level_number(),
+            "progress": template.get_progress(user, metrics=metrics, earned_names=earned_names),
+        }
+        for template in templates
+    ]
+
 
 
 
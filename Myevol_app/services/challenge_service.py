@@ -3,7 +3,10 @@
 # services/challenge_service.py
 
 import logging
-from ..models import ChallengeProgress, Challenge, Notification
+from ..models import ChallengeProgress, Challenge, JournalEntry, Notification
+from .badge_service import update_user_badges
+from .event_log_service import log_events
+from django.db.models import Count, Q
 from django.utils.timezone import now
 
 logger = logging.getLogger(__name__)
@@ -35,31 +38,110 @@ def update_challenge_progress(progress_instance):
 
         logger.info(f"[CHALLENGE] {user.username} a complété le défi '{challenge.title}'")
 
+def count_entries_per_challenge(user, challenges):
+    """
+    Compte les entrées de l'utilisateur dans la fenêtre de chaque défi, en une seule requête.
+
+    Chaque défi devient un `COUNT(... FILTER ...)` d'une même agrégation conditionnelle.
+
+    Args:
+        user (User): Utilisateur concerné
+        challenges (list[Challenge]): Défis à évaluer
+
+    Returns:
+        dict: {challenge_id: nombre d'entrées dans la période du défi}
+    """
+    if not challenges:
+        return {}
+
+    aggregates = {
+        f"challenge_{challenge.pk}": Count(
+            "id", filter=Q(created_at__date__range=(challenge.start_date, challenge.end_date))
+        )
+        for challenge in challenges
+    }
+    counts = JournalEntry.objects.filter(user=user).aggregate(**aggregates)
+    return {challenge.pk: counts[f"challenge_{challenge.pk}"] or 0 for challenge in challenges}
+
+
 def check_user_challenges(user):
     """
     Vérifie tous les défis actifs de l'utilisateur et met à jour sa progression.
     Cette fonction peut être appelée régulièrement pour vérifier l'état de tous les défis de l'utilisateur.
 
+    Le coût ne dépend pas du nombre de défis actifs :
+    - une agrégation conditionnelle compte les entrées de toutes les fenêtres de défis ;
+    - une lecture des progressions existantes ;
+    - un `bulk_create` (upsert) des progressions créées ou complétées ;
+    - un `bulk_create` des notifications de complétion, un des événements "defi_termine",
+      puis une seule vérification des badges.
+
+    L'upsert contourne `ChallengeProgress.save()` et son signal post_save : leurs effets
+    (journal d'événements, badges) sont appliqués ici, une fois pour tout le lot.
+
     Args:
         user (User): Utilisateur dont les défis doivent être vérifiés
+
+    Returns:
+        list[Challenge]: Défis complétés lors de cet appel
     """
     today = now().date()
 
     # Récupère tous les défis actifs
-    active_challenges = Challenge.objects.filter(start_date__lte=today, end_date__gte=today)
+    active_challenges = list(Challenge.objects.filter(start_date__lte=today, end_date__gte=today))
+    if not active_challenges:
+        return []
 
+    counts = count_entries_per_challenge(user, active_challenges)
+    existing = dict(
+        ChallengeProgress.objects.filter(user=user, challenge__in=active_challenges)
+        .values_list("challenge_id", "completed")
+    )
+
+    timestamp = now()
+    rows, newly_completed = [], []
     for challenge in active_challenges:
-        # Récupère ou crée une instance de progression pour chaque défi
-        progress, created = ChallengeProgress.objects.get_or_create(user=user, challenge=challenge)
+        if existing.get(challenge.pk):
+            continue  # Déjà complété
+        done = counts[challenge.pk] >= challenge.target_entries
+        if done:
+            newly_completed.append(challenge)
+        elif challenge.pk in existing:
+            continue  # Progression inchangée
+        rows.append(ChallengeProgress(
+            user=user,
+            challenge=challenge,
+            completed=done,
+            completed_at=timestamp if done else None,
+        ))
+
+    if rows:
+        ChallengeProgress.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["user", "challenge"],
+            update_fields=["completed", "completed_at"],
+        )
+        logger.info(f"[CHALLENGE] {len(rows)} progression(s) enregistrée(s) pour {user.username}")
 
-        # Si c'est une nouvelle progression, on vérifie si l'utilisateur a déjà atteint l'objectif
-        if created:
-            logger.info(f"[CHALLENGE] Progression créée pour {user.username} sur le défi '{challenge.title}'")
-        else:
-            logger.info(f"[CHALLENGE] Progression mise à jour pour {user.username} sur le défi '{challenge.title}'")
+    if newly_completed:
+        Notification.objects.bulk_create([
+            Notification(
+                user=user,
+                message=f"🎯 Félicitations ! Vous avez complété le défi : {challenge.title}",
+                notif_type="objectif",
+            )
+            for challenge in newly_completed
+        ])
+        log_events("defi_termine", [
+            (f"{user.username} a complété le défi '{challenge.title}'", user, {"challenge_id": challenge.id})
+            for challenge in newly_completed
+        ])
+        for challenge in newly_completed:
+            logger.info(f"[CHALLENGE] {user.username} a complété le défi '{challenge.title}'")
+        update_user_badges(user)
 
-        # Met à jour la progression de l'utilisateur
-        update_challenge_progress(progress)
+    return newly_completed
 
 def check_challenges(user):
     """
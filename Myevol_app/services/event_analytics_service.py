@@ -0,0 +1,302 @@
+# services/event_analytics_service.py
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils.timezone import localtime, now
+
+from ..models.event_log_model import EventLog, EventLogBucket, EventLogRollupState
+from .purge_service import delete_in_batches
+
+logger = logging.getLogger(__name__)
+
+# Statistiques des événements servies depuis des compteurs agrégés :
+# - `rollup_events` (tâche horaire) agrège les événements bruts des heures révolues en
+#   tranches horaires, puis les tranches horaires des jours révolus en tranches journalières ;
+# - les événements bruts sont ensuite purgés par lots au-delà de la fenêtre de rétention,
+#   les tranches horaires au-delà de la leur ; les tranches journalières sont conservées.
+#
+# Une fenêtre de statistiques est lue dans les tranches journalières (au-delà de la rétention
+# horaire), horaires, puis dans les événements bruts non encore agrégés. La précision est
+# donc l'heure (ou le jour pour les fenêtres anciennes), sans jamais parcourir la table brute.
+
+ROLLUP_LOCK_KEY = "event_log_rollup_lock"
+
+# Délai avant d'agréger une heure révolue : laisse au tampon d'écriture
+# (`event_log_service`) le temps d'écrire les derniers événements de l'heure.
+ROLLUP_GRACE = timedelta(minutes=5)
+
+# Nombre maximal de jours d'événements bruts agrégés par requête
+ROLLUP_CHUNK_DAYS = 1
+
+STATISTICS_WINDOWS = {
+    "last_24h": timedelta(days=1),
+    "last_7d": timedelta(days=7),
+    "last_30d": timedelta(days=30),
+}
+
+
+def raw_retention_days():
+    """Durée de conservation (jours) des événements bruts."""
+    return getattr(settings, "MYEVOL_EVENT_LOG_RETENTION_DAYS", 90)
+
+
+def hourly_retention_days():
+    """Durée de conservation (jours) des tranches horaires."""
+    return getattr(settings, "MYEVOL_EVENT_LOG_HOURLY_RETENTION_DAYS", 7)
+
+
+def purge_chunk_size():
+    return getattr(settings, "MYEVOL_EVENT_LOG_PURGE_CHUNK", 5000)
+
+
+def _hour_floor(value):
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _day_floor(value):
+    return localtime(value).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def get_watermarks():
+    """
+    Retourne (fin de la dernière heure agrégée, fin du dernier jour agrégé), en une requête.
+    Chaque valeur vaut None tant que rien n'a été agrégé à cette granularité.
+
+    Les marques sont lues dans l'état persistant de l'agrégation ; elles ne sont déduites
+    des tranches existantes qu'en l'absence d'état (agrégations antérieures à celui-ci).
+    """
+    state = EventLogRollupState.objects.filter(pk=1).values_list("hour_mark", "day_mark").first()
+    if state is not None:
+        return state
+
+    row = EventLogBucket.objects.aggregate(
+        last_hour=Max("bucket_start", filter=Q(granularity=EventLogBucket.HOUR)),
+        last_day=Max("bucket_start", filter=Q(granularity=EventLogBucket.DAY)),
+    )
+    hour_mark = row["last_hour"] + timedelta(hours=1) if row["last_hour"] else None
+    day_mark = _day_floor(row["last_day"] + timedelta(days=1, hours=12)) if row["last_day"] else None
+    return hour_mark, day_mark
+
+
+def save_watermarks(hour_mark, day_mark):
+    """Enregistre les marques de l'agrégation (ligne unique)."""
+    EventLogRollupState.objects.update_or_create(pk=1, defaults={"hour_mark": hour_mark, "day_mark": day_mark})
+
+
+def _rollup_hours(start, end):
+    """Agrège les événements bruts de [start, end) en tranches horaires. Retourne le nombre de tranches."""
+    created = 0
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + timedelta(days=ROLLUP_CHUNK_DAYS), end)
+        rows = (
+            EventLog.objects.filter(created_at__gte=chunk_start, created_at__lt=chunk_end)
+            .annotate(bucket=TruncHour("created_at"))
+            .values("bucket", "action", "severity", "user_id")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        buckets = [
+            EventLogBucket(
+                granularity=EventLogBucket.HOUR, bucket_start=row["bucket"], action=row["action"],
+                severity=row["severity"], user_id=row["user_id"], count=row["total"],
+            )
+            for row in rows
+        ]
+        EventLogBucket.objects.bulk_create(buckets, batch_size=1000)
+        created += len(buckets)
+        chunk_start = chunk_end
+    return created
+
+
+def _rollup_days(start, end):
+    """Agrège les tranches horaires de [start, end) en tranches journalières."""
+    rows = (
+        EventLogBucket.objects.filter(
+            granularity=EventLogBucket.HOUR, bucket_start__gte=start, bucket_start__lt=end
+        )
+        .annotate(day=TruncDay("bucket_start"))
+        .values("day", "action", "severity", "user_id")
+        .annotate(total=Sum("count"))
+        .order_by()
+    )
+    buckets = [
+        EventLogBucket(
+            granularity=EventLogBucket.DAY, bucket_start=row["day"], action=row["action"],
+            severity=row["severity"], user_id=row["user_id"], count=row["total"],
+        )
+        for row in rows
+    ]
+    EventLogBucket.objects.bulk_create(buckets, batch_size=1000)
+    return len(buckets)
+
+
+def purge_in_chunks(queryset, chunk_size=None):
+    """
+    Supprime les lignes d'un queryset par lots de `chunk_size` (voir `purge_service`).
+
+    Returns:
+        int: Nombre de lignes supprimées
+    """
+    deleted, _, _ = delete_in_batches(queryset, size=chunk_size or purge_chunk_size())
+    return deleted
+
+
+def rollup_events(reference=None):
+    """
+    Agrège les heures et les jours révolus, puis applique les rétentions.
+
+    Returns:
+        dict: hourly_buckets, daily_buckets, purged_events, purged_buckets
+              (None si une agrégation est déjà en cours)
+    """
+    if not cache.add(ROLLUP_LOCK_KEY, True, timeout=3600):
+        logger.info("[EVENT LOG] Agrégation déjà en cours, ignorée.")
+        return None
+
+    try:
+        current = reference or now()
+        closed_until = _hour_floor(current - ROLLUP_GRACE)
+        hour_mark, day_mark = get_watermarks()
+
+        if hour_mark is None:
+            first_event = EventLog.objects.aggregate(first=Min("created_at"))["first"]
+            hour_mark = _hour_floor(first_event) if first_event else closed_until
+        hourly = _rollup_hours(hour_mark, closed_until) if hour_mark < closed_until else 0
+        hour_mark = max(hour_mark, closed_until)
+
+        if day_mark is None:
+            first_bucket = EventLogBucket.objects.filter(granularity=EventLogBucket.HOUR).aggregate(
+                first=Min("bucket_start")
+            )["first"]
+            day_mark = _day_floor(first_bucket) if first_bucket else _day_floor(hour_mark)
+        days_until = _day_floor(hour_mark)
+        daily = _rollup_days(day_mark, days_until) if day_mark < days_until else 0
+        day_mark = max(day_mark, days_until)
+        save_watermarks(hour_mark, day_mark)
+
+        # On ne purge que ce qui est déjà agrégé
+        raw_cutoff = min(current - timedelta(days=raw_retention_days()), hour_mark)
+        hourly_cutoff = min(current - timedelta(days=hourly_retention_days()), day_mark)
+        purged_events = purge_in_chunks(EventLog.objects.filter(created_at__lt=raw_cutoff))
+        purged_buckets = purge_in_chunks(
+            EventLogBucket.objects.filter(granularity=EventLogBucket.HOUR, bucket_start__lt=hourly_cutoff)
+        )
+    finally:
+        cache.delete(ROLLUP_LOCK_KEY)
+
+    logger.info(
+        f"[EVENT LOG] Agrégation : {hourly} tranche(s) horaire(s), {daily} journalière(s), "
+        f"{purged_events} événement(s) et {purged_buckets} tranche(s) purgé(s)"
+    )
+    return {
+        "hourly_buckets": hourly,
+        "daily_buckets": daily,
+        "purged_events": purged_events,
+        "purged_buckets": purged_buckets,
+    }
+
+
+def get_event_statistics(period_days=30, user=None):
+    """
+    Statistiques des événements sur `period_days` jours et sur les fenêtres 24h / 7j / 30j,
+    lues dans les tranches agrégées et dans les événements bruts non encore agrégés.
+
+    Args:
+        period_days (int): Durée de la période principale
+        user (User, optional): Restreint aux événements de l'utilisateur (tous sinon)
+
+    Returns:
+        dict: total_events, events_by_action, events_by_severity, events_by_time
+    """
+    current = now()
+    windows = {"period": current - timedelta(days=period_days)}
+    windows.update({name: current - delta for name, delta in STATISTICS_WINDOWS.items()})
+    hourly_available_since = current - timedelta(days=hourly_retention_days())
+    hour_mark, day_mark = get_watermarks()
+
+    # Borne inférieure de chaque fenêtre et source des heures anciennes
+    bounds = {}
+    for name, since in windows.items():
+        uses_days = since < hourly_available_since and day_mark is not None
+        bounds[name] = {
+            "uses_days": uses_days,
+            "day_since": _day_floor(since),
+            "hour_since": day_mark if uses_days else _hour_floor(since),
+        }
+
+    buckets = EventLogBucket.objects.all()
+    raw = EventLog.objects.all()
+    if user is not None:
+        buckets = buckets.filter(user=user)
+        raw = raw.filter(user=user)
+
+    rows = []  # (granularité, début, action, gravité, nombre)
+    day_windows = [b for b in bounds.values() if b["uses_days"]]
+    if day_windows:
+        day_rows = (
+            buckets.filter(
+                granularity=EventLogBucket.DAY,
+                bucket_start__gte=min(b["day_since"] for b in day_windows),
+                bucket_start__lt=day_mark,
+            )
+            .values_list("bucket_start", "action", "severity")
+            .annotate(total=Sum("count"))
+            .order_by()
+        )
+        rows += [(EventLogBucket.DAY, *row) for row in day_rows]
+
+    if hour_mark is not None:
+        hour_rows = (
+            buckets.filter(
+                granularity=EventLogBucket.HOUR,
+                bucket_start__gte=min(b["hour_since"] for b in bounds.values()),
+                bucket_start__lt=hour_mark,
+            )
+            .values_list("bucket_start", "action", "severity")
+            .annotate(total=Sum("count"))
+            .order_by()
+        )
+        rows += [(EventLogBucket.HOUR, *row) for row in hour_rows]
+
+    # Sans heure agrégée, les jours agrégés couvrent déjà tout ce qui précède `day_mark`
+    raw_since = hour_mark or day_mark or min(windows.values())
+    raw_rows = (
+        raw.filter(created_at__gte=raw_since)
+        .annotate(bucket=TruncHour("created_at"))
+        .values_list("bucket", "action", "severity")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    rows += [(None, *row) for row in raw_rows]
+
+    totals = defaultdict(int)
+    by_action = defaultdict(int)
+    by_severity = defaultdict(int)
+    for granularity, start, action, severity, count in rows:
+        for name, bound in bounds.items():
+            if granularity == EventLogBucket.DAY:
+                included = bound["uses_days"] and start >= bound["day_since"]
+            elif granularity == EventLogBucket.HOUR:
+                included = start >= bound["hour_since"]
+            else:
+                included = start >= _hour_floor(windows[name])
+            if not included:
+                continue
+            totals[name] += count
+            if name == "period":
+                by_action[action] += count
+                by_severity[severity] += count
+
+    return {
+        "total_events": totals["period"],
+        "events_by_action": dict(by_action),
+        "events_by_severity": dict(by_severity),
+        "events_by_time": {name: totals[name] for name in STATISTICS_WINDOWS},
+    }
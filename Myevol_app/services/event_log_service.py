@@ -1,15 +1,172 @@
 # services/event_log_service.py
 
+import atexit
+import threading
+import time
 from datetime import timedelta
 import logging
+from django.conf import settings
+from django.db import connection, transaction
 from django.utils.timezone import now
-from ..models import EventLog
+from ..models.event_log_model import EventLog
 
 logger = logging.getLogger(__name__)
 
+# Les événements d'audit ne sont pas écrits sur le chemin critique des requêtes :
+# `log_event` les ajoute à un tampon en mémoire (par processus), vidé par `bulk_create`
+# dès que `MYEVOL_EVENT_LOG_BATCH_SIZE` événements sont en attente, ou au plus tard
+# `MYEVOL_EVENT_LOG_FLUSH_INTERVAL` secondes après le premier. Le tampon est aussi vidé à
+# l'arrêt du processus (atexit) et du worker Celery (voir `signals/event_log_signals.py`).
+#
+# Au-delà de `MYEVOL_EVENT_LOG_MAX_BUFFER` événements en attente, les plus anciens sont
+# abandonnés : le tampon ne doit jamais faire grossir la mémoire sans limite.
+# En mode synchrone (`MYEVOL_EVENT_LOG_SYNC`, tests), chaque événement est écrit immédiatement.
+
+
+def event_log_is_sync():
+    return getattr(settings, "MYEVOL_EVENT_LOG_SYNC", False)
+
+
+class EventLogBuffer:
+    """Tampon d'événements partagé par les threads d'un processus."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = []
+        self._first_at = None
+        self._timer = None
+        self.counters = {"buffered": 0, "flushed": 0, "overflow": 0, "dropped": 0}
+
+    @property
+    def batch_size(self):
+        return getattr(settings, "MYEVOL_EVENT_LOG_BATCH_SIZE", 100)
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, "MYEVOL_EVENT_LOG_FLUSH_INTERVAL", 5)
+
+    @property
+    def max_buffer(self):
+        return getattr(settings, "MYEVOL_EVENT_LOG_MAX_BUFFER", 10000)
+
+    def __len__(self):
+        return len(self._events)
+
+    def append(self, event):
+        """Ajoute un événement (EventLog non enregistré) et déclenche un vidage si un seuil est atteint."""
+        with self._lock:
+            if len(self._events) >= self.max_buffer:
+                self._events.pop(0)
+                self.counters["overflow"] += 1
+                self.counters["dropped"] += 1
+            self._events.append(event)
+            self.counters["buffered"] += 1
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+                self._start_timer()
+            due = (
+                len(self._events) >= self.batch_size
+                or time.monotonic() - self._first_at >= self.flush_interval
+            )
+
+        if due:
+            if connection.in_atomic_block:
+                # Ne pas lier l'écriture des événements en attente au sort de la transaction en cours
+                transaction.on_commit(self.flush)
+            else:
+                self.flush()
+
+    def _start_timer(self):
+        if self.flush_interval <= 0:
+            return
+        self._timer = threading.Timer(self.flush_interval, self._flush_from_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            connection.close()
+
+    def _take(self):
+        with self._lock:
+            events, self._events = self._events, []
+            self._first_at = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return events
+
+    def flush(self):
+        """
+        Écrit tous les événements en attente par lots.
+
+        Returns:
+            int: Nombre d'événements écrits
+        """
+        events = self._take()
+        if not events:
+            return 0
+
+        written = 0
+        for start in range(0, len(events), self.batch_size):
+            written += self._write(events[start:start + self.batch_size])
+        with self._lock:
+            self.counters["flushed"] += written
+        logger.debug(f"[EVENT LOG] {written} événement(s) écrit(s) en lot")
+        return written
+
+    def _write(self, batch):
+        # Les événements d'un utilisateur supprimé entre-temps sont écartés : la contrainte
+        # de clé étrangère (différée) ferait échouer la transaction entière.
+        from django.contrib.auth import get_user_model
+
+        user_ids = {event.user_id for event in batch if event.user_id is not None}
+        existing = set(get_user_model().objects.filter(pk__in=user_ids).values_list("pk", flat=True))
+        kept = [event for event in batch if event.user_id is None or event.user_id in existing]
+
+        try:
+            EventLog.objects.bulk_create(kept)
+        except Exception as e:
+            logger.error(f"[EVENT LOG] ❌ Lot de {len(kept)} événement(s) perdu : {e}")
+            kept = []
+
+        dropped = len(batch) - len(kept)
+        if dropped:
+            with self._lock:
+                self.counters["dropped"] += dropped
+            logger.warning(f"[EVENT LOG] {dropped} événement(s) abandonné(s) lors de l'écriture.")
+        return len(kept)
+
+    def get_stats(self):
+        """Compteurs du tampon : buffered, flushed, overflow, dropped et pending."""
+        with self._lock:
+            return {**self.counters, "pending": len(self._events)}
+
+    def reset_stats(self):
+        with self._lock:
+            self.counters = {key: 0 for key in self.counters}
+
+
+event_buffer = EventLogBuffer()
+atexit.register(event_buffer.flush)
+
+
+def flush_events():
+    """Vide le tampon d'événements (arrêt du worker, tests)."""
+    return event_buffer.flush()
+
+
+def get_buffer_stats():
+    """Compteurs du tampon d'événements du processus courant."""
+    return event_buffer.get_stats()
+
+
 def log_event(action, description="", user=None, severity="INFO", **metadata):
     """
-    Enregistre un événement dans le modèle EventLog en déléguant à la méthode `log_action`.
+    Enregistre un événement : ajouté au tampon d'écriture, ou écrit immédiatement
+    en mode synchrone.
 
     Args:
         action (str): Type d'action (ex : "connexion", "attribution_badge", etc.)
@@ -19,21 +176,76 @@ def log_event(action, description="", user=None, severity="INFO", **metadata):
         **metadata (dict): Données supplémentaires liées à l'événement
 
     Returns:
-        EventLog: Instance de l'événement créé, ou None en cas d'erreur
+        EventLog: L'événement (non encore enregistré s'il est en attente), ou None en cas d'erreur
     """
     try:
-        return EventLog.log_action(
+        if event_log_is_sync():
+            return EventLog.log_action(
+                action=action,
+                description=description,
+                user=user,
+                severity=severity,
+                **metadata
+            )
+
+        event = EventLog(
             action=action,
             description=description,
             user=user,
             severity=severity,
-            **metadata
+            metadata=metadata or None,
+            created_at=now(),
         )
+        _enqueue(event)
+        return event
     except Exception as e:
         username = getattr(user, 'username', 'System')
         logger.error(f"❌ Erreur lors de la création de l'événement '{action}' pour {username}: {str(e)}")
         return None
 
+
+def _enqueue(event):
+    if connection.in_atomic_block:
+        # Mis en tampon à la validation seulement : un événement d'une transaction
+        # annulée n'est jamais écrit, et son utilisateur existe lors du vidage
+        transaction.on_commit(lambda: event_buffer.append(event))
+    else:
+        event_buffer.append(event)
+
+
+def log_events(action, items, severity="INFO"):
+    """
+    Enregistre plusieurs événements d'une même action : ajoutés au tampon, ou écrits
+    par un seul `bulk_create` en mode synchrone.
+
+    Args:
+        action (str): Type d'action commun
+        items (iterable): Triplets (description, utilisateur, métadonnées)
+        severity (str): Niveau de gravité commun
+
+    Returns:
+        int: Nombre d'événements enregistrés (ou mis en attente)
+    """
+    timestamp = now()
+    events = [
+        EventLog(action=action, description=description, user=user, severity=severity,
+                 metadata=metadata or None, created_at=timestamp)
+        for description, user, metadata in items
+    ]
+    if not events:
+        return 0
+    try:
+        if event_log_is_sync():
+            EventLog.objects.bulk_create(events)
+            logger.info(f"[LOG] {len(events)} événement(s) '{action}' enregistré(s)")
+        else:
+            for event in events:
+                _enqueue(event)
+        return len(events)
+    except Exception as e:
+        logger.error(f"❌ Erreur lors de la création de {len(events)} événement(s) '{action}': {str(e)}")
+        return 0
+
 def get_event_statistics(days=30, user=None):
     """
     Récupère des statistiques agrégées des événements sur une période donnée.
@@ -0,0 +1,121 @@
+# services/journal_analytics_service.py
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db.models import Avg, Count, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from ..models import JournalEntry
+from . import streak_service, user_cache_service
+
+logger = logging.getLogger(__name__)
+
+# Statistiques du journal (/api/journal-entries/stats/) calculées en deux requêtes :
+# - une agrégation conditionnelle (total, distribution des humeurs, moyennes par période) ;
+# - un GROUP BY (catégorie, mois) pour la répartition par catégorie et par mois.
+# La série est lue dans le bitmap des jours actifs. Le résultat est mis en cache par
+# génération du cache utilisateur (invalidé à chaque écriture).
+
+MOODS = range(1, 11)
+
+
+def _mood_aggregates(today):
+    week_ago = today - timedelta(days=7)
+    month_ago = today - timedelta(days=30)
+    two_months_ago = today - timedelta(days=60)
+
+    aggregates = {
+        "total": Count("id"),
+        "overall": Avg("mood"),
+        "last_week": Avg("mood", filter=Q(created_at__date__gte=week_ago)),
+        "last_month": Avg("mood", filter=Q(created_at__date__gte=month_ago)),
+        "previous_month": Avg(
+            "mood", filter=Q(created_at__date__gte=two_months_ago, created_at__date__lt=month_ago)
+        ),
+    }
+    for mood in MOODS:
+        aggregates[f"mood_{mood}"] = Count("id", filter=Q(mood=mood))
+    return aggregates
+
+
+def _average_mood(row):
+    result = {
+        "overall": round(row["overall"] or 0, 1),
+        "last_week": round(row["last_week"] or 0, 1),
+        "last_month": round(row["last_month"] or 0, 1),
+        "trend": "stable",
+    }
+    if row["previous_month"] and row["last_month"]:
+        diff = row["last_month"] - row["previous_month"]
+        if diff > 0.5:
+            result["trend"] = "up"
+        elif diff < -0.5:
+            result["trend"] = "down"
+    return result
+
+
+def _entries_streak(user, today):
+    """Série actuelle et maximale, lues dans le bitmap des jours actifs."""
+    value, origin = streak_service.get_activity(user)
+    if not value:
+        return {"current": 0, "max": 0, "dates": []}
+
+    last_day = origin + timedelta(days=value.bit_length() - 1)
+    current_active = last_day in (today, today - timedelta(days=1))
+    return {
+        "current": streak_service.streak_ending_at(value, origin, last_day) if current_active else 0,
+        "max": streak_service.longest_run(value),
+        "current_active": current_active,
+        "last_entry_date": last_day.isoformat(),
+    }
+
+
+def compute_journal_stats(user):
+    """
+    Calcule toutes les statistiques du journal d'un utilisateur en deux requêtes.
+
+    Returns:
+        dict: total_entries, entries_per_category, mood_distribution, monthly_entries,
+              average_mood, entries_streak (même format que `JournalStatsSerializer`)
+    """
+    today = timezone.now().date()
+    start_date = today - timedelta(days=365)
+    entries = JournalEntry.objects.filter(user=user)
+
+    row = entries.aggregate(**_mood_aggregates(today))
+
+    per_category = defaultdict(int)
+    per_month = defaultdict(int)
+    grouped = (
+        entries.annotate(month=TruncMonth("created_at"))
+        .values("category", "month")
+        .annotate(count=Count("id"), recent=Count("id", filter=Q(created_at__date__gte=start_date)))
+        .order_by()
+    )
+    for group in grouped:
+        per_category[group["category"]] += group["count"]
+        if group["recent"]:
+            per_month[group["month"].strftime("%Y-%m")] += group["recent"]
+
+    monthly_entries = {}
+    for i in range(12):
+        monthly_entries[(today - timedelta(days=30 * i)).strftime("%Y-%m")] = 0
+    for month in sorted(per_month):
+        monthly_entries[month] = per_month[month]
+
+    return {
+        "total_entries": row["total"],
+        "entries_per_category": dict(sorted(per_category.items(), key=lambda item: (-item[1], item[0]))),
+        "mood_distribution": {str(mood): row[f"mood_{mood}"] for mood in MOODS},
+        "monthly_entries": monthly_entries,
+        "average_mood": _average_mood(row),
+        "entries_streak": _entries_streak(user, today),
+    }
+
+
+def get_journal_stats(user):
+    """Statistiques du journal, depuis le cache utilisateur si elles sont à jour."""
+    return user_cache_service.get_or_compute(user.pk, "journal_stats", lambda: compute_journal_stats(user))
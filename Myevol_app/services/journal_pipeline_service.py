@@ -0,0 +1,110 @@
+# services/journal_pipeline_service.py
+
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_PENDING_KEY = "journal_pipeline_pending_{user_id}"
+
+
+def pipeline_is_sync():
+    """
+    Indique si le pipeline doit s'exécuter immédiatement (tests, développement sans worker).
+    """
+    return getattr(settings, "MYEVOL_PIPELINE_SYNC", False)
+
+
+def pipeline_delay():
+    """
+    Fenêtre (en secondes) pendant laquelle les écritures d'un même utilisateur sont regroupées.
+    """
+    return getattr(settings, "MYEVOL_PIPELINE_DELAY", 5)
+
+
+def schedule_journal_pipeline(entry):
+    """
+    Planifie le traitement consécutif à la création d'une entrée de journal.
+
+    Le traitement (défis, badges) est envoyé à Celery une fois
+    la transaction validée. Les créations successives d'un même utilisateur pendant
+    la fenêtre `MYEVOL_PIPELINE_DELAY` sont regroupées en un seul recalcul.
+
+    En mode synchrone (`MYEVOL_PIPELINE_SYNC`), le traitement est exécuté immédiatement.
+
+    Args:
+        entry (JournalEntry): L'entrée qui vient d'être créée
+    """
+    if pipeline_is_sync():
+        run_journal_pipeline(entry.user)
+        return
+
+    user_id = entry.user_id
+    delay = pipeline_delay()
+
+    def enqueue():
+        # La clé expire au moment où la tâche s'exécute : toute écriture survenue
+        # entre-temps est couverte par la tâche déjà planifiée.
+        if not cache.add(PIPELINE_PENDING_KEY.format(user_id=user_id), True, timeout=delay):
+            logger.debug(f"[PIPELINE] Traitement déjà planifié pour l'utilisateur {user_id}, regroupement.")
+            return
+
+        from ..tasks import process_journal_pipeline
+        process_journal_pipeline.apply_async(args=[user_id], countdown=delay)
+        logger.info(f"[PIPELINE] Traitement planifié dans {delay}s pour l'utilisateur {user_id}.")
+
+    transaction.on_commit(enqueue)
+
+
+def process_pending_entries(user_id):
+    """
+    Point d'entrée de la tâche Celery : exécute le pipeline une seule fois pour
+    l'utilisateur, sur l'état courant de ses entrées.
+
+    Args:
+        user_id (int): Identifiant de l'utilisateur
+
+    Returns:
+        bool: True si le traitement a été exécuté
+    """
+    user = get_user_model().objects.filter(pk=user_id).first()
+    if user is None:
+        logger.warning(f"[PIPELINE] Utilisateur {user_id} introuvable, traitement ignoré.")
+        return False
+
+    run_journal_pipeline(user)
+    return True
+
+
+def run_journal_pipeline(user):
+    """
+    Exécute, une seule fois, les traitements liés aux nouvelles entrées : défis et badges.
+
+    Les statistiques et les séries ne font pas partie du pipeline : elles sont tenues
+    à jour de façon incrémentale à chaque écriture (voir `stats_service.apply_entry_delta`
+    et `streak_service.record_activity`).
+
+    Chaque étape est isolée : l'échec de l'une n'empêche pas les suivantes.
+
+    Args:
+        user (User): L'utilisateur concerné
+    """
+    from . import challenge_service
+    from .badge_rule_service import ENTRY_METRICS
+
+    steps = [
+        ("défis", lambda: challenge_service.check_challenges(user)),
+        ("badges", lambda: user.update_badges(changed_metrics=ENTRY_METRICS)),
+    ]
+
+    for label, step in steps:
+        try:
+            step()
+        except Exception as e:
+            logger.error(f"[PIPELINE] Échec de l'étape {label} pour {user.username} : {e}")
+
+    logger.info(f"[PIPELINE] Traitement terminé pour {user.username}.")
@@ -1,9 +1,13 @@
 # services/journal_service.py
 
 import logging
+from collections import defaultdict
 from datetime import timedelta
 from django.core.exceptions import ValidationError
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
 from ..models import JournalEntry
+from . import user_cache_service
 
 logger = logging.getLogger(__name__)
 
@@ -54,3 +58,87 @@ def get_journal_entries(user, start_date, end_date):
     """
     logger.debug(f"[JOURNAL] Récupération des entrées de {user.username} entre {start_date} et {end_date}")
     return JournalEntry.get_entries_by_date_range(user, start_date, end_date)
+
+
+def iter_months(first_month, last_month):
+    """
+    Itère sur les premiers jours des mois compris entre deux mois (inclus).
+
+    Args:
+        first_month (date): Un jour du premier mois
+        last_month (date): Un jour du dernier mois
+    """
+    current = first_month.replace(day=1)
+    while current <= last_month:
+        yield current
+        current = (current + timedelta(days=32)).replace(day=1)
+
+
+def _month_end(month_start):
+    return (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+
+def compute_calendar_days(user, start_date, end_date):
+    """
+    Agrège les entrées par jour en une seule requête GROUP BY (jour, catégorie).
+
+    Returns:
+        list[dict]: Pour chaque jour avec au moins une entrée, trié par date :
+            {"day", "count", "mood_avg", "categories"}
+    """
+    rows = (
+        JournalEntry.objects.filter(user=user, created_at__date__range=(start_date, end_date))
+        .annotate(day=TruncDate("created_at"))
+        .values("day", "category")
+        .annotate(count=Count("id"), mood_total=Sum("mood"))
+        .order_by("day", "category")
+    )
+
+    days = defaultdict(lambda: {"count": 0, "mood_total": 0, "categories": []})
+    for row in rows:
+        bucket = days[row["day"]]
+        bucket["count"] += row["count"]
+        bucket["mood_total"] += row["mood_total"] or 0
+        bucket["categories"].append(row["category"])
+
+    return [
+        {
+            "day": day,
+            "count": bucket["count"],
+            "mood_avg": round(bucket["mood_total"] / bucket["count"], 1),
+            "categories": bucket["categories"],
+        }
+        for day, bucket in sorted(days.items())
+    ]
+
+
+def get_calendar(user, first_month, last_month):
+    """
+    Retourne les données du calendrier (par jour) entre deux mois inclus.
+
+    Chaque mois est mis en cache séparément dans le cache utilisateur (invalidé à chaque
+    écriture d'entrée) ; les mois absents du cache sont calculés ensemble, en une requête.
+
+    Args:
+        user (User): L'utilisateur concerné
+        first_month (date): Premier jour du premier mois
+        last_month (date): Premier jour du dernier mois
+
+    Returns:
+        list[dict]: Jours avec entrées, triés par date (voir `compute_calendar_days`)
+    """
+    months = {month.strftime("%Y-%m"): month for month in iter_months(first_month, last_month)}
+
+    def compute_missing(missing):
+        start, end = months[min(missing)], _month_end(months[max(missing)])
+        per_month = {key: [] for key in missing}
+        for day in compute_calendar_days(user, start, end):
+            key = day["day"].strftime("%Y-%m")
+            if key in per_month:
+                per_month[key].append(day)
+        logger.debug(f"[JOURNAL] Calendrier calculé pour {user.username} : {', '.join(sorted(missing))}")
+        return per_month
+
+    cached = user_cache_service.get_many_or_compute(user.pk, "calendar", list(months), compute_missing)
+    return [day for key in sorted(months) for day in cached[key]]
+
@@ -0,0 +1,155 @@
+# services/notification_dispatch_service.py
+
+import logging
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+
+from ..models.notification_model import Notification
+
+logger = logging.getLogger(__name__)
+
+# Envoi des notifications programmées, par lots :
+# - chaque lot réclame les notifications échues avec SELECT … FOR UPDATE SKIP LOCKED
+#   (PostgreSQL) : plusieurs workers peuvent tourner en parallèle sans traiter deux fois
+#   la même ligne ni s'attendre mutuellement ;
+# - le lot est remis à chaque canal configuré (settings.MYEVOL_NOTIFICATION_CHANNELS,
+#   chemins de classes), puis marqué envoyé (is_read / read_at) par un seul UPDATE,
+#   dans la transaction qui détient les verrous.
+# Un canal en erreur est journalisé sans bloquer les autres : l'envoi est « au plus une fois ».
+
+DEFAULT_CHANNELS = ["Myevol_app.services.notification_dispatch_service.InAppChannel"]
+
+
+def dispatch_batch_size():
+    return getattr(settings, "MYEVOL_NOTIFICATION_DISPATCH_BATCH_SIZE", 500)
+
+
+class NotificationChannel(ABC):
+    """
+    Canal de remise des notifications programmées.
+
+    `deliver` reçoit un lot de notifications (utilisateur préchargé) et ne doit pas
+    modifier leur statut : le dispatcher s'en charge pour tout le lot. Un canal
+    incomplet échoue dès son instanciation (get_channels), avant tout lot réclamé.
+    """
+
+    name = None
+
+    @abstractmethod
+    def deliver(self, notifications):
+        """Remet le lot sur ce canal ; retourne le nombre de notifications remises."""
+
+
+class InAppChannel(NotificationChannel):
+    """Notification affichée dans l'application : la ligne en base suffit."""
+
+    name = "in_app"
+
+    def deliver(self, notifications):
+        return len(notifications)
+
+
+class EmailChannel(NotificationChannel):
+    """Envoie chaque notification par email, sur une seule connexion SMTP par lot."""
+
+    name = "email"
+    subject = "MyEvol - Nouvelle notification"
+
+    def deliver(self, notifications):
+        messages = [
+            EmailMessage(self.subject, notif.message, settings.DEFAULT_FROM_EMAIL, [notif.user.email])
+            for notif in notifications
+            if notif.user.email
+        ]
+        if not messages:
+            return 0
+        return get_connection().send_messages(messages)
+
+
+class WebSocketChannel(NotificationChannel):
+    """
+    Pousse chaque notification au groupe `notifications_<user_id>` de la couche
+    Django Channels (settings.CHANNEL_LAYERS).
+    """
+
+    name = "websocket"
+    group_name = "notifications_{user_id}"
+
+    def deliver(self, notifications):
+        from asgiref.sync import async_to_sync
+        from channels.layers import get_channel_layer
+
+        layer = get_channel_layer()
+        if layer is None:
+            logger.warning("[NOTIF] Aucune couche Channels configurée (CHANNEL_LAYERS) : envoi websocket ignoré.")
+            return 0
+
+        for notif in notifications:
+            async_to_sync(layer.group_send)(self.group_name.format(user_id=notif.user_id), {
+                "type": "notification.message",
+                "id": notif.id,
+                "message": notif.message,
+                "notif_type": notif.notif_type,
+            })
+        return len(notifications)
+
+
+def get_channels():
+    """Instancie les canaux configurés (MYEVOL_NOTIFICATION_CHANNELS)."""
+    paths = getattr(settings, "MYEVOL_NOTIFICATION_CHANNELS", None) or DEFAULT_CHANNELS
+    return [import_string(path)() for path in paths]
+
+
+def _claim_due(reference, batch_size):
+    """Réserve un lot de notifications échues, en sautant celles verrouillées par un autre worker."""
+    return list(
+        Notification.objects.select_for_update(skip_locked=True, of=("self",))
+        .select_related("user")
+        .filter(scheduled_at__lte=reference, is_read=False, archived=False)
+        .order_by("scheduled_at", "id")[:batch_size]
+    )
+
+
+def dispatch_due_notifications(batch_size=None, channels=None):
+    """
+    Envoie les notifications programmées dont la date est atteinte.
+
+    Args:
+        batch_size (int, optional): Notifications réclamées par transaction
+        channels (list[NotificationChannel], optional): Canaux (configurés par défaut)
+
+    Returns:
+        int: Nombre de notifications envoyées
+    """
+    batch_size = batch_size or dispatch_batch_size()
+    channels = get_channels() if channels is None else channels
+    reference = now()
+    sent = 0
+
+    while True:
+        with transaction.atomic():
+            batch = _claim_due(reference, batch_size)
+            if not batch:
+                break
+
+            for channel in channels:
+                try:
+                    channel.deliver(batch)
+                except Exception as e:
+                    logger.error(f"[NOTIF] ❌ Échec du canal '{channel.name}' pour {len(batch)} notification(s) : {e}")
+
+            Notification.objects.filter(pk__in=[notif.pk for notif in batch]).update(
+                is_read=True, read_at=now()
+            )
+        sent += len(batch)
+        if len(batch) < batch_size:
+            break
+
+    if sent:
+        logger.info(f"[NOTIF] ⏰ {sent} notification(s) programmée(s) envoyée(s)")
+    return sent
@@ -1,11 +1,16 @@
 # services/notification_service.py
 
 import logging
-from django.utils.timezone import now
+import time
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils.timezone import localtime, now
 from django.conf import settings
 
+from ..models.journal_model import JournalEntry
 from ..models.notification_model import Notification
+from ..models.userPreference_model import UserPreference
 from ..models.user_model import User  # ✅ Correction ici : importer User du bon fichier
+from .notification_dispatch_service import dispatch_due_notifications
 
 logger = logging.getLogger(__name__)
 
@@ -80,29 +85,18 @@ def create_admin_notification(message, notif_type="info", scheduled_at=None):
 
 def send_scheduled_notifications():
     """
-    Parcourt et envoie les notifications programmées dont la date est atteinte.
+    Envoie les notifications programmées dont la date est atteinte, par lots
+    (voir `notification_dispatch_service`).
 
     Effet :
-        - Marque les notifications comme lues
+        - Remet les notifications aux canaux configurés (in-app, email, websocket)
+        - Les marque comme lues
         - Peut être appelé par une tâche CRON ou Celery
 
     Returns:
         int: Nombre de notifications envoyées
     """
-    notifications = Notification.objects.filter(
-        scheduled_at__lte=now(),
-        is_read=False,
-        archived=False
-    )
-
-    count = 0
-    for notif in notifications:
-        # ICI : possibilité d'envoyer un email ou une web notification
-        notif.mark_as_read()
-        count += 1
-        logger.info(f"[NOTIF] ⏰ Notification programmée envoyée à {notif.user.username} : {notif.message}")
-
-    return count
+    return dispatch_due_notifications()
 
 
 def archive_user_notifications(user):
@@ -119,3 +113,121 @@ def archive_user_notifications(user):
     count = notifications.update(archived=True)
     logger.info(f"[NOTIF] 🗃️ {count} notifications archivées pour {user.username}")
     return count
+
+
+def get_notification_counts(user):
+    """
+    Compte les notifications non archivées d'un utilisateur (total, non lues, du jour et
+    par type) en une seule agrégation conditionnelle.
+
+    Args:
+        user (User): Utilisateur concerné
+
+    Returns:
+        dict: total, unread, today, by_type ({type: {"total", "unread"}})
+    """
+    unread = Q(is_read=False)
+    aggregates = {
+        "total": Count("pk"),
+        "unread": Count("pk", filter=unread),
+        "today": Count("pk", filter=Q(created_at__date=now().date())),
+    }
+    for notif_type, _ in Notification.NOTIF_TYPES:
+        aggregates[f"{notif_type}_total"] = Count("pk", filter=Q(notif_type=notif_type))
+        aggregates[f"{notif_type}_unread"] = Count("pk", filter=Q(notif_type=notif_type) & unread)
+
+    row = Notification.objects.filter(user=user, archived=False).aggregate(**aggregates)
+    return {
+        "total": row["total"],
+        "unread": row["unread"],
+        "today": row["today"],
+        "by_type": {
+            notif_type: {"total": row[f"{notif_type}_total"], "unread": row[f"{notif_type}_unread"]}
+            for notif_type, _ in Notification.NOTIF_TYPES
+        },
+    }
+
+
+# Préférences appliquées par les envois de masse (`bulk_notify`) : les rappels et invitations
+# d'écriture, absents de UserPreference.NOTIFICATION_FIELDS, y suivent les notifications générales.
+FANOUT_PREFERENCE_FIELDS = {
+    **UserPreference.NOTIFICATION_FIELDS,
+    "journal_reminder": "notif_info",
+    "journal_prompt": "notif_info",
+}
+
+
+def notification_allowed_q(notif_type):
+    """
+    Filtre (sur User) des utilisateurs dont les préférences autorisent ce type de notification
+    lors d'un envoi de masse. Un utilisateur sans préférences reçoit toutes les notifications,
+    comme dans `create_user_notification`.
+    """
+    field = FANOUT_PREFERENCE_FIELDS.get(notif_type)
+    no_preferences = Q(preferences__isnull=True)
+    if field is None:
+        return no_preferences
+    return no_preferences | Q(**{f"preferences__{field}": True})
+
+
+def inactive_users(since, users=None):
+    """
+    Utilisateurs actifs sans entrée de journal depuis `since` (anti-jointure NOT EXISTS).
+
+    Args:
+        since (datetime): Début de la fenêtre d'activité
+        users (QuerySet, optional): Population de départ (tous les utilisateurs actifs par défaut)
+    """
+    users = User.objects.filter(is_active=True) if users is None else users
+    recent_entries = JournalEntry.objects.filter(user=OuterRef("pk"), created_at__gte=since)
+    return users.filter(~Exists(recent_entries))
+
+
+def bulk_notify(users, message, notif_type="info", batch_size=1000):
+    """
+    Envoie la même notification à un ensemble d'utilisateurs, en respectant leurs préférences.
+
+    L'éligibilité (préférence activée, pas déjà notifié aujourd'hui pour ce type) est
+    évaluée dans une seule requête ; les notifications sont construites en mémoire et
+    écrites par lots avec `bulk_create`. Une tâche relancée le même jour n'envoie donc
+    pas de doublons.
+
+    Args:
+        users (QuerySet): Utilisateurs ciblés
+        message (str): Contenu de la notification
+        notif_type (str): Type de notification
+        batch_size (int): Nombre de notifications écrites par requête
+
+    Returns:
+        dict: sent (notifications créées), duration (secondes), rate (notifications/seconde)
+    """
+    started = time.monotonic()
+    day_start = localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    already_notified = Notification.objects.filter(
+        user=OuterRef("pk"), notif_type=notif_type, created_at__gte=day_start
+    )
+    recipients = (
+        users.filter(notification_allowed_q(notif_type))
+        .filter(~Exists(already_notified))
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+    sent = 0
+    batch = []
+    for user_id in recipients.iterator(chunk_size=batch_size):
+        batch.append(Notification(user_id=user_id, message=message, notif_type=notif_type))
+        if len(batch) >= batch_size:
+            Notification.objects.bulk_create(batch)
+            sent += len(batch)
+            batch = []
+    if batch:
+        Notification.objects.bulk_create(batch)
+        sent += len(batch)
+
+    duration = time.monotonic() - started
+    rate = sent / duration if duration > 0 else float(sent)
+    logger.info(
+        f"[NOTIF] 📣 '{notif_type}' envoyée à {sent} utilisateur(s) en {duration:.2f}s ({rate:.0f} notifications/s)"
+    )
+    return {"sent": sent, "duration": duration, "rate": rate}
@@ -0,0 +1,155 @@
+# services/objective_progress_service.py
+
+import logging
+
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, TruncDate
+
+from ..models.journal_model import JournalEntry
+from ..models.notification_model import Notification
+from ..models.objective_model import Objective
+from ..models.stats_model import DailyStat
+
+logger = logging.getLogger(__name__)
+
+# Progression des objectifs sans une requête COUNT par objectif (et par champ sérialisé) :
+# le nombre d'entrées de la catégorie à la date cible est porté par l'attribut
+# `entries_done_count`, que `Objective.entries_done()` lit en priorité tant que la
+# catégorie et la date cible de l'objectif n'ont pas changé depuis le chargement.
+# - `annotate_progress` : annotation d'un queryset (sous-requête corrélée, une seule requête SQL)
+# - `attach_progress` : objectifs déjà chargés, une requête groupée par (utilisateur, catégorie, jour)
+#
+# Suivi à l'écriture (`track_entry`, appelé par signals/stats_signals.py) : seuls les objectifs
+# en cours dont la clé (utilisateur, catégorie, date cible) correspond à l'entrée écrite sont
+# examinés ; le compteur est celui que les cumuls incrémentaux tiennent déjà à jour
+# (`DailyStat.categories`). Les objectifs atteints sont complétés par un seul UPDATE et
+# notifiés par un seul `bulk_create`.
+
+ENTRIES_DONE_ATTR = "entries_done_count"
+
+
+def entries_done_expression():
+    """Nombre d'entrées de l'utilisateur dans la catégorie de l'objectif, à sa date cible."""
+    matching = (
+        JournalEntry.objects.filter(
+            user=OuterRef("user"),
+            category=OuterRef("category"),
+            created_at__date=OuterRef("target_date"),
+        )
+        .order_by()
+        .values("user")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(matching, output_field=IntegerField()), Value(0))
+
+
+def annotate_progress(queryset):
+    """
+    Annote un queryset d'objectifs avec `entries_done_count`.
+
+    Args:
+        queryset (QuerySet[Objective]): Objectifs à annoter
+
+    Returns:
+        QuerySet[Objective]
+    """
+    return queryset.annotate(**{ENTRIES_DONE_ATTR: entries_done_expression()})
+
+
+def count_matching_entries(keys):
+    """
+    Compte les entrées par (utilisateur, catégorie, jour), en une requête groupée.
+
+    Args:
+        keys (iterable): Triplets (user_id, category, date)
+
+    Returns:
+        dict: {(user_id, category, date): nombre d'entrées}
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+    rows = (
+        JournalEntry.objects.filter(
+            user_id__in={user_id for user_id, _, _ in keys},
+            category__in={category for _, category, _ in keys},
+            created_at__date__in={day for _, _, day in keys},
+        )
+        .annotate(day=TruncDate("created_at"))
+        .values_list("user_id", "category", "day")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    counts = {(user_id, category, day): total for user_id, category, day, total in rows}
+    return {key: counts.get(key, 0) for key in keys}
+
+
+def attach_progress(objectives):
+    """
+    Renseigne `entries_done_count` sur des objectifs déjà chargés, en une requête.
+
+    Args:
+        objectives (iterable[Objective]): Objectifs (liste ou queryset évalué)
+
+    Returns:
+        list[Objective]
+    """
+    objectives = list(objectives)
+    counts = count_matching_entries(obj.progress_key() for obj in objectives)
+    for obj in objectives:
+        obj.set_entries_done(counts[obj.progress_key()])
+    return objectives
+
+
+def entries_count_for(user, category, day):
+    """
+    Nombre d'entrées de l'utilisateur dans une catégorie pour un jour, lu dans le cumul
+    journalier (`DailyStat.categories`), ou recompté si les cumuls ne sont pas fiables.
+    """
+    from .stats_service import is_stats_dirty
+
+    if not is_stats_dirty(user.pk):
+        stat = DailyStat.objects.filter(user=user, date=day).values_list("mood_sum", "categories").first()
+        if stat is not None and stat[0] is not None:
+            return (stat[1] or {}).get(category, 0)
+    return count_matching_entries([(user.pk, category, day)])[(user.pk, category, day)]
+
+
+def track_entry(user, category, day):
+    """
+    Complète les objectifs en cours atteints par l'écriture d'une entrée.
+
+    Args:
+        user (User): Propriétaire de l'entrée
+        category (str): Catégorie de l'entrée
+        day (date): Jour (heure locale) de l'entrée
+
+    Returns:
+        list[Objective]: Objectifs complétés par cette écriture
+    """
+    with transaction.atomic():
+        # Verrou : deux écritures concurrentes ne complètent (et ne notifient) pas deux fois
+        candidates = list(
+            Objective.objects.select_for_update()
+            .filter(user=user, category=category, target_date=day, done=False)
+            .order_by("pk")
+        )
+        if not candidates:
+            return []
+
+        count = entries_count_for(user, category, day)
+        achieved = [obj for obj in candidates if count >= obj.target_value]
+        if not achieved:
+            return []
+        Objective.objects.filter(pk__in=[obj.pk for obj in achieved]).update(done=True)
+        Notification.objects.bulk_create([
+            Notification(user=user, message=f"🎯 Objectif atteint : {obj.title}", notif_type="objectif")
+            for obj in achieved
+        ])
+    logger.info(f"[OBJECTIF] {len(achieved)} objectif(s) '{category}' complété(s) par {user.username}.")
+
+    from .badge_rule_service import OBJECTIVE_METRICS
+    user.update_badges(changed_metrics=OBJECTIVE_METRICS)
+    return achieved
@@ -0,0 +1,119 @@
+# services/profile_service.py
+
+import logging
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, Max, Q
+from django.utils.timezone import localdate, localtime, now
+
+from . import user_cache_service
+
+logger = logging.getLogger(__name__)
+
+# Le profil "me" est mis en cache par utilisateur avec la génération du cache
+# utilisateur (voir `user_cache_service`) : toute écriture d'entrée, de badge,
+# d'objectif ou du compte l'incrémente, et le profil en cache devient obsolète
+# sans avoir à le supprimer.
+
+
+def profile_cache_ttl():
+    """Durée de vie (secondes) du profil en cache."""
+    return getattr(settings, "MYEVOL_PROFILE_CACHE_TTL", 3600)
+
+
+def _profile_key(user_id):
+    return f"{user_cache_service.KEY_PREFIX}:{user_id}:profile"
+
+
+def compute_profile_metrics(user):
+    """
+    Calcule en une seule requête les compteurs affichés dans le profil.
+
+    Returns:
+        dict: total_entries, mood_week, mood_month, mood_all, entries_today,
+              entries_last_week, entries_last_month, last_entry_at, badges_count
+    """
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    current = now()
+    today = localdate()
+
+    metrics = (
+        User.objects.filter(pk=user.pk)
+        .annotate(
+            mood_week=Avg("entries__mood", filter=Q(entries__created_at__gte=current - timedelta(days=7))),
+            mood_month=Avg("entries__mood", filter=Q(entries__created_at__gte=current - timedelta(days=30))),
+            mood_all=Avg("entries__mood"),
+            entries_today=Count("entries", filter=Q(entries__created_at__date=today)),
+            entries_last_week=Count("entries", filter=Q(entries__created_at__date__gte=today - timedelta(days=7))),
+            entries_last_month=Count("entries", filter=Q(entries__created_at__date__gte=today - timedelta(days=30))),
+            last_entry_at=Max("entries__created_at"),
+        )
+        .values(
+            "total_entries", "mood_week", "mood_month", "mood_all", "entries_today",
+            "entries_last_week", "entries_last_month", "last_entry_at",
+            "badges_count",  # compteurs dénormalisés (voir user_counter_service)
+            total_entries=F("entries_count"),
+        )
+        .first()
+    )
+    return metrics or {
+        "total_entries": 0, "mood_week": None, "mood_month": None, "mood_all": None,
+        "entries_today": 0, "entries_last_week": 0, "entries_last_month": 0,
+        "last_entry_at": None, "badges_count": 0,
+    }
+
+
+def get_profile_version(user_id):
+    """
+    Retourne (génération, profil en cache) pour un utilisateur, en une seule lecture du cache.
+
+    Le profil en cache n'est retourné que s'il correspond à la génération courante et au
+    jour courant (certains compteurs dépendent de la date).
+    """
+    generation_key = user_cache_service.generation_key(user_id)
+    values = cache.get_many([generation_key, _profile_key(user_id)])
+    version = values.get(generation_key)
+    if version is None:
+        version = user_cache_service.get_generation(user_id)
+
+    cached = values.get(_profile_key(user_id))
+    if cached and cached["version"] == version and cached["day"] == localdate().isoformat():
+        return version, cached
+    return version, None
+
+
+def get_profile(user, build, context=None):
+    """
+    Retourne le profil "me" de l'utilisateur, depuis le cache si sa version est à jour.
+
+    Args:
+        user (User): Utilisateur connecté
+        build (callable): Construit les données du profil, `build(user, context)` (appelé
+            uniquement en cas d'échec du cache)
+        context (dict, optional): Contexte du sérialiseur (requête courante)
+
+    Returns:
+        dict: {"data", "etag", "last_modified" (timestamp), "version", "day"}
+    """
+    version, cached = get_profile_version(user.pk)
+    if cached is not None:
+        return cached
+
+    # Date de la dernière écriture (incrément de génération), et non de la reconstruction :
+    # un profil reconstruit après expiration ou éviction garde la même date. Les compteurs
+    # du jour changent à minuit, d'où le plancher au début de la journée.
+    start_of_day = localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    profile = {
+        "version": version,
+        "day": localdate().isoformat(),
+        "last_modified": max(user_cache_service.get_modified(user.pk), int(start_of_day.timestamp())),
+        "data": build(user, context or {}),
+    }
+    profile["etag"] = f'"{user.pk}-{version}-{profile["day"]}"'
+    cache.set(_profile_key(user.pk), profile, timeout=profile_cache_ttl())
+    logger.debug(f"[PROFILE] Profil reconstruit pour {user.username} (version {version})")
+    return profile
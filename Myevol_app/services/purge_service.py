@@ -0,0 +1,246 @@
+# services/purge_service.py
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.timezone import now
+
+from ..models.event_log_model import EventLog
+from ..models.notification_model import Notification
+from ..models.stats_model import DailyStat
+
+logger = logging.getLogger(__name__)
+
+# Purge des tables à croissance non bornée, par lots de clés primaires :
+# - chaque lot sélectionne au plus `batch_size` identifiants (par ordre croissant), puis
+#   les supprime dans sa propre transaction courte ; une pause sépare deux lots ;
+# - après chaque lot, le dernier identifiant traité est enregistré (point de reprise) :
+#   une purge interrompue (arrêt du worker, `max_batches` atteint) reprend là où elle
+#   s'était arrêtée, le point de reprise étant effacé une fois la purge terminée ;
+# - la progression (lignes supprimées, lots, débit) est publiée en cache pendant la purge.
+#
+# Rétentions (jours) surchargeables via settings.MYEVOL_PURGE_RETENTION_DAYS = {"notifications": 30, ...}
+
+CHECKPOINT_KEY = "purge_checkpoint_{name}"
+PROGRESS_KEY = "purge_progress_{name}"
+CHECKPOINT_TTL = 7 * 24 * 3600
+
+
+def batch_size():
+    return getattr(settings, "MYEVOL_PURGE_BATCH_SIZE", 5000)
+
+
+def batch_pause():
+    """Pause (secondes) entre deux lots, pour laisser respirer la base."""
+    return getattr(settings, "MYEVOL_PURGE_SLEEP", 0.1)
+
+
+class PurgePolicy:
+    """
+    Politique de rétention d'une table : les lignes dont `date_field` est antérieur à
+    `now() - retention` sont supprimées.
+
+    Args:
+        name (str): Nom de la politique (clé du registre et des surcharges de rétention)
+        model (Model): Modèle purgé
+        date_field (str): Champ date / date-heure comparé à la date limite
+        retention_days (int | callable): Rétention par défaut (ou fonction la retournant)
+        filters (dict, optional): Restriction supplémentaire des lignes purgeables
+        cutoff_bound (callable, optional): Retourne une borne supérieure de la date limite,
+            pour ne jamais purger des données encore nécessaires (None : rien à purger)
+        raw_delete (bool): Supprime chaque lot par un DELETE direct, sans Collector ni
+            signaux (réservé aux modèles sans cascade ni receiver post_delete indispensable)
+    """
+
+    def __init__(self, name, model, date_field, retention_days, filters=None, cutoff_bound=None,
+                 raw_delete=False):
+        self.name = name
+        self.model = model
+        self.date_field = date_field
+        self.default_retention_days = retention_days
+        self.filters = filters or {}
+        self.cutoff_bound = cutoff_bound
+        self.raw_delete = raw_delete
+
+    @property
+    def retention_days(self):
+        overrides = getattr(settings, "MYEVOL_PURGE_RETENTION_DAYS", {})
+        if self.name in overrides:
+            return overrides[self.name]
+        default = self.default_retention_days
+        return default() if callable(default) else default
+
+    def cutoff(self, reference=None):
+        """Date limite de la purge (None si rien n'est purgeable)."""
+        cutoff = (reference or now()) - timedelta(days=self.retention_days)
+        if self.cutoff_bound is not None:
+            bound = self.cutoff_bound()
+            if bound is None:
+                return None
+            cutoff = min(cutoff, bound)
+        if self.model._meta.get_field(self.date_field).get_internal_type() == "DateField":
+            cutoff = cutoff.date()
+        return cutoff
+
+    def queryset(self, cutoff):
+        if cutoff is None:
+            return self.model.objects.none()
+        return self.model.objects.filter(**{f"{self.date_field}__lt": cutoff}, **self.filters)
+
+
+# Import différé : event_analytics_service s'appuie lui-même sur `delete_in_batches`
+def _event_log_retention():
+    from .event_analytics_service import raw_retention_days
+
+    return raw_retention_days()
+
+
+def _event_log_rollup_bound():
+    """Les événements bruts ne sont purgés qu'une fois agrégés (fin de la dernière heure agrégée)."""
+    from .event_analytics_service import get_watermarks
+
+    hour_mark, _ = get_watermarks()
+    return hour_mark
+
+
+PURGE_POLICIES = {}
+
+
+def register_policy(policy):
+    """Ajoute (ou remplace) une politique dans le registre."""
+    PURGE_POLICIES[policy.name] = policy
+    return policy
+
+
+register_policy(PurgePolicy("notifications", Notification, "created_at", 90))
+register_policy(PurgePolicy(
+    "event_logs", EventLog, "created_at", _event_log_retention, cutoff_bound=_event_log_rollup_bound,
+))
+# Les statistiques hebdomadaires, mensuelles et annuelles conservent l'historique.
+# DailyStat n'a aucune relation inverse : le DELETE direct évite au Collector de charger
+# chaque ligne pour le seul receiver post_delete de journalisation (une ligne de log par stat).
+register_policy(PurgePolicy("daily_stats", DailyStat, "date", 730, raw_delete=True))
+
+
+def get_checkpoint(name):
+    return cache.get(CHECKPOINT_KEY.format(name=name))
+
+
+def get_progress(name):
+    """Dernière progression publiée pour une politique (None si jamais exécutée)."""
+    return cache.get(PROGRESS_KEY.format(name=name))
+
+
+def delete_in_batches(queryset, size=None, pause=None, start_after=None, max_batches=None, on_batch=None,
+                      raw=False):
+    """
+    Supprime les lignes d'un queryset par lots de clés primaires croissantes, pour ne
+    jamais verrouiller ni journaliser une suppression massive en une seule requête.
+
+    Args:
+        queryset (QuerySet): Lignes à supprimer
+        size (int, optional): Taille des lots (MYEVOL_PURGE_BATCH_SIZE par défaut)
+        pause (float, optional): Pause entre deux lots (MYEVOL_PURGE_SLEEP par défaut)
+        start_after: Reprend après cette clé primaire
+        max_batches (int, optional): Interrompt la purge après ce nombre de lots
+        on_batch (callable, optional): Appelé après chaque lot avec (dernière clé, lignes supprimées, lots)
+        raw (bool): DELETE direct par clé primaire, sans Collector ni signaux pre/post_delete
+
+    Returns:
+        tuple: (lignes supprimées, lots exécutés, purge terminée)
+    """
+    size = size or batch_size()
+    pause = batch_pause() if pause is None else pause
+    model = queryset.model
+    queryset = queryset.order_by("pk")
+    deleted = batches = 0
+    while max_batches is None or batches < max_batches:
+        page = queryset if start_after is None else queryset.filter(pk__gt=start_after)
+        ids = list(page.values_list("pk", flat=True)[:size])
+        if not ids:
+            return deleted, batches, True
+        batch = model.objects.filter(pk__in=ids)
+        if raw:
+            count = batch._raw_delete(batch.db)
+        else:
+            count, _ = batch.delete()
+        deleted += count
+        batches += 1
+        start_after = ids[-1]
+        if on_batch is not None:
+            on_batch(start_after, deleted, batches)
+        if len(ids) < size:
+            return deleted, batches, True
+        if pause:
+            time.sleep(pause)
+    return deleted, batches, False
+
+
+def run_policy(name, dry_run=False, max_batches=None, size=None):
+    """
+    Exécute une politique de purge, en reprenant au dernier point de reprise.
+
+    Args:
+        name (str): Nom de la politique
+        dry_run (bool): Compte les lignes purgeables sans rien supprimer
+        max_batches (int, optional): Nombre maximal de lots pour cette exécution
+        size (int, optional): Taille des lots
+
+    Returns:
+        dict: policy, cutoff, deleted (ou candidates en dry-run), batches, completed, duration, rate
+    """
+    policy = PURGE_POLICIES[name]
+    started = time.monotonic()
+    cutoff = policy.cutoff()
+    queryset = policy.queryset(cutoff)
+
+    if dry_run:
+        candidates = queryset.count()
+        logger.info(f"[PURGE] 🔍 {name} : {candidates} ligne(s) antérieure(s) au {cutoff} seraient supprimée(s)")
+        return {"policy": name, "cutoff": cutoff, "candidates": candidates, "dry_run": True}
+
+    checkpoint_key = CHECKPOINT_KEY.format(name=name)
+    progress_key = PROGRESS_KEY.format(name=name)
+
+    def publish(last_pk, deleted, batches):
+        cache.set(checkpoint_key, last_pk, CHECKPOINT_TTL)
+        elapsed = time.monotonic() - started
+        cache.set(progress_key, {
+            "policy": name, "deleted": deleted, "batches": batches, "last_pk": last_pk,
+            "rate": round(deleted / elapsed) if elapsed > 0 else deleted, "completed": False,
+        }, CHECKPOINT_TTL)
+
+    resume_after = get_checkpoint(name)
+    if resume_after is not None:
+        logger.info(f"[PURGE] ↪️ {name} : reprise après l'identifiant {resume_after}")
+    deleted, batches, completed = delete_in_batches(
+        queryset, size=size, start_after=resume_after, max_batches=max_batches, on_batch=publish,
+        raw=policy.raw_delete,
+    )
+    if completed:
+        cache.delete(checkpoint_key)
+
+    duration = time.monotonic() - started
+    report = {
+        "policy": name,
+        "cutoff": cutoff,
+        "deleted": deleted,
+        "batches": batches,
+        "completed": completed,
+        "duration": duration,
+        "rate": deleted / duration if duration > 0 else float(deleted),
+    }
+    cache.set(progress_key, {**report, "cutoff": str(cutoff)}, CHECKPOINT_TTL)
+    logger.info(
+        f"[PURGE] 🧹 {name} : {deleted} ligne(s) supprimée(s) en {batches} lot(s), "
+        f"{duration:.2f}s ({report['rate']:.0f} lignes/s){'' if completed else ' — interrompue, reprise au prochain passage'}"
+    )
+    return report
+
+
+def run_all_policies(dry_run=False, max_batches=None):
+    """Exécute toutes les politiques enregistrées. Retourne la liste des rapports."""
+    return [run_policy(name, dry_run=dry_run, max_batches=max_batches) for name in PURGE_POLICIES]
@@ -2,11 +2,135 @@
 
 import hashlib
 import random
+import threading
+import time
 from datetime import timedelta
-from django.utils.timezone import now
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.timezone import localdate, now
 from django.db.models import Avg
 
 from ..models.quote_model import Quote
+from . import user_cache_service
+
+# Index des citations en mémoire du processus : identifiants triés, globalement et par
+# `mood_tag`. Les citations changent rarement : l'index n'est reconstruit (une requête)
+# que lorsque la version partagée en cache change, version incrémentée par
+# `signals/quote_signals.py` à chaque création / modification / suppression.
+# La citation du jour de chaque humeur est choisie une fois par jour et partagée
+# entre tous les utilisateurs.
+
+VERSION_KEY = "quote_index_version"
+
+
+def get_version():
+    """Version courante de l'index (initialisée à partir de l'horloge si absente du cache)."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(VERSION_KEY, version, timeout=None):
+            version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def bump_version():
+    """Invalide l'index de tous les processus."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+class QuoteIndex:
+    """
+    Identifiants des citations, par humeur, pour une version donnée.
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self.all_ids = []
+        self.ids_by_mood = {}
+        self.daily = {}  # (jour, humeur) -> Quote
+        self.lock = threading.Lock()
+        for quote_id, mood_tag in Quote.objects.order_by("id").values_list("id", "mood_tag"):
+            self.all_ids.append(quote_id)
+            self.ids_by_mood.setdefault(mood_tag, []).append(quote_id)
+
+    def ids(self, mood_tag=None):
+        return self.ids_by_mood.get(mood_tag, []) if mood_tag else self.all_ids
+
+    def random_id(self, mood_tag=None):
+        ids = self.ids(mood_tag)
+        return random.choice(ids) if ids else None
+
+    def daily_quote(self, day, mood_tag=None):
+        """Citation du jour pour une humeur, choisie à la première demande du jour."""
+        key = (day, mood_tag)
+        # Lecture sur une référence locale : un autre thread peut remplacer `self.daily`
+        # par un dictionnaire filtré sur un autre jour
+        daily = self.daily
+        if key in daily:
+            return daily[key]
+        with self.lock:
+            daily = self.daily
+            if key in daily:
+                return daily[key]
+            ids = self.ids(mood_tag)
+            quote = None
+            if ids:
+                # Hash déterministe basé sur la date : même choix dans tous les processus
+                hash_int = int(hashlib.md5(day.strftime("%Y%m%d").encode()).hexdigest(), 16)
+                quote = Quote.objects.filter(pk=ids[hash_int % len(ids)]).first()
+            # Les jours précédents ne servent plus
+            self.daily = {**{k: v for k, v in daily.items() if k[0] == day}, key: quote}
+            return quote
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_quote_index():
+    """Retourne l'index à jour, en le reconstruisant si la version a changé."""
+    global _index
+    version = get_version()
+    index = _index
+    if index is None or index.version != version:
+        with _index_lock:
+            if _index is None or _index.version != version:
+                _index = QuoteIndex(version)
+            index = _index
+    return index
+
+
+def on_quote_change():
+    """
+    Invalide l'index après l'écriture d'une citation : immédiatement pour le processus
+    courant, puis après validation de la transaction pour les autres.
+    """
+    bump_version()
+    transaction.on_commit(bump_version)
+
+
+def get_mood_tag(user):
+    """
+    Étiquette d'humeur d'un utilisateur d'après ses 3 derniers jours ('low', 'neutral',
+    'positive'), ou None sans entrée récente. Mise en cache jusqu'à sa prochaine écriture.
+    """
+    def compute():
+        avg_mood = user.entries.filter(created_at__gte=now() - timedelta(days=3)).aggregate(
+            avg=Avg('mood')
+        )['avg']
+        if avg_mood is None:
+            return None
+        if avg_mood < 4:
+            return 'low'
+        if avg_mood > 7:
+            return 'positive'
+        return 'neutral'
+
+    return user_cache_service.get_or_compute(user.pk, "quote_mood_tag", compute)
+
 
 def get_random_quote(mood_tag=None):
     """
@@ -18,15 +142,10 @@ def get_random_quote(mood_tag=None):
     Returns:
         Quote or None: Une instance aléatoire de Quote, ou None s’il n’en existe aucune
     """
-    queryset = Quote.objects.all()
-    if mood_tag:
-        queryset = queryset.filter(mood_tag=mood_tag)
-
-    count = queryset.count()
-    if count == 0:
+    quote_id = get_quote_index().random_id(mood_tag)
+    if quote_id is None:
         return None
-
-    return queryset[random.randint(0, count - 1)]
+    return Quote.objects.filter(pk=quote_id).first()
 
 def get_daily_quote(user=None):
     """
@@ -41,30 +160,5 @@ def get_daily_quote(user=None):
     Returns:
         Quote or None: Une citation du jour (filtrée si besoin), ou None si aucune citation disponible
     """
-    today = now().date().strftime("%Y%m%d")
-    mood_filter = None
-
-    if user:
-        recent_entries = user.entries.filter(created_at__gte=now() - timedelta(days=3))
-        if recent_entries.exists():
-            avg_mood = recent_entries.aggregate(avg=Avg('mood'))['avg']
-            if avg_mood is not None:
-                if avg_mood < 4:
-                    mood_filter = 'low'
-                elif avg_mood > 7:
-                    mood_filter = 'positive'
-                else:
-                    mood_filter = 'neutral'
-
-    queryset = Quote.objects.all()
-    if mood_filter:
-        queryset = queryset.filter(mood_tag=mood_filter)
-
-    count = queryset.count()
-    if count == 0:
-        return None
-
-    # Hash déterministe basé sur la date
-    hash_int = int(hashlib.md5(today.encode()).hexdigest(), 16)
-    index = hash_int % count
-    return queryset[index]
+    mood_filter = get_mood_tag(user) if user else None
+    return get_quote_index().daily_quote(localdate(), mood_filter)
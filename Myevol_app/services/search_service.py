@@ -0,0 +1,253 @@
+# services/search_service.py
+
+import logging
+import re
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import F
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from ..models.journal_model import JournalEntry
+
+logger = logging.getLogger(__name__)
+
+# Recherche plein texte dans le journal, derrière une interface de backend :
+# - PostgresSearchBackend : colonne `search_vector` (tsvector, index GIN), racinisation
+#   française, classement par ts_rank et extraits surlignés par ts_headline ;
+# - SQLiteFTSSearchBackend : table virtuelle FTS5 (index inversé local), pour les tests
+#   et les déploiements mono-nœud.
+#
+# L'index est tenu à jour entrée par entrée (voir `signals/search_signals.py`) ;
+# la commande `rebuild_search_index` le reconstruit entièrement.
+# Le backend est choisi d'après la base, ou forcé via settings.MYEVOL_SEARCH_BACKEND
+# (chemin pointé vers une classe).
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+FTS_TABLE = "myevol_journal_fts"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchBackend(ABC):
+    """
+    Interface d'un backend de recherche du journal.
+
+    `search` retourne un objet paginable (slicing + `count()`) d'entrées portant
+    les attributs `search_rank` et `search_highlight`.
+    """
+
+    @abstractmethod
+    def index_entry(self, entry):
+        """Indexe (ou réindexe) une entrée après sa création ou sa modification."""
+
+    @abstractmethod
+    def remove_entry(self, entry):
+        """Retire une entrée supprimée de l'index."""
+
+    @abstractmethod
+    def rebuild(self, queryset=None):
+        """Reconstruit l'index pour les entrées données (toutes par défaut). Retourne le nombre d'entrées."""
+
+    @abstractmethod
+    def filter(self, queryset, query):
+        """Restreint un queryset d'entrées à celles correspondant à la requête (sans classement)."""
+
+    @abstractmethod
+    def search(self, user, query):
+        """Entrées de l'utilisateur correspondant à la requête, classées par pertinence."""
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Recherche via la colonne tsvector `JournalEntry.search_vector` (configuration "french")."""
+
+    config = "french"
+
+    def _vector(self):
+        return (
+            SearchVector("content", weight="A", config=self.config)
+            + SearchVector("category", weight="B", config=self.config)
+        )
+
+    def _query(self, query):
+        return SearchQuery(query, config=self.config, search_type="websearch")
+
+    def index_entry(self, entry):
+        JournalEntry.objects.filter(pk=entry.pk).update(search_vector=self._vector())
+
+    def remove_entry(self, entry):
+        # La ligne supprimée emporte son tsvector
+        pass
+
+    def rebuild(self, queryset=None):
+        queryset = JournalEntry.objects.all() if queryset is None else queryset
+        return queryset.update(search_vector=self._vector())
+
+    def filter(self, queryset, query):
+        return queryset.filter(search_vector=self._query(query))
+
+    def search(self, user, query):
+        search_query = self._query(query)
+        return (
+            JournalEntry.objects.filter(user=user, search_vector=search_query)
+            .annotate(
+                search_rank=SearchRank(F("search_vector"), search_query),
+                search_highlight=SearchHeadline(
+                    "content", search_query, config=self.config,
+                    start_sel=HIGHLIGHT_START, stop_sel=HIGHLIGHT_STOP, max_fragments=2,
+                ),
+            )
+            .order_by("-search_rank", "-created_at", "-id")
+        )
+
+
+class SQLiteFTSSearchBackend(SearchBackend):
+    """
+    Recherche via une table FTS5 (créée par la migration 0005) : une ligne par entrée,
+    rowid = identifiant de l'entrée. Les accents sont ignorés et chaque terme est
+    recherché en préfixe.
+    """
+
+    def index_entry(self, entry):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [entry.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, content, category, user_id) VALUES (%s, %s, %s, %s)",
+                [entry.pk, entry.content, entry.category, entry.user_id],
+            )
+
+    def remove_entry(self, entry):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [entry.pk])
+
+    def rebuild(self, queryset=None):
+        full_rebuild = queryset is None
+        queryset = JournalEntry.objects.all() if full_rebuild else queryset
+        rows = list(queryset.order_by().values_list("pk", "content", "category", "user_id"))
+        with connection.cursor() as cursor:
+            if full_rebuild:
+                cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            else:
+                cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(row[0],) for row in rows])
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, content, category, user_id) VALUES (%s, %s, %s, %s)", rows
+            )
+        return len(rows)
+
+    @staticmethod
+    def match_expression(query):
+        """
+        Convertit la saisie de l'utilisateur en expression MATCH FTS5 : chaque mot est
+        cité (la syntaxe FTS5 n'est pas exposée) et recherché en préfixe.
+        """
+        terms = _TERM_RE.findall(query)
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def filter(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return queryset.none()
+        return queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        )
+
+    def search(self, user, query):
+        return SQLiteSearchResults(user.pk, self.match_expression(query))
+
+
+class SQLiteSearchResults:
+    """
+    Résultats FTS5 paginables : `count()` et le découpage n'exécutent que la requête
+    nécessaire à la page (LIMIT / OFFSET sur l'index, puis chargement des entrées).
+    """
+
+    def __init__(self, user_id, match):
+        self.user_id = user_id
+        self.match = match
+
+    def count(self):
+        if not self.match:
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND user_id = %s",
+                [self.match, self.user_id],
+            )
+            return cursor.fetchone()[0]
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            return self[key:key + 1][0]
+        if not self.match:
+            return []
+        start = key.start or 0
+        limit = -1 if key.stop is None else max(key.stop - start, 0)
+
+        # bm25() est négatif : les meilleurs résultats ont la valeur la plus basse
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid, -bm25({FTS_TABLE}), "
+                f"snippet({FTS_TABLE}, 0, %s, %s, '…', 16) "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND user_id = %s "
+                f"ORDER BY bm25({FTS_TABLE}), rowid DESC LIMIT %s OFFSET %s",
+                [HIGHLIGHT_START, HIGHLIGHT_STOP, self.match, self.user_id, limit, start],
+            )
+            hits = cursor.fetchall()
+
+        entries = JournalEntry.objects.in_bulk([entry_id for entry_id, _, _ in hits])
+        results = []
+        for entry_id, rank, highlight in hits:
+            entry = entries.get(entry_id)
+            if entry is None:
+                continue
+            entry.search_rank = rank
+            entry.search_highlight = highlight
+            results.append(entry)
+        return results
+
+
+BACKENDS_BY_VENDOR = {
+    "postgresql": PostgresSearchBackend,
+    "sqlite": SQLiteFTSSearchBackend,
+}
+
+
+def get_search_backend():
+    """
+    Retourne le backend de recherche configuré (MYEVOL_SEARCH_BACKEND) ou celui
+    correspondant à la base de données.
+    """
+    path = getattr(settings, "MYEVOL_SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+
+    backend_class = BACKENDS_BY_VENDOR.get(connection.vendor)
+    if backend_class is None:
+        raise ImproperlyConfigured(
+            f"Aucun backend de recherche pour la base '{connection.vendor}' : définissez MYEVOL_SEARCH_BACKEND."
+        )
+    return backend_class()
+
+
+def search_entries(user, query):
+    """
+    Recherche plein texte dans les entrées d'un utilisateur.
+
+    Args:
+        user (User): Propriétaire des entrées
+        query (str): Texte saisi
+
+    Returns:
+        Résultats paginables (queryset ou équivalent), classés par pertinence ; chaque entrée
+        porte `search_rank` et `search_highlight` (extrait avec les termes entre <mark>).
+    """
+    return get_search_backend().search(user, query)
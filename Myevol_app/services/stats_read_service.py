@@ -0,0 +1,81 @@
+# services/stats_read_service.py
+
+import logging
+
+from django.db.models import Count
+from django.utils.timezone import now
+
+from ..models.stats_model import AnnualStat
+from .stats_service import BULK_PERIODS, compute_stats_for_period, is_stats_dirty
+
+logger = logging.getLogger(__name__)
+
+# Modèle de lecture des statistiques (/api/stats/overview/, /api/stats/categories/).
+# Les cumuls stockés sont tenus à jour à chaque écriture par `apply_entry_delta` :
+# une lecture se contente de les servir. Ce module n'émet que des SELECT, ce qui permet
+# de router ces endpoints vers un réplica en lecture seule.
+#
+# - Ligne présente : servie telle quelle.
+# - Ligne absente : aucune entrée sur la période, une statistique vide est retournée.
+# - Utilisateur marqué obsolète (voir `stats_service.mark_stats_dirty`) : la période est
+#   recalculée en mémoire, sans être enregistrée ; la reconstruction est laissée à la tâche
+#   `refresh_user_stats`.
+
+
+def get_period_stat(user, period, reference_date=None):
+    """
+    Retourne la statistique d'une période sans jamais écrire en base.
+
+    Args:
+        user (User): L'utilisateur concerné
+        period (str): "daily", "weekly", "monthly" ou "annual"
+        reference_date (date, optional): Date contenue dans la période. Aujourd'hui par défaut.
+
+    Returns:
+        DailyStat | WeeklyStat | MonthlyStat | AnnualStat: instance stockée, ou instance
+        non enregistrée construite en mémoire
+    """
+    model, period_field, bounds = BULK_PERIODS[period]
+    start, end = bounds(reference_date or now().date())
+
+    stat = model.objects.filter(user=user, **{period_field: start}).first()
+    if not is_stats_dirty(user.pk):
+        if stat is not None:
+            return stat
+        return model(user=user, entries_count=0, mood_average=None, mood_sum=0, categories={},
+                     **{period_field: start})
+
+    logger.debug(f"[STATS] Recalcul en mémoire ({period}, {start}) pour {user.username}")
+    return model(
+        pk=stat.pk if stat is not None else None,
+        user=user,
+        **{period_field: start},
+        **compute_stats_for_period(user, start, end),
+    )
+
+
+def get_all_time_categories(user):
+    """
+    Répartition des entrées par catégorie sur tout l'historique.
+
+    Lue dans les statistiques annuelles, ou directement dans les entrées si l'utilisateur
+    est marqué obsolète.
+
+    Returns:
+        tuple: (total des entrées, {catégorie: nombre})
+    """
+    if is_stats_dirty(user.pk):
+        categories = dict(
+            user.entries.order_by().values("category").annotate(count=Count("id")).values_list("category", "count")
+        )
+        return sum(categories.values()), categories
+
+    total_entries = 0
+    categories = {}
+    for entries_count, stat_categories in AnnualStat.objects.filter(user=user).values_list(
+        "entries_count", "categories"
+    ):
+        total_entries += entries_count
+        for category, count in (stat_categories or {}).items():
+            categories[category] = categories.get(category, 0) + count
+    return total_entries, categories
@@ -1,12 +1,66 @@
 import logging
-from collections import defaultdict
+import time
 from datetime import timedelta
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Count, F, Sum
 from django.utils.timezone import now
+from ..models.journal_model import JournalEntry
 from ..models.stats_model import WeeklyStat, MonthlyStat, AnnualStat, DailyStat
 
 logger = logging.getLogger(__name__)
 
+# Marqueur "statistiques obsolètes" d'un utilisateur : posé quand un cumul incrémental
+# échoue (ou par un chemin d'écriture qui contourne les signaux). Tant qu'il est présent,
+# les lectures recalculent les périodes en mémoire ; une reconstruction complète le retire.
+STATS_DIRTY_KEY = "stats_dirty_{user_id}"
+
+
+def week_bounds(reference_date):
+    """Retourne (lundi, dimanche) de la semaine contenant la date."""
+    week_start = reference_date - timedelta(days=reference_date.weekday())
+    return week_start, week_start + timedelta(days=6)
+
+
+def month_bounds(reference_date):
+    """Retourne (premier jour, dernier jour) du mois contenant la date."""
+    month_start = reference_date.replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return month_start, next_month - timedelta(days=1)
+
+
+def year_bounds(reference_date):
+    """Retourne (1er janvier, 31 décembre) de l'année contenant la date."""
+    year_start = reference_date.replace(month=1, day=1)
+    return year_start, year_start.replace(month=12, day=31)
+
+
+def _day_bounds(reference_date):
+    return reference_date, reference_date
+
+
+BULK_PERIODS = {
+    "daily": (DailyStat, "date", _day_bounds),
+    "weekly": (WeeklyStat, "week_start", week_bounds),
+    "monthly": (MonthlyStat, "month_start", month_bounds),
+    "annual": (AnnualStat, "year_start", year_bounds),
+}
+
+
+def rollup_periods(day):
+    """
+    Liste les lignes de statistiques touchées par une entrée du jour donné.
+
+    Returns:
+        list[tuple]: (modèle, champ de période, début, fin) pour le jour, la semaine, le mois et l'année
+    """
+    return [
+        (DailyStat, "date", day, day),
+        (WeeklyStat, "week_start", *week_bounds(day)),
+        (MonthlyStat, "month_start", *month_bounds(day)),
+        (AnnualStat, "year_start", *year_bounds(day)),
+    ]
+
 
 def generate_weekly_stats(user, reference_date=None):
     """
@@ -21,26 +75,12 @@ def generate_weekly_stats(user, reference_date=None):
         WeeklyStat: Statistique hebdomadaire créée ou mise à jour
     """
     reference_date = reference_date or now().date()
-    week_start = reference_date - timedelta(days=reference_date.weekday())
-    week_end = week_start + timedelta(days=6)
-
-    entries = user.entries.filter(created_at__date__range=(week_start, week_end))
-    entries_count = entries.count()
-    mood_avg = entries.aggregate(avg=Avg("mood"))["avg"]
-    mood_avg = round(mood_avg, 1) if mood_avg is not None else None
-
-    categories = defaultdict(int)
-    for entry in entries:
-        categories[entry.category] += 1
+    week_start, week_end = week_bounds(reference_date)
 
     stat, created = WeeklyStat.objects.update_or_create(
         user=user,
         week_start=week_start,
-        defaults={
-            "entries_count": entries_count,
-            "mood_average": mood_avg,
-            "categories": dict(categories),
-        }
+        defaults=compute_stats_for_period(user, week_start, week_end)
     )
 
     if created:
@@ -63,23 +103,10 @@ def generate_daily_stats(user, date=None):
         DailyStat: Statistique journalière créée ou mise à jour
     """
     date = date or now().date()
-    entries = user.entries.filter(created_at__date=date)
-    entries_count = entries.count()
-    mood_avg = entries.aggregate(avg=Avg("mood"))["avg"]
-    mood_avg = round(mood_avg, 1) if mood_avg is not None else None
-
-    categories = defaultdict(int)
-    for entry in entries:
-        categories[entry.category] += 1
-
     stat, created = DailyStat.objects.update_or_create(
         user=user,
         date=date,
-        defaults={
-            "entries_count": entries_count,
-            "mood_average": mood_avg,
-            "categories": dict(categories),
-        }
+        defaults=compute_stats_for_period(user, date, date)
     )
 
     if created:
@@ -102,27 +129,12 @@ def generate_monthly_stats(user, reference_date=None):
         MonthlyStat: Statistique mensuelle créée ou mise à jour
     """
     reference_date = reference_date or now().date()
-    month_start = reference_date.replace(day=1)
-    next_month = (month_start + timedelta(days=32)).replace(day=1)
-    month_end = next_month - timedelta(days=1)
-
-    entries = user.entries.filter(created_at__date__range=(month_start, month_end))
-    entries_count = entries.count()
-    mood_avg = entries.aggregate(avg=Avg("mood"))["avg"]
-    mood_avg = round(mood_avg, 1) if mood_avg is not None else None
-
-    categories = defaultdict(int)
-    for entry in entries:
-        categories[entry.category] += 1
+    month_start, month_end = month_bounds(reference_date)
 
     stat, created = MonthlyStat.objects.update_or_create(
         user=user,
         month_start=month_start,
-        defaults={
-            "entries_count": entries_count,
-            "mood_average": mood_avg,
-            "categories": dict(categories),
-        }
+        defaults=compute_stats_for_period(user, month_start, month_end)
     )
 
     if created:
@@ -145,26 +157,12 @@ def generate_annual_stats(user, reference_date=None):
         AnnualStat: Statistique annuelle créée ou mise à jour
     """
     reference_date = reference_date or now().date()
-    year_start = reference_date.replace(month=1, day=1)
-    year_end = year_start.replace(month=12, day=31)
-
-    entries = user.entries.filter(created_at__date__range=(year_start, year_end))
-    entries_count = entries.count()
-    mood_avg = entries.aggregate(avg=Avg("mood"))["avg"]
-    mood_avg = round(mood_avg, 1) if mood_avg is not None else None
-
-    categories = defaultdict(int)
-    for entry in entries:
-        categories[entry.category] += 1
+    year_start, year_end = year_bounds(reference_date)
 
     stat, created = AnnualStat.objects.update_or_create(
         user=user,
         year_start=year_start,
-        defaults={
-            "entries_count": entries_count,
-            "mood_average": mood_avg,
-            "categories": dict(categories),
-        }
+        defaults=compute_stats_for_period(user, year_start, year_end)
     )
 
     if created:
@@ -178,7 +176,10 @@ def generate_annual_stats(user, reference_date=None):
 def compute_stats_for_period(user, start_date, end_date):
     """
     Calcule les statistiques générales (nombre d'entrées, moyenne des humeurs, répartition des catégories)
-    pour une période donnée.
+    pour une période donnée, à partir de toutes les entrées de la période.
+
+    C'est le chemin de reconstruction complète : les écritures courantes passent par
+    `apply_entry_delta`, dont le coût ne dépend pas de l'historique.
 
     Args:
         user (User): L'utilisateur pour lequel calculer les statistiques
@@ -186,20 +187,249 @@ def compute_stats_for_period(user, start_date, end_date):
         end_date (date): Fin de la période
 
     Returns:
-        dict: Dictionnaire contenant entries_count, mood_average, categories
+        dict: Dictionnaire contenant entries_count, mood_average, mood_sum, categories
     """
     entries = user.entries.filter(created_at__date__range=(start_date, end_date))
     entries_count = entries.count()
 
-    mood_avg = entries.aggregate(avg=Avg("mood"))["avg"]
+    aggregates = entries.aggregate(avg=Avg("mood"), total=Sum("mood"))
+    mood_avg = aggregates["avg"]
     mood_avg = round(mood_avg, 1) if mood_avg is not None else None
 
-    categories = defaultdict(int)
-    for entry in entries:
-        categories[entry.category] += 1
+    categories = dict(
+        entries.order_by().values("category").annotate(count=Count("id")).values_list("category", "count")
+    )
 
     return {
         "entries_count": entries_count,
         "mood_average": mood_avg,
-        "categories": dict(categories),
+        "mood_sum": aggregates.get("total") or 0,
+        "categories": categories,
     }
+
+
+def apply_entry_delta(user, day, mood, category, sign=1):
+    """
+    Applique l'ajout (sign=1) ou le retrait (sign=-1) d'une entrée aux statistiques
+    journalières, hebdomadaires, mensuelles et annuelles concernées.
+
+    Chaque ligne est verrouillée puis mise à jour par expressions F() : le coût est
+    constant, quel que soit l'historique de l'utilisateur. Une ligne absente ou
+    antérieure aux cumuls (mood_sum vide) est reconstruite une seule fois.
+
+    Args:
+        user (User): Propriétaire de l'entrée
+        day (date): Jour (heure locale) de l'entrée
+        mood (int): Humeur de l'entrée
+        category (str): Catégorie de l'entrée
+        sign (int): 1 pour une création, -1 pour une suppression
+    """
+    with transaction.atomic():
+        for model, period_field, start, end in rollup_periods(day):
+            _apply_period_delta(model, user, {period_field: start}, start, end, mood, category, sign)
+
+
+def _apply_period_delta(model, user, lookup, start, end, mood, category, sign):
+    stat = model.objects.select_for_update().filter(user=user, **lookup).first()
+
+    if stat is None:
+        if sign < 0:
+            return
+        try:
+            # L'entrée est déjà enregistrée : la reconstruction l'inclut
+            with transaction.atomic():
+                model.objects.create(user=user, **lookup, **compute_stats_for_period(user, start, end))
+            return
+        except IntegrityError:
+            # Ligne créée en parallèle, sans notre entrée : on applique le delta
+            stat = model.objects.select_for_update().get(user=user, **lookup)
+
+    if stat.mood_sum is None:
+        model.objects.filter(pk=stat.pk).update(**compute_stats_for_period(user, start, end))
+        return
+
+    count = stat.entries_count + sign
+    mood_sum = stat.mood_sum + sign * mood
+    categories = dict(stat.categories or {})
+    categories[category] = categories.get(category, 0) + sign
+    if categories[category] <= 0:
+        del categories[category]
+
+    model.objects.filter(pk=stat.pk).update(
+        entries_count=F("entries_count") + sign,
+        mood_sum=F("mood_sum") + sign * mood,
+        mood_average=round(mood_sum / count, 1) if count > 0 else None,
+        categories=categories,
+    )
+
+
+def is_stats_dirty(user_id):
+    """Indique si les statistiques stockées de l'utilisateur sont marquées obsolètes."""
+    return cache.get(STATS_DIRTY_KEY.format(user_id=user_id)) is not None
+
+
+def mark_stats_dirty(user_id):
+    """
+    Marque les statistiques stockées de l'utilisateur comme obsolètes et planifie leur
+    reconstruction (après validation de la transaction, sauf en mode synchrone).
+    """
+    from .journal_pipeline_service import pipeline_is_sync
+
+    cache.set(STATS_DIRTY_KEY.format(user_id=user_id), time.time_ns(), timeout=None)
+    logger.warning(f"[STATS] Statistiques marquées obsolètes pour l'utilisateur {user_id}")
+    if pipeline_is_sync():
+        return
+
+    def enqueue():
+        from ..tasks import refresh_user_stats
+        refresh_user_stats.delay(user_id)
+
+    transaction.on_commit(enqueue)
+
+
+def clear_stats_dirty(user_id, marker=None):
+    """
+    Retire le marqueur d'obsolescence.
+
+    Args:
+        user_id (int): Identifiant de l'utilisateur
+        marker (int, optional): Valeur lue avant la reconstruction ; si le marqueur a été
+            reposé entre-temps, il est conservé.
+    """
+    key = STATS_DIRTY_KEY.format(user_id=user_id)
+    if marker is None or cache.get(key) == marker:
+        cache.delete(key)
+
+
+def refresh_user_stats(user):
+    """Reconstruit les statistiques d'un utilisateur marqué obsolète et retire le marqueur."""
+    marker = cache.get(STATS_DIRTY_KEY.format(user_id=user.pk))
+    rows = rebuild_user_stats(user, clear_dirty=False)
+    clear_stats_dirty(user.pk, marker)
+    return rows
+
+
+def rebuild_user_stats(user, days=None, clear_dirty=True):
+    """
+    Reconstruit entièrement les statistiques d'un utilisateur (réparation).
+
+    Les lignes des périodes qui n'ont plus aucune entrée sont supprimées : toutes celles
+    de l'utilisateur hors des périodes reconstruites pour une reconstruction complète,
+    celles des périodes examinées sinon.
+
+    Args:
+        user (User): L'utilisateur concerné
+        days (iterable[date], optional): Jours à reconstruire. Par défaut, tous les jours ayant des entrées.
+        clear_dirty (bool): Retirer le marqueur d'obsolescence après une reconstruction complète
+
+    Returns:
+        int: Nombre de lignes de statistiques reconstruites
+    """
+    full_rebuild = days is None
+    if full_rebuild:
+        days = user.entries.dates("created_at", "day")
+
+    rebuilt, seen, deleted = set(), set(), 0
+    for day in days:
+        for model, period_field, start, end in rollup_periods(day):
+            if (model, start) in seen:
+                continue
+            seen.add((model, start))
+            stats = compute_stats_for_period(user, start, end)
+            if not stats["entries_count"]:
+                deleted += model.objects.filter(user=user, **{period_field: start}).delete()[0]
+                continue
+            model.objects.update_or_create(user=user, **{period_field: start}, defaults=stats)
+            rebuilt.add((model, start))
+
+    if full_rebuild:
+        for model, period_field, _, _ in rollup_periods(now().date()):
+            kept = [start for rebuilt_model, start in rebuilt if rebuilt_model is model]
+            deleted += model.objects.filter(user=user).exclude(**{f"{period_field}__in": kept}).delete()[0]
+        if clear_dirty:
+            clear_stats_dirty(user.pk)
+    logger.info(
+        f"🛠️ Stats reconstruites pour {user.username} - {len(rebuilt)} ligne(s), {deleted} supprimée(s)"
+    )
+    return len(rebuilt)
+
+
+def bulk_generate_stats(period, reference_date=None, batch_size=1000):
+    """
+    Génère les statistiques d'une période pour tous les utilisateurs en une seule passe.
+
+    Un unique GROUP BY (utilisateur, catégorie) parcourt les entrées de la période ;
+    les lignes obtenues sont écrites par lots avec `bulk_create(update_conflicts=True)`.
+    Seuls les utilisateurs ayant au moins une entrée sur la période sont concernés.
+
+    Args:
+        period (str): "daily", "weekly", "monthly" ou "annual"
+        reference_date (date, optional): Date servant à identifier la période. Aujourd'hui par défaut.
+        batch_size (int): Nombre de lignes écrites par requête
+
+    Returns:
+        dict: rows (lignes écrites), duration (secondes), rate (lignes/seconde)
+    """
+    model, period_field, bounds = BULK_PERIODS[period]
+    reference_date = reference_date or now().date()
+    start, end = bounds(reference_date)
+    started = time.monotonic()
+
+    groups = (
+        JournalEntry.objects
+        .filter(created_at__date__range=(start, end))
+        .order_by("user_id")
+        .values("user_id", "category")
+        .annotate(count=Count("id"), mood_total=Sum("mood"))
+        .values_list("user_id", "category", "count", "mood_total")
+    )
+
+    rows = 0
+    batch = []
+    current_user, current = None, None
+
+    def build_row(user_id, totals):
+        count, mood_sum = totals["count"], totals["mood_sum"]
+        return model(
+            user_id=user_id,
+            entries_count=count,
+            mood_sum=mood_sum,
+            mood_average=round(mood_sum / count, 1) if count else None,
+            categories=totals["categories"],
+            **{period_field: start},
+        )
+
+    def flush():
+        model.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=["user", period_field],
+            update_fields=["entries_count", "mood_sum", "mood_average", "categories"],
+        )
+        batch.clear()
+
+    for user_id, category, count, mood_total in groups.iterator(chunk_size=batch_size):
+        if user_id != current_user:
+            if current_user is not None:
+                batch.append(build_row(current_user, current))
+                if len(batch) >= batch_size:
+                    rows += len(batch)
+                    flush()
+            current_user, current = user_id, {"count": 0, "mood_sum": 0, "categories": {}}
+        current["count"] += count
+        current["mood_sum"] += mood_total or 0
+        current["categories"][category] = count
+
+    if current_user is not None:
+        batch.append(build_row(current_user, current))
+    if batch:
+        rows += len(batch)
+        flush()
+
+    duration = time.monotonic() - started
+    rate = rows / duration if duration > 0 else float(rows)
+    logger.info(
+        f"📊 Stats {period} générées en masse ({start} → {end}) : "
+        f"{rows} ligne(s) en {duration:.2f}s ({rate:.0f} lignes/s)"
+    )
+    return {"rows": rows, "duration": duration, "rate": rate}
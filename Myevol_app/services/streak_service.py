@@ -1,5 +1,232 @@
 # services/streak_service.py
 
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import TruncDate
+from django.utils.timezone import localdate
+
+logger = logging.getLogger(__name__)
+
+# Les jours actifs d'un utilisateur sont stockés sur sa ligne sous forme de bitmap :
+# le bit i correspond au jour `activity_origin + i`. Les séries se lisent donc sans
+# aucune requête, et chaque écriture ne modifie qu'un bit.
+
+
+def bitmap_to_int(raw):
+    """Convertit le contenu binaire stocké en entier (bit i = jour origin + i)."""
+    return int.from_bytes(bytes(raw or b""), "little")
+
+
+def int_to_bitmap(value):
+    """Convertit l'entier des jours actifs en octets à stocker."""
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+def streak_ending_at(value, origin, day):
+    """
+    Longueur de la série de jours actifs consécutifs se terminant au jour donné.
+
+    Args:
+        value (int): Bitmap des jours actifs
+        origin (date): Jour du bit 0
+        day (date): Dernier jour de la série
+
+    Returns:
+        int: 0 si le jour n'est pas actif
+    """
+    if origin is None or day < origin:
+        return 0
+    index = (day - origin).days
+    if not (value >> index) & 1:
+        return 0
+    mask = (1 << (index + 1)) - 1
+    gaps = ~value & mask
+    if not gaps:
+        return index + 1
+    return index - (gaps.bit_length() - 1)
+
+
+def longest_run(value):
+    """Plus longue suite de bits à 1 (plus longue série de jours actifs)."""
+    if not value:
+        return 0
+    return max(len(run) for run in bin(value)[2:].split("0"))
+
+
+def set_day(value, origin, day, active=True):
+    """
+    Active ou désactive un jour dans le bitmap, en décalant l'origine si besoin.
+
+    Returns:
+        tuple: (nouveau bitmap, nouvelle origine)
+    """
+    if origin is None:
+        origin = day
+    if day < origin:
+        if not active:
+            return value, origin
+        value <<= (origin - day).days
+        origin = day
+    index = (day - origin).days
+    if active:
+        value |= 1 << index
+    else:
+        value &= ~(1 << index)
+    return value, origin
+
+
+def _user_model():
+    return apps.get_model(settings.AUTH_USER_MODEL)
+
+
+def build_activity(user_id):
+    """
+    Reconstruit le bitmap d'un utilisateur à partir de ses entrées (une requête).
+
+    Returns:
+        tuple: (bitmap, origine)
+    """
+    JournalEntry = apps.get_model("Myevol_app", "JournalEntry")
+    days = (
+        JournalEntry.objects.filter(user_id=user_id)
+        .annotate(day=TruncDate("created_at"))
+        .order_by("day")
+        .values_list("day", flat=True)
+        .distinct()
+    )
+    value, origin = 0, None
+    for day in days:
+        value, origin = set_day(value, origin, day)
+    return value, origin or localdate()
+
+
+def get_activity(user):
+    """
+    Retourne (bitmap, origine) pour l'utilisateur, sans requête une fois le bitmap initialisé.
+
+    Le bitmap est initialisé à la création du compte (ou par la migration 0011 pour les
+    comptes existants). À défaut, il est reconstruit en mémoire seulement : la lecture
+    n'écrit jamais en base, la prochaine entrée (record_activity) l'enregistre.
+    """
+    if user.pk is None:
+        return 0, None
+    if user.activity_origin is None:
+        value, origin = build_activity(user.pk)
+        user.activity_bitmap = int_to_bitmap(value)
+        user.activity_origin = origin
+        return value, origin
+    return bitmap_to_int(user.activity_bitmap), user.activity_origin
+
+
+def _save_activity(user, value, origin, longest):
+    _user_model().objects.filter(pk=user.pk).update(
+        activity_bitmap=int_to_bitmap(value),
+        activity_origin=origin,
+        longest_streak=longest,
+    )
+    user.activity_bitmap = int_to_bitmap(value)
+    user.activity_origin = origin
+    user.longest_streak = longest
+
+
+def record_activity(user, day, active=True):
+    """
+    Marque un jour comme actif (création d'entrée) ou inactif (plus aucune entrée ce jour-là),
+    et met à jour la plus longue série.
+
+    La ligne utilisateur est verrouillée pendant la mise à jour du bitmap.
+
+    Args:
+        user (User): L'utilisateur concerné (instance mise à jour en mémoire)
+        day (date): Jour local concerné
+        active (bool): True pour activer le jour, False pour le désactiver
+    """
+    with transaction.atomic():
+        row = (
+            _user_model().objects.select_for_update()
+            .filter(pk=user.pk)
+            .values("activity_bitmap", "activity_origin")
+            .first()
+        )
+        if row is None:
+            return
+
+        if row["activity_origin"] is None:
+            # Première écriture depuis la mise en place du bitmap : reconstruction complète
+            value, origin = build_activity(user.pk)
+        else:
+            value, origin = set_day(bitmap_to_int(row["activity_bitmap"]), row["activity_origin"], day, active)
+
+        _save_activity(user, value, origin, longest_run(value))
+
+
+def rebuild_all_activity(batch_size=1000):
+    """
+    Reconstruit le bitmap et la plus longue série de tous les utilisateurs.
+
+    Une seule requête parcourt les couples (utilisateur, jour actif) triés ; les
+    utilisateurs sont mis à jour par lots avec `bulk_update`.
+
+    Returns:
+        int: Nombre d'utilisateurs mis à jour
+    """
+    User = _user_model()
+    JournalEntry = apps.get_model("Myevol_app", "JournalEntry")
+    today = localdate()
+
+    pairs = (
+        JournalEntry.objects
+        .annotate(day=TruncDate("created_at"))
+        .order_by("user_id", "day")
+        .values_list("user_id", "day")
+        .distinct()
+    )
+
+    updated = 0
+    batch = []
+    fields = ["activity_bitmap", "activity_origin", "longest_streak"]
+
+    def flush():
+        User.objects.bulk_update(batch, fields)
+        batch.clear()
+
+    def push(user_id, value, origin):
+        nonlocal updated
+        batch.append(User(
+            pk=user_id,
+            activity_bitmap=int_to_bitmap(value),
+            activity_origin=origin,
+            longest_streak=longest_run(value),
+        ))
+        updated += 1
+        if len(batch) >= batch_size:
+            flush()
+
+    current_user, value, origin = None, 0, None
+    for user_id, day in pairs.iterator(chunk_size=batch_size):
+        if user_id != current_user:
+            if current_user is not None:
+                push(current_user, value, origin)
+            current_user, value, origin = user_id, 0, None
+        value, origin = set_day(value, origin, day)
+
+    if current_user is not None:
+        push(current_user, value, origin)
+    if batch:
+        flush()
+
+    # Utilisateurs sans entrée : bitmap vide
+    updated += User.objects.exclude(entries__isnull=False).update(
+        activity_bitmap=b"", activity_origin=today, longest_streak=0
+    )
+
+    logger.info(f"🔥 Séries recalculées pour {updated} utilisateur(s)")
+    return updated
+
+
 def update_user_streak(user):
     current = user.current_streak()
     if current > user.longest_streak:
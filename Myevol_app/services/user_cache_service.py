@@ -0,0 +1,224 @@
+# services/user_cache_service.py
+
+import hashlib
+import inspect
+import logging
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.timezone import localdate
+
+logger = logging.getLogger(__name__)
+
+# Cache des métriques dérivées d'un utilisateur (moyennes d'humeur, catégories, niveau...).
+# La série actuelle n'y figure pas : elle est déjà lue sans requête dans le bitmap.
+#
+# Chaque clé contient la "génération" courante de l'utilisateur. Toute écriture d'une
+# entrée, d'un objectif ou d'un badge incrémente cette génération (voir
+# `signals/user_cache_signals.py`) : toutes les valeurs précédentes deviennent
+# inaccessibles d'un coup, quels que soient leurs arguments, et expirent via leur TTL.
+
+KEY_PREFIX = "user_cache"
+
+# Durée de vie par défaut (secondes) de chaque espace de noms.
+# Surchargeable via settings.MYEVOL_USER_CACHE_TTLS = {"mood_average": 60, ...}
+DEFAULT_TTLS = {
+    "entries_today": 600,
+    "mood_average": 300,
+    "entries_by_category": 300,
+    "level": 600,
+    "level_progress": 600,
+    "calendar": 3600,
+    "journal_stats": 600,
+    "quote_mood_tag": 3600,
+}
+DEFAULT_TTL = 300
+
+
+def get_ttl(namespace):
+    """Retourne la durée de vie configurée pour un espace de noms."""
+    overrides = getattr(settings, "MYEVOL_USER_CACHE_TTLS", {})
+    return overrides.get(namespace, DEFAULT_TTLS.get(namespace, DEFAULT_TTL))
+
+
+def generation_key(user_id):
+    return f"{KEY_PREFIX}:{user_id}:generation"
+
+
+def get_generation(user_id):
+    """
+    Retourne la génération courante du cache d'un utilisateur.
+
+    Une génération absente (ou évincée) est initialisée à partir de l'horloge, pour ne
+    jamais réutiliser une génération déjà servie.
+    """
+    generation = cache.get(generation_key(user_id))
+    if generation is None:
+        generation = time.time_ns()
+        if not cache.add(generation_key(user_id), generation, timeout=None):
+            generation = cache.get(generation_key(user_id), generation)
+    return generation
+
+
+def modified_key(user_id):
+    return f"{KEY_PREFIX}:{user_id}:modified"
+
+
+def get_modified(user_id):
+    """
+    Retourne le timestamp (secondes) du dernier incrément de génération d'un utilisateur.
+
+    Un horodatage absent (ou évincé) est initialisé à l'instant présent : une date trop
+    récente ne fait que servir un 200 de plus, jamais un 304 obsolète.
+    """
+    modified = cache.get(modified_key(user_id))
+    if modified is None:
+        modified = int(time.time())
+        if not cache.add(modified_key(user_id), modified, timeout=None):
+            modified = cache.get(modified_key(user_id), modified)
+    return modified
+
+
+def bump_generation(user_id):
+    """Invalide toutes les valeurs en cache d'un utilisateur."""
+    try:
+        cache.incr(generation_key(user_id))
+    except ValueError:
+        cache.add(generation_key(user_id), time.time_ns(), timeout=None)
+    cache.set(modified_key(user_id), int(time.time()), timeout=None)
+
+
+def make_key(namespace, user_id, generation, arguments=""):
+    """
+    Construit une clé namespacée : préfixe, utilisateur, génération, espace de noms, jour,
+    puis empreinte des arguments.
+    """
+    digest = hashlib.md5(arguments.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{user_id}:{generation}:{namespace}:{localdate().isoformat()}:{digest}"
+
+
+def _stats_key(namespace, outcome):
+    return f"{KEY_PREFIX}:stats:{namespace}:{outcome}"
+
+
+def _record(namespace, outcome):
+    key = _stats_key(namespace, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_stats():
+    """
+    Compteurs de succès / échecs du cache par espace de noms (monitoring).
+
+    Returns:
+        dict: {namespace: {"hits": int, "misses": int, "hit_rate": float}}
+    """
+    namespaces = sorted(set(DEFAULT_TTLS) | set(getattr(settings, "MYEVOL_USER_CACHE_TTLS", {})))
+    keys = [_stats_key(ns, outcome) for ns in namespaces for outcome in ("hits", "misses")]
+    values = cache.get_many(keys)
+
+    stats = {}
+    for namespace in namespaces:
+        hits = values.get(_stats_key(namespace, "hits"), 0)
+        misses = values.get(_stats_key(namespace, "misses"), 0)
+        total = hits + misses
+        stats[namespace] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total * 100, 1) if total else 0.0,
+        }
+    return stats
+
+
+def reset_stats():
+    """Remet à zéro les compteurs de succès / échecs."""
+    namespaces = set(DEFAULT_TTLS) | set(getattr(settings, "MYEVOL_USER_CACHE_TTLS", {}))
+    cache.delete_many([_stats_key(ns, outcome) for ns in namespaces for outcome in ("hits", "misses")])
+
+
+def get_or_compute(user_id, namespace, compute, arguments=""):
+    """
+    Retourne la valeur en cache pour (utilisateur, espace de noms, arguments), ou la calcule.
+
+    Args:
+        user_id (int): Identifiant de l'utilisateur
+        namespace (str): Espace de noms de la métrique (clé de `DEFAULT_TTLS`)
+        compute (callable): Calcule la valeur en cas d'échec du cache
+        arguments (str): Représentation normalisée des arguments
+    """
+    key = make_key(namespace, user_id, get_generation(user_id), arguments)
+    sentinel = object()
+    value = cache.get(key, sentinel)
+    if value is not sentinel:
+        _record(namespace, "hits")
+        return value
+
+    _record(namespace, "misses")
+    value = compute()
+    cache.set(key, value, timeout=get_ttl(namespace))
+    return value
+
+
+def get_many_or_compute(user_id, namespace, arguments_list, compute_missing):
+    """
+    Variante groupée de `get_or_compute` : une lecture du cache pour toutes les valeurs,
+    puis un seul calcul pour l'ensemble des valeurs manquantes.
+
+    Args:
+        user_id (int): Identifiant de l'utilisateur
+        namespace (str): Espace de noms de la métrique
+        arguments_list (list[str]): Représentations normalisées des arguments
+        compute_missing (callable): Reçoit la liste des arguments manquants et
+            retourne {arguments: valeur}
+
+    Returns:
+        dict: {arguments: valeur} pour chaque élément de `arguments_list`
+    """
+    generation = get_generation(user_id)
+    keys = {arguments: make_key(namespace, user_id, generation, arguments) for arguments in arguments_list}
+    found = cache.get_many(list(keys.values()))
+
+    values, missing = {}, []
+    for arguments, key in keys.items():
+        if key in found:
+            _record(namespace, "hits")
+            values[arguments] = found[key]
+        else:
+            _record(namespace, "misses")
+            missing.append(arguments)
+
+    if missing:
+        computed = compute_missing(missing)
+        cache.set_many({keys[arguments]: computed[arguments] for arguments in missing}, timeout=get_ttl(namespace))
+        values.update(computed)
+    return values
+
+
+def cached_user_metric(namespace):
+    """
+    Décorateur de méthode d'utilisateur : met en cache son résultat dans `namespace`.
+
+    Les arguments sont normalisés (valeurs par défaut appliquées), de sorte que
+    `mood_average()` et `mood_average(days=7)` partagent la même entrée.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.pk is None:
+                return func(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = repr(sorted(
+                (name, value) for name, value in bound.arguments.items() if name != "self"
+            ))
+            return get_or_compute(self.pk, namespace, lambda: func(self, *args, **kwargs), arguments)
+        return wrapper
+    return decorator
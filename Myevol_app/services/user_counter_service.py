@@ -0,0 +1,208 @@
+# services/user_counter_service.py
+
+import logging
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+logger = logging.getLogger(__name__)
+
+# Compteurs dénormalisés sur la ligne utilisateur, lus sans requête :
+# - création / suppression / lecture d'une ligne isolée : UPDATE … SET compteur = compteur ± n
+#   (expression F(), atomique) depuis signals/user_counter_signals.py et Notification.delete() ;
+# - opérations de masse sur les notifications (update, delete) : variation F() calculée, dans
+#   le même UPDATE, à partir de la condition WHERE de l'opération (`shift_unread_for_update`,
+#   `shift_unread_for_delete`, appelées par `NotificationQuerySet`) ; bulk_create : variations
+#   par utilisateur ;
+# - `reconcile_counters` (tâche quotidienne) répare par lots toute dérive restante
+#   (écritures SQL directes, bulk_create d'entrées ou de badges...).
+
+UNREAD = Q(is_read=False, archived=False)
+UNREAD_COUNTER = "unread_notifications_count"
+
+COUNTERS = {
+    "entries_count": ("Myevol_app.JournalEntry", Q()),
+    "badges_count": ("Myevol_app.Badge", Q()),
+    UNREAD_COUNTER: ("Myevol_app.Notification", UNREAD),
+}
+
+
+def _user_model():
+    return apps.get_model(settings.AUTH_USER_MODEL)
+
+
+def count_expression(field):
+    """Sous-requête corrélée : valeur réelle du compteur pour l'utilisateur (OuterRef('pk'))."""
+    model_label, condition = COUNTERS[field]
+    rows = (
+        apps.get_model(model_label).objects.filter(condition, user=OuterRef("pk"))
+        .order_by()
+        .values("user")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+def _shifted(field, delta):
+    """Expression `compteur + delta`, bornée à 0 pour une décrémentation."""
+    expression = F(field) + delta
+    return expression if delta > 0 else Greatest(expression, Value(0))
+
+
+def increment(user, field, delta=1):
+    """
+    Ajoute `delta` (éventuellement négatif, borné à 0) au compteur d'un utilisateur.
+
+    Args:
+        user (User | int): Utilisateur ou identifiant ; une instance est mise à jour en mémoire
+        field (str): Nom du compteur (clé de COUNTERS)
+        delta (int): Variation
+    """
+    if not delta:
+        return
+    user_id = getattr(user, "pk", user)
+    _user_model().objects.filter(pk=user_id).update(**{field: _shifted(field, delta)})
+    if field in getattr(user, "__dict__", {}):
+        setattr(user, field, max(0, getattr(user, field) + delta))
+
+
+def increment_many(deltas, field):
+    """
+    Applique des variations par utilisateur ({user_id: delta}), une requête par valeur de delta.
+    """
+    by_delta = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(user_id)
+    for delta, user_ids in by_delta.items():
+        _user_model().objects.filter(pk__in=user_ids).update(**{field: _shifted(field, delta)})
+
+
+def _rows_per_user(rows):
+    """Sous-requête corrélée : nombre de lignes de `rows` appartenant à l'utilisateur (OuterRef('pk'))."""
+    counts = rows.filter(user=OuterRef("pk")).order_by().values("user").annotate(total=Count("pk")).values("total")
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def _shift_by_rows(removed, added=None):
+    """
+    Un seul UPDATE des utilisateurs concernés : compteur - lignes retirées + lignes ajoutées,
+    borné à 0. Aucun recomptage complet : seules les lignes de l'opération sont comptées.
+    """
+    delta = Value(0) - _rows_per_user(removed)
+    rows = removed
+    if added is not None:
+        delta = delta + _rows_per_user(added)
+        rows = removed | added
+    return _user_model().objects.filter(pk__in=rows.values("user_id")).update(
+        **{UNREAD_COUNTER: Greatest(F(UNREAD_COUNTER) + delta, Value(0))}
+    )
+
+
+def _unread_after(changes):
+    """
+    Condition « non lue » des lignes après une mise à jour `changes`, ou None si elle ne
+    se déduit pas des valeurs (expressions) ; False si aucune ligne ne reste non lue.
+    """
+    condition = Q()
+    for field in ("is_read", "archived"):
+        if field not in changes:
+            condition &= Q(**{field: False})
+            continue
+        value = changes[field]
+        if not isinstance(value, bool):
+            return None
+        if value:
+            return False
+    return condition
+
+
+def shift_unread_for_update(notifications, changes):
+    """
+    Répercute sur `unread_notifications_count` une mise à jour de masse, avant son exécution :
+    les lignes qui cessent d'être non lues sont retirées, celles qui le deviennent ajoutées.
+
+    Returns:
+        bool: False si la variation ne se déduit pas de la mise à jour (recomptage nécessaire)
+    """
+    after = _unread_after(changes)
+    if after is None:
+        return False
+    if after is False:
+        _shift_by_rows(notifications.filter(UNREAD))
+    else:
+        _shift_by_rows(notifications.filter(UNREAD & ~after), notifications.filter(after & ~UNREAD))
+    return True
+
+
+def shift_unread_for_delete(notifications):
+    """Retire de `unread_notifications_count` les notifications non lues sur le point d'être supprimées."""
+    _shift_by_rows(notifications.filter(UNREAD))
+
+
+def refresh_counters(user_ids, fields=None):
+    """
+    Recalcule les compteurs d'un ensemble d'utilisateurs, en une seule requête.
+
+    Args:
+        user_ids (iterable): Identifiants des utilisateurs
+        fields (iterable, optional): Compteurs à recalculer (tous par défaut)
+
+    Returns:
+        int: Nombre d'utilisateurs mis à jour
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return 0
+    fields = list(fields or COUNTERS)
+    return _user_model().objects.filter(pk__in=user_ids).update(
+        **{field: count_expression(field) for field in fields}
+    )
+
+
+def reconcile_counters(batch_size=1000):
+    """
+    Répare la dérive des compteurs de tous les utilisateurs, par lots d'identifiants :
+    une requête repère les utilisateurs dont un compteur diffère de la réalité, une
+    seconde les recalcule.
+
+    Args:
+        batch_size (int): Nombre d'utilisateurs examinés par lot
+
+    Returns:
+        int: Nombre d'utilisateurs corrigés
+    """
+    User = _user_model()
+    repaired = 0
+    last_pk = None
+
+    while True:
+        users = User.objects.order_by("pk")
+        if last_pk is not None:
+            users = users.filter(pk__gt=last_pk)
+        ids = list(users.values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            break
+        last_pk = ids[-1]
+
+        drift = Q()
+        for field in COUNTERS:
+            drift |= ~Q(**{field: F(f"actual_{field}")})
+        drifted = list(
+            User.objects.filter(pk__in=ids)
+            .annotate(**{f"actual_{field}": count_expression(field) for field in COUNTERS})
+            .filter(drift)
+            .values_list("pk", flat=True)
+        )
+        repaired += refresh_counters(drifted)
+
+        if len(ids) < batch_size:
+            break
+
+    if repaired:
+        logger.warning(f"[COMPTEURS] 🔧 Compteurs corrigés pour {repaired} utilisateur(s)")
+    return repaired
@@ -1,7 +1,8 @@
 from datetime import timedelta
-from collections import defaultdict
 from django.db.models import Avg, Count
-from django.utils.timezone import now
+from django.utils.timezone import localdate, now
+
+from . import streak_service
 
 
 def compute_mood_average(user, days=7, category=None, reference_date=None):
@@ -36,6 +37,9 @@ def compute_current_streak(user, reference_date=None):
     """
     Calcule la série actuelle de jours consécutifs avec au moins une entrée.
 
+    Lecture du bitmap des jours actifs stocké sur l'utilisateur : aucune requête
+    (hors initialisation unique des comptes antérieurs au bitmap).
+
     Args:
         user (User): Utilisateur concerné
         reference_date (date, optional): Date de référence (aujourd'hui par défaut)
@@ -43,17 +47,9 @@ def compute_current_streak(user, reference_date=None):
     Returns:
         int: Nombre de jours consécutifs avec des entrées
     """
-    reference_date = reference_date or now().date()
-    entries = user.entries.all()
-
-    streak = 0
-    for i in range(0, 365):
-        day = reference_date - timedelta(days=i)
-        if entries.filter(created_at__date=day).exists():
-            streak += 1
-        else:
-            break
-    return streak
+    reference_date = reference_date or localdate()
+    value, origin = streak_service.get_activity(user)
+    return streak_service.streak_ending_at(value, origin, reference_date)
 
 
 def compute_entries_per_category(entries, days=None):
@@ -79,25 +75,16 @@ def compute_stats_for_period(user, start_date, end_date):
     - Moyenne des humeurs
     - Répartition par catégorie
 
+    Délègue à `stats_service.compute_stats_for_period` (implémentation unique).
+
     Args:
         user (User): Utilisateur concerné
         start_date (date): Début de la période
         end_date (date): Fin de la période
 
     Returns:
-        dict: Résultat des statistiques (entries_count, mood_average, categories)
+        dict: Résultat des statistiques (entries_count, mood_average, mood_sum, categories)
     """
-    entries = user.entries.filter(created_at__date__range=(start_date, end_date))
-    entries_count = entries.count()
-    mood_avg = entries.aggregate(avg=Avg("mood"))["avg"]
-    mood_avg = round(mood_avg, 1) if mood_avg is not None else None
-
-    categories = defaultdict(int)
-    for entry in entries:
-        categories[entry.category] += 1
-
-    return {
-        "entries_count": entries_count,
-        "mood_average": mood_avg,
-        "categories": dict(categories),
-    }
+    from .stats_service import compute_stats_for_period as compute_period
+
+    return compute_period(user, start_date, end_date)
@@ -1,9 +1,10 @@
 import logging
+from celery.signals import worker_process_shutdown, worker_shutdown
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 from ..models import Badge, JournalEntry, Challenge, ChallengeProgress
-from ..services.event_log_service import log_event
+from ..services.event_log_service import flush_events, log_event
 
 logger = logging.getLogger(__name__)
 
@@ -76,3 +77,15 @@ def log_challenge_progress_deletion(sender, instance, **kwargs):
         metadata={"challenge_id": instance.challenge.id}
     )
     logger.warning(f"[EVENT LOG] Progression de défi supprimée pour {instance.user.username}.")
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def flush_event_log_buffer(**kwargs):
+    """
+    Vide le tampon d'événements à l'arrêt d'un worker Celery, pour ne perdre aucun
+    événement en attente.
+    """
+    written = flush_events()
+    if written:
+        logger.info(f"[EVENT LOG] {written} événement(s) écrit(s) à l'arrêt du worker.")
@@ -3,9 +3,8 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils.timezone import now
 
-from ..models import JournalEntry, DailyStat, Notification, JournalMedia
-from ..services.challenge_service import check_challenges
-from ..services.badge_service import update_user_badges
+from ..models import JournalEntry, Notification, JournalMedia
+from ..services.journal_pipeline_service import schedule_journal_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -15,23 +14,14 @@ def handle_journal_entry_created_or_updated(sender, instance, created, **kwargs)
     """
     Déclenché à la création ou mise à jour d'une entrée de journal.
 
-    - Si créée ➔ met à jour les stats journalières, défis, badges, streaks et notifie la création.
+    - Si créée ➔ planifie le pipeline différé (défis, badges) et notifie la création.
     - Si mise à jour ➔ envoie une notification de mise à jour.
     """
     if created:
         logger.info(f"[JOURNAL] Nouvelle entrée pour {instance.user.username} le {instance.created_at.date()}.")
         
-        # ➕ Statistiques journalières
-        DailyStat.generate_for_user(instance.user, instance.created_at.date())
-        
-        # ✅ Défis
-        check_challenges(instance.user)
-        
-        # 🏅 Badges
-        update_user_badges(instance.user)
-
-        # 🔥 Streaks
-        instance.user.update_streaks()
+        # ⏳ Défis et badges : un seul traitement différé et regroupé
+        schedule_journal_pipeline(instance)
 
         # 🔔 Notification de création
         Notification.objects.create(
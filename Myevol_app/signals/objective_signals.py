@@ -1,9 +1,12 @@
 import logging
-from django.db.models.signals import post_save, pre_delete
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete, post_delete
 from django.dispatch import receiver
 from django.utils.timezone import now
 
 from ..models.objective_model import Objective
+from ..services.badge_rule_service import OBJECTIVE_METRICS
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +17,7 @@ def handle_objective_save(sender, instance, created, **kwargs):
     Déclenché à la création ou à la mise à jour d'un objectif.
 
     - Si créé ➔ Log de création.
-    - Si `done=True` ➔ Notification d'objectif atteint.
+    - Si `done=True` ➔ Notification d'objectif atteint et vérification des badges liés aux objectifs.
     """
     if created:
         logger.info(f"[OBJECTIF] Création d'un nouvel objectif '{instance.title}' pour {instance.user.username}.")
@@ -29,6 +32,8 @@ def handle_objective_save(sender, instance, created, **kwargs):
         )
         logger.info(f"[OBJECTIF] Objectif '{instance.title}' complété par {instance.user.username}.")
 
+        instance.user.update_badges(changed_metrics=OBJECTIVE_METRICS)
+
 
 @receiver(pre_delete, sender=Objective)
 def handle_objective_deletion(sender, instance, **kwargs):
@@ -37,3 +42,24 @@ def handle_objective_deletion(sender, instance, **kwargs):
     Loggue la suppression.
     """
     logger.info(f"[OBJECTIF] Suppression de l'objectif '{instance.title}' pour {instance.user.username}.")
+
+
+@receiver(post_delete, sender=Objective)
+def recheck_objective_badges_on_deletion(sender, instance, **kwargs):
+    """
+    Après la suppression d'un objectif en cours, réévalue les badges liés aux objectifs
+    ("Objectif rempli !" : plus aucun objectif en attente).
+
+    Réévaluation après validation de la transaction, et seulement si l'utilisateur existe
+    encore : la suppression peut venir de celle, en cascade, de son compte.
+    """
+    if instance.done:
+        return
+    user_id = instance.user_id
+
+    def recheck():
+        user = get_user_model().objects.filter(pk=user_id).first()
+        if user is not None:
+            user.update_badges(changed_metrics=OBJECTIVE_METRICS)
+
+    transaction.on_commit(recheck)
@@ -3,6 +3,7 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from ..models.quote_model import Quote
 from ..services.notification_service import create_admin_notification
+from ..services.quote_service import on_quote_change
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +11,8 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender=Quote)
 def handle_quote_post_save(sender, instance, created, **kwargs):
     """
-    Signal déclenché lorsqu'une citation est créée.
+    Signal déclenché lorsqu'une citation est créée ou modifiée.
+    - Invalide l'index des citations.
     - Log la création.
     - Envoie une notification à l'admin (via create_admin_notification).
 
@@ -19,6 +21,8 @@ def handle_quote_post_save(sender, instance, created, **kwargs):
         instance (Quote): Instance de la citation.
         created (bool): True si nouvellement créée, False si mise à jour.
     """
+    on_quote_change()
+
     if created:
         preview = instance.text[:50]
         author = instance.author or "Inconnu"
@@ -35,12 +39,13 @@ def handle_quote_post_save(sender, instance, created, **kwargs):
 def handle_quote_post_delete(sender, instance, **kwargs):
     """
     Signal déclenché lors de la suppression d'une citation.
-    Log l'événement.
+    Invalide l'index des citations et log l'événement.
 
     Args:
         sender (Model): Le modèle émetteur (Quote).
         instance (Quote): Instance supprimée.
     """
+    on_quote_change()
     preview = instance.text[:50]
     author = instance.author or "Inconnu"
     logger.info(f"[QUOTE] Citation supprimée : '{preview}...' — {author}")
@@ -0,0 +1,43 @@
+# signals/search_signals.py
+
+import logging
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from ..models.journal_model import JournalEntry
+from ..services.search_service import get_search_backend
+
+logger = logging.getLogger(__name__)
+
+
+def _indexing_backend():
+    """
+    Backend de recherche, ou None s'il n'est pas configuré : l'indexation est alors
+    ignorée (journalisée) plutôt que de faire échouer l'écriture de l'entrée.
+    """
+    try:
+        return get_search_backend()
+    except ImproperlyConfigured as e:
+        logger.warning(f"[RECHERCHE] ⚠️ Indexation ignorée : {e}")
+        return None
+
+
+@receiver(post_save, sender=JournalEntry)
+def index_journal_entry(sender, instance, **kwargs):
+    """
+    Indexe l'entrée pour la recherche plein texte à sa création ou sa modification.
+    """
+    backend = _indexing_backend()
+    if backend is not None:
+        backend.index_entry(instance)
+
+
+@receiver(post_delete, sender=JournalEntry)
+def unindex_journal_entry(sender, instance, **kwargs):
+    """
+    Retire l'entrée supprimée de l'index de recherche.
+    """
+    backend = _indexing_backend()
+    if backend is not None:
+        backend.remove_entry(instance)
@@ -3,28 +3,74 @@
 import logging
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.utils.timezone import localtime
 
 from ..models.journal_model import JournalEntry
 from ..models.stats_model import WeeklyStat, DailyStat, MonthlyStat, AnnualStat
-from ..services.stats_service import (
-    generate_daily_stats,
-    generate_weekly_stats,
-    generate_monthly_stats,
-    generate_annual_stats,
-)
+from ..services.objective_progress_service import track_entry
+from ..services.stats_service import apply_entry_delta, mark_stats_dirty
 
 logger = logging.getLogger(__name__)
 
+
+def _rollup_key(mood, category, created_at):
+    return mood, category, localtime(created_at).date()
+
+
+def _apply_delta(user, key, sign):
+    """
+    Applique un delta aux cumuls ; en cas d'échec, l'écriture de l'entrée n'est pas
+    bloquée : les statistiques de l'utilisateur sont marquées obsolètes.
+    """
+    mood, category, day = key
+    try:
+        apply_entry_delta(user, day, mood, category, sign=sign)
+    except Exception as e:
+        logger.error(f"[STATS] Échec du cumul incrémental pour {user.username} ({day}) : {e}")
+        mark_stats_dirty(user.pk)
+
+
+def _track_objectives(user, key):
+    """
+    Complète les objectifs atteints grâce à l'entrée (même utilisateur, catégorie et jour),
+    à partir du cumul journalier qui vient d'être mis à jour.
+    """
+    _, category, day = key
+    try:
+        track_entry(user, category, day)
+    except Exception as e:
+        logger.error(f"[OBJECTIF] Échec du suivi des objectifs pour {user.username} ({day}) : {e}")
+
+
 @receiver(post_save, sender=JournalEntry)
 def update_statistics_on_journal_entry(sender, instance, created, **kwargs):
     """
-    Met à jour toutes les statistiques de l'utilisateur après la création d'une entrée de journal.
+    Met à jour les statistiques (jour, semaine, mois, année) par cumul incrémental
+    à la création ou à la modification (humeur, catégorie, date) d'une entrée, puis
+    complète les objectifs du même jour et de la même catégorie ainsi atteints.
     """
-    if created:
-        generate_daily_stats(instance.user)
-        generate_weekly_stats(instance.user)
-        generate_monthly_stats(instance.user)
-        generate_annual_stats(instance.user)
+    current = _rollup_key(instance.mood, instance.category, instance.created_at)
+    # Valeurs stockées avant modification, lues par JournalEntry.save()
+    stored = getattr(instance, "previous_values", None)
+    previous = _rollup_key(*stored) if stored else None
+
+    if created or previous is None:
+        _apply_delta(instance.user, current, sign=1)
+    elif previous != current:
+        _apply_delta(instance.user, previous, sign=-1)
+        _apply_delta(instance.user, current, sign=1)
+    else:
+        return
+
+    _track_objectives(instance.user, current)
+
+
+@receiver(post_delete, sender=JournalEntry)
+def update_statistics_on_journal_entry_deletion(sender, instance, **kwargs):
+    """
+    Retire la contribution d'une entrée supprimée des statistiques.
+    """
+    _apply_delta(instance.user, _rollup_key(instance.mood, instance.category, instance.created_at), sign=-1)
 
 
 @receiver(post_save, sender=DailyStat)
@@ -0,0 +1,50 @@
+# signals/streak_signals.py
+
+import logging
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils.timezone import localtime
+
+from ..models.journal_model import JournalEntry
+from ..services.streak_service import record_activity
+
+logger = logging.getLogger(__name__)
+
+
+def _entry_day(entry):
+    return localtime(entry.created_at).date()
+
+
+def _release_day_if_empty(entry, day):
+    """Désactive le jour si l'utilisateur n'y a plus aucune entrée."""
+    still_active = JournalEntry.objects.filter(
+        user_id=entry.user_id, created_at__date=day
+    ).exclude(pk=entry.pk).exists()
+    if not still_active:
+        record_activity(entry.user, day, active=False)
+
+
+@receiver(post_save, sender=JournalEntry)
+def update_activity_on_journal_entry(sender, instance, created, **kwargs):
+    """
+    Met à jour le bitmap des jours actifs (et la plus longue série) à la création
+    d'une entrée, ou lorsque sa date change.
+    """
+    day = _entry_day(instance)
+    # Valeurs stockées avant modification, lues par JournalEntry.save()
+    stored = getattr(instance, "previous_values", None)
+    previous_day = localtime(stored[2]).date() if stored else None
+
+    if created or previous_day is None:
+        record_activity(instance.user, day)
+    elif previous_day != day:
+        record_activity(instance.user, day)
+        _release_day_if_empty(instance, previous_day)
+
+
+@receiver(post_delete, sender=JournalEntry)
+def update_activity_on_journal_entry_deletion(sender, instance, **kwargs):
+    """
+    Désactive le jour de l'entrée supprimée s'il ne contient plus d'entrée.
+    """
+    _release_day_if_empty(instance, _entry_day(instance))
@@ -0,0 +1,50 @@
+# signals/user_cache_signals.py
+
+import logging
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from ..models.badge_model import Badge
+from ..models.journal_model import JournalEntry
+from ..models.objective_model import Objective
+from ..services.user_cache_service import bump_generation
+
+logger = logging.getLogger(__name__)
+
+# Enregistré après les autres signaux (voir apps.py) : la génération est incrémentée
+# une fois les mises à jour dérivées (stats, séries, badges) effectuées.
+
+
+def _invalidate(user_id):
+    """
+    Incrémente la génération immédiatement pour la transaction courante, puis de nouveau
+    après sa validation : une valeur calculée entre-temps par une lecture concurrente,
+    sur les lignes d'avant validation, ne reste pas servie jusqu'à son TTL.
+    """
+    bump_generation(user_id)
+    transaction.on_commit(lambda: bump_generation(user_id))
+
+
+@receiver(post_save, sender=JournalEntry)
+@receiver(post_delete, sender=JournalEntry)
+@receiver(post_save, sender=Badge)
+@receiver(post_delete, sender=Badge)
+@receiver(post_save, sender=Objective)
+@receiver(post_delete, sender=Objective)
+def invalidate_user_cache_on_data_change(sender, instance, **kwargs):
+    """
+    Invalide le cache de l'utilisateur (métriques et profil "me") lorsqu'une entrée,
+    un badge ou un objectif est créé, modifié ou supprimé.
+    """
+    _invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_cache_on_user_change(sender, instance, created, **kwargs):
+    """
+    Invalide le cache de l'utilisateur lorsque le compte est modifié (username, XP, connexion...).
+    """
+    if not created:
+        _invalidate(instance.pk)
@@ -0,0 +1,66 @@
+# signals/user_counter_signals.py
+
+import logging
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from ..models.badge_model import Badge
+from ..models.journal_model import JournalEntry
+from ..models.notification_model import Notification
+from ..services.user_counter_service import increment, refresh_counters
+
+logger = logging.getLogger(__name__)
+
+# Compteurs dénormalisés de l'utilisateur (voir services/user_counter_service.py).
+# Les suppressions de notifications sont comptées par Notification.delete() et
+# NotificationQuerySet : un récepteur post_delete désactiverait la suppression rapide
+# (purges par lots).
+
+
+def _counted_user(instance):
+    """Instance utilisateur si déjà chargée (mise à jour en mémoire), identifiant sinon."""
+    field = instance._meta.get_field("user")
+    return instance.user if field.is_cached(instance) else instance.user_id
+
+
+@receiver(post_save, sender=JournalEntry)
+def count_created_entry(sender, instance, created, **kwargs):
+    """Incrémente `entries_count` à la création d'une entrée."""
+    if created:
+        increment(_counted_user(instance), "entries_count")
+
+
+@receiver(post_delete, sender=JournalEntry)
+def count_deleted_entry(sender, instance, **kwargs):
+    """Décrémente `entries_count` à la suppression d'une entrée."""
+    increment(_counted_user(instance), "entries_count", -1)
+
+
+@receiver(post_save, sender=Badge)
+def count_created_badge(sender, instance, created, **kwargs):
+    """Incrémente `badges_count` à l'attribution d'un badge."""
+    if created:
+        increment(_counted_user(instance), "badges_count")
+
+
+@receiver(post_delete, sender=Badge)
+def count_deleted_badge(sender, instance, **kwargs):
+    """Décrémente `badges_count` à la suppression d'un badge."""
+    increment(_counted_user(instance), "badges_count", -1)
+
+
+@receiver(post_save, sender=Notification)
+def count_notification_write(sender, instance, created, **kwargs):
+    """
+    Tient `unread_notifications_count` à jour à la création d'une notification non lue,
+    puis à chaque changement de statut (lue, archivée) enregistré via save().
+    """
+    unread = instance.is_unread
+    previous = False if created else getattr(instance, "_counted_unread", None)
+
+    if previous is None:
+        # État au chargement inconnu (instance construite à la main) : recomptage
+        refresh_counters([instance.user_id], ["unread_notifications_count"])
+    elif previous != unread:
+        increment(_counted_user(instance), "unread_notifications_count", 1 if unread else -1)
+    instance._counted_unread = unread
@@ -1,8 +1,8 @@
 # tasks.py
 from celery import shared_task
+from django.contrib.auth import get_user_model
 from django.utils.timezone import now
-from .models import Notification, User
-from .services import stats_service, streak_service, notification_service
+from .services import stats_service, streak_service, notification_service, journal_pipeline_service, event_analytics_service, purge_service, user_counter_service
 import logging
 from datetime import timedelta
 
@@ -11,89 +11,151 @@ logger = logging.getLogger(__name__)
 @shared_task
 def send_scheduled_notifications():
     """
-    Tâche pour envoyer toutes les notifications programmées.
+    Tâche pour envoyer toutes les notifications programmées (plusieurs workers possibles).
     """
-    logger.info("Scheduled notifications task executed.")
-    return "Scheduled notifications sent."
+    count = notification_service.send_scheduled_notifications()
+    return f"{count} notification(s) programmée(s) envoyée(s)."
+
+@shared_task
+def process_journal_pipeline(user_id):
+    """
+    Traitement différé et regroupé des nouvelles entrées d'un utilisateur
+    (défis, badges ; la série est mise à jour à l'écriture de l'entrée).
+    """
+    journal_pipeline_service.process_pending_entries(user_id)
+    return f"Pipeline exécuté pour l'utilisateur {user_id}."
+
+@shared_task
+def refresh_user_stats(user_id):
+    """
+    Reconstruit les statistiques d'un utilisateur marqué obsolète
+    (voir `stats_service.mark_stats_dirty`).
+    """
+    user = get_user_model().objects.filter(pk=user_id).first()
+    if user is None:
+        stats_service.clear_stats_dirty(user_id)
+        return f"Utilisateur {user_id} introuvable."
+    rows = stats_service.refresh_user_stats(user)
+    return f"Statistiques reconstruites pour l'utilisateur {user_id} : {rows} ligne(s)."
+
+def _stats_report(label, report):
+    return (
+        f"Statistiques {label} générées : {report['rows']} lignes en "
+        f"{report['duration']:.2f}s ({report['rate']:.0f} lignes/s)."
+    )
 
 @shared_task
 def generate_all_daily_stats():
     """
-    Génère les statistiques journalières pour tous les utilisateurs.
+    Génère les statistiques journalières pour tous les utilisateurs (une passe GROUP BY, écritures par lots).
     """
-    for user in User.objects.all():
-        stats_service.generate_daily_stats(user)
-    return "Statistiques journalières générées."
+    report = stats_service.bulk_generate_stats("daily")
+    return _stats_report("journalières", report)
 
 @shared_task
 def generate_all_weekly_stats():
     """
-    Génère les statistiques hebdomadaires pour tous les utilisateurs.
+    Génère les statistiques hebdomadaires pour tous les utilisateurs (une passe GROUP BY, écritures par lots).
     """
-    for user in User.objects.all():
-        stats_service.generate_weekly_stats(user)
-    return "Statistiques hebdomadaires générées."
+    report = stats_service.bulk_generate_stats("weekly")
+    return _stats_report("hebdomadaires", report)
 
 @shared_task
 def generate_all_monthly_stats():
     """
-    Génère les statistiques mensuelles pour tous les utilisateurs.
+    Génère les statistiques mensuelles pour tous les utilisateurs (une passe GROUP BY, écritures par lots).
     """
-    for user in User.objects.all():
-        stats_service.generate_monthly_stats(user)
-    return "Statistiques mensuelles générées."
+    report = stats_service.bulk_generate_stats("monthly")
+    return _stats_report("mensuelles", report)
 
 @shared_task
 def generate_all_annual_stats():
     """
-    Génère les statistiques annuelles pour tous les utilisateurs.
+    Génère les statistiques annuelles pour tous les utilisateurs (une passe GROUP BY, écritures par lots).
     """
-    for user in User.objects.all():
-        stats_service.generate_annual_stats(user)
-    return "Statistiques annuelles générées."
+    report = stats_service.bulk_generate_stats("annual")
+    return _stats_report("annuelles", report)
 
 @shared_task
 def recalculate_all_streaks():
     """
-    Recalcule les streaks (séries d'entrées consécutives) de tous les utilisateurs.
+    Recalcule les streaks (séries d'entrées consécutives) de tous les utilisateurs
+    en reconstruisant leur bitmap de jours actifs en une seule passe.
+    """
+    updated = streak_service.rebuild_all_activity()
+    return f"Séries (streaks) mises à jour pour {updated} utilisateur(s)."
+
+@shared_task
+def reconcile_user_counters():
+    """
+    Répare la dérive des compteurs dénormalisés des utilisateurs (entrées, badges,
+    notifications non lues), par lots.
     """
-    for user in User.objects.all():
-        streak_service.update_user_streak(user)
-    return "Séries (streaks) mises à jour."
+    repaired = user_counter_service.reconcile_counters()
+    return f"Compteurs corrigés pour {repaired} utilisateur(s)."
+
+def _notification_report(label, report):
+    return (
+        f"{label} : {report['sent']} notification(s) en "
+        f"{report['duration']:.2f}s ({report['rate']:.0f}/s)."
+    )
 
 @shared_task
 def remind_inactive_users():
     """
-    Envoie un rappel aux utilisateurs sans activité récente.
+    Envoie un rappel aux utilisateurs sans activité récente (une anti-jointure, insertions par lots).
     """
     threshold = now() - timedelta(days=2)  # Ex : pas d'entrée depuis 2 jours
-    for user in User.objects.all():
-        if not user.entries.filter(created_at__gte=threshold).exists():
-            notification_service.create_user_notification(
-                user=user,
-                message="N'oubliez pas d'écrire dans votre journal aujourd'hui 📖",
-                notif_type="journal_reminder"
-            )
-    return "Rappels envoyés aux utilisateurs inactifs."
+    report = notification_service.bulk_notify(
+        notification_service.inactive_users(threshold),
+        message="N'oubliez pas d'écrire dans votre journal aujourd'hui 📖",
+        notif_type="journal_reminder",
+    )
+    return _notification_report("Rappels envoyés aux utilisateurs inactifs", report)
 
 @shared_task
 def clean_old_notifications():
     """
-    Supprime les anciennes notifications de plus de 90 jours.
+    Supprime les anciennes notifications (90 jours par défaut), par lots.
+    """
+    report = purge_service.run_policy("notifications")
+    return f"{report['deleted']} anciennes notifications supprimées."
+
+@shared_task
+def purge_old_records(max_batches=None):
+    """
+    Applique toutes les politiques de rétention (notifications, événements, statistiques
+    journalières), par lots ; une purge interrompue reprend au passage suivant.
     """
-    cutoff = now() - timedelta(days=90)
-    count, _ = Notification.objects.filter(created_at__lt=cutoff).delete()
-    return f"{count} anciennes notifications supprimées."
+    reports = purge_service.run_all_policies(max_batches=max_batches)
+    return " ; ".join(
+        f"{r['policy']} : {r['deleted']} ligne(s) en {r['batches']} lot(s)"
+        f"{'' if r['completed'] else ' (interrompue)'}"
+        for r in reports
+    )
+
+@shared_task
+def rollup_event_logs():
+    """
+    Agrège les événements des heures révolues et purge les événements bruts
+    au-delà de la rétention.
+    """
+    report = event_analytics_service.rollup_events()
+    if report is None:
+        return "Agrégation des événements déjà en cours."
+    return (
+        f"{report['hourly_buckets']} tranche(s) horaire(s), {report['daily_buckets']} journalière(s), "
+        f"{report['purged_events']} événement(s) purgé(s)."
+    )
 
 @shared_task
 def ask_user_daily_activity():
     """
     Demande quotidienne aux utilisateurs de réfléchir à leur journée à 19h.
     """
-    for user in User.objects.all():
-        notification_service.create_user_notification(
-            user=user,
-            message="Qu'avez-vous accompli aujourd'hui ? Prenez un moment pour écrire dans votre journal. ✍️",
-            notif_type="journal_prompt"
-        )
-    return "Notifications de réflexion journalière envoyées."
+    report = notification_service.bulk_notify(
+        get_user_model().objects.filter(is_active=True),
+        message="Qu'avez-vous accompli aujourd'hui ? Prenez un moment pour écrire dans votre journal. ✍️",
+        notif_type="journal_prompt",
+    )
+    return _notification_report("Notifications de réflexion journalière envoyées", report)
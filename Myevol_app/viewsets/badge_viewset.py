@@ -4,6 +4,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiRespon
 from Myevol_app.models.badge_model import Badge
 from Myevol_app.serializers.badge_serializers import BadgeSerializer
 from Myevol_app.permissions import IsOwnerOrAdmin
+from Myevol_app.viewsets.mixins import QueryOptimizerMixin
 
 @extend_schema(
     summary="Lister, créer et consulter les badges obtenus par l'utilisateur connecté",
@@ -44,7 +45,7 @@ from Myevol_app.permissions import IsOwnerOrAdmin
         401: OpenApiResponse(description="Authentification requise"),
     }
 )
-class BadgeViewSet(viewsets.ModelViewSet):
+class BadgeViewSet(QueryOptimizerMixin, viewsets.ModelViewSet):
     queryset = Badge.objects.all()
     serializer_class = BadgeSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
@@ -60,11 +61,18 @@ class BadgeViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-from rest_framework import viewsets, filters
-from rest_framework.permissions import AllowAny
+import hashlib
+import json
+
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 from Myevol_app.models.badge_model import BadgeTemplate
 from Myevol_app.serializers.badge_serializers import BadgeTemplateSerializer
+from Myevol_app.services.badge_service import get_badges_progress
 
 @extend_schema(
     summary="Lister et consulter les modèles de badges disponibles",
@@ -107,3 +115,35 @@ class BadgeTemplateViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     ordering = ['name']
     search_fields = ['name', 'description']
+
+    @extend_schema(
+        summary="Progression de l'utilisateur vers tous les badges",
+        description="""
+        Retourne, pour chaque modèle de badge, la progression de l'utilisateur connecté
+        (`percent`, `unlocked`, `current`, `target`).
+
+        Le calcul repose sur un unique instantané des métriques de l'utilisateur et une
+        seule lecture de ses badges obtenus, quel que soit le nombre de modèles.
+
+        **🏷️ Cache HTTP** : la réponse porte un en-tête `ETag`. Renvoyer sa valeur dans
+        `If-None-Match` retourne `304 Not Modified` si la progression n'a pas changé.
+        """,
+        responses={
+            200: OpenApiResponse(description="Progression vers chaque modèle de badge"),
+            304: OpenApiResponse(description="Progression inchangée"),
+            401: OpenApiResponse(description="Authentification requise"),
+        },
+    )
+    @action(detail=False, methods=["get"], url_path="progress", permission_classes=[IsAuthenticated])
+    def progress(self, request):
+        data = get_badges_progress(request.user)
+        payload = json.dumps(data, sort_keys=True, default=str).encode()
+        etag = quote_etag(hashlib.md5(payload).hexdigest())
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
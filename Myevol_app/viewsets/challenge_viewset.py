@@ -14,12 +14,13 @@ from Myevol_app.serializers.challenge_serializers import (
     ParticipantSerializer
 )
 from django.utils.timezone import now
+from Myevol_app.viewsets.mixins import QueryOptimizerMixin
 
 @extend_schema(
     summary="Lister, récupérer et gérer les défis proposés.",
     description="Permet de voir tous les défis disponibles."
 )
-class ChallengeViewSet(viewsets.ReadOnlyModelViewSet):
+class ChallengeViewSet(QueryOptimizerMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet pour accéder aux défis.
     Accessible sans authentification pour voir les défis.
@@ -30,6 +31,10 @@ class ChallengeViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     ordering = ['-end_date']
     search_fields = ['title', 'description']
+    # ParticipantSerializer.get_progress lit aussi le défi de chaque progression
+    query_plan_overrides = {
+        ParticipantSerializer: {'select_related': ['user', 'challenge']},
+    }
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -54,7 +59,9 @@ class ChallengeViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated], url_path='participants')
     def participants(self, request, pk=None):
         challenge = self.get_object()
-        progresses = ChallengeProgress.objects.filter(challenge=challenge)
+        progresses = self.optimize_queryset(
+            ChallengeProgress.objects.filter(challenge=challenge), ParticipantSerializer
+        )
         serializer = ParticipantSerializer(progresses, many=True)
         return Response(serializer.data)
 
@@ -71,7 +78,7 @@ from Myevol_app.permissions import IsOwnerOrAdmin
     summary="Suivre la progression sur les défis.",
     description="Permet de voir sa progression sur les défis auxquels on a participé."
 )
-class ChallengeProgressViewSet(viewsets.ReadOnlyModelViewSet):
+class ChallengeProgressViewSet(QueryOptimizerMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = ChallengeProgressSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
 
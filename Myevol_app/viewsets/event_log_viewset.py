@@ -9,19 +9,20 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils.timezone import now, timedelta
 from Myevol_app.models.event_log_model import EventLog
-from Myevol_app.paginations import MyEvolPagination
+from Myevol_app.paginations import MyEvolHybridPagination
 from Myevol_app.serializers.event_log_serializers import (
     EventLogSerializer,
     EventLogDetailSerializer,
     EventLogStatisticsSerializer
 )
 from Myevol_app.permissions import IsOwnerOrAdmin
+from Myevol_app.viewsets.mixins import QueryOptimizerMixin
 
 @extend_schema(
     summary="Lister et consulter les événements du système",
     description="Permet de consulter les logs des utilisateurs et du système."
 )
-class EventLogViewSet(viewsets.ReadOnlyModelViewSet):
+class EventLogViewSet(QueryOptimizerMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet pour consulter les logs d'événements.
     - Admins : peuvent voir tous les logs
@@ -29,7 +30,7 @@ class EventLogViewSet(viewsets.ReadOnlyModelViewSet):
     """
     serializer_class = EventLogSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
-    pagination_class = MyEvolPagination 
+    pagination_class = MyEvolHybridPagination
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     ordering = ['-created_at']
     search_fields = ['action', 'description', 'severity']
@@ -1,22 +1,36 @@
 # Myevol_app/api_viewsets/journal_entry_viewset.py
 
-from rest_framework import viewsets, filters
+from datetime import datetime
+
+from django.utils.http import parse_etags, quote_etag
+from django.utils.timezone import localdate
+from rest_framework import viewsets, filters, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
 
 from rest_framework.response import Response
 from Myevol_app.models.journal_model import JournalEntry
-from Myevol_app.paginations import MyEvolPagination
+from Myevol_app.filters import JournalSearchFilter
+from Myevol_app.paginations import MyEvolHybridPagination, MyEvolPagination
 from Myevol_app.serializers.journal_serializers import (
     JournalEntrySerializer,
     JournalEntryDetailSerializer,
     JournalEntryCreateSerializer,
     JournalEntryCalendarSerializer,
+    JournalEntrySearchResultSerializer,
     JournalStatsSerializer
 )
 from Myevol_app.permissions import IsOwnerOrAdmin
+from Myevol_app.viewsets.mixins import QueryOptimizerMixin
+from Myevol_app.services.journal_service import get_calendar
+from Myevol_app.services.search_service import search_entries
+from Myevol_app.services.user_cache_service import get_generation
+
+# Nombre maximal de mois couverts par une requête calendrier
+CALENDAR_MAX_MONTHS = 12
 
 
 @extend_schema(
@@ -30,17 +44,18 @@ from Myevol_app.permissions import IsOwnerOrAdmin
     Des actions personnalisées sont disponibles :
     - `/calendar/` : vue calendrier
     - `/stats/` : statistiques journalières
+    - `/search/` : recherche plein texte classée et surlignée
     """,
     tags=["Journal"],
 )
-class JournalEntryViewSet(viewsets.ModelViewSet):
+class JournalEntryViewSet(QueryOptimizerMixin, viewsets.ModelViewSet):
     """
     ViewSet pour gérer les entrées de journal de l'utilisateur.
     """
     serializer_class = JournalEntrySerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
-    pagination_class = MyEvolPagination
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter]
+    pagination_class = MyEvolHybridPagination
+    filter_backends = [filters.OrderingFilter, JournalSearchFilter]
     ordering = ['-created_at']
     search_fields = ['content', 'category']
 
@@ -68,14 +83,92 @@ class JournalEntryViewSet(viewsets.ModelViewSet):
         serializer = JournalStatsSerializer(user)
         return Response(serializer.data)
 
+    @extend_schema(
+        summary="Recherche plein texte dans le journal",
+        description="""
+        Recherche `q` dans le contenu et la catégorie des entrées de l'utilisateur, via l'index
+        plein texte (PostgreSQL : racinisation française ; SQLite : FTS5).
+
+        Les résultats sont classés par pertinence (`rank`) et portent un extrait du contenu
+        (`highlight`) où les termes trouvés sont entourés de `<mark>`.
+        """,
+        parameters=[
+            OpenApiParameter(name="q", description="Texte recherché", required=True, type=str),
+        ],
+        responses={200: JournalEntrySearchResultSerializer(many=True)}
+    )
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated], url_path='search')
+    def search(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({"q": "Le texte recherché est requis."})
+
+        paginator = MyEvolPagination()
+        page = paginator.paginate_queryset(search_entries(request.user, query), request, view=self)
+        serializer = JournalEntrySearchResultSerializer(page, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data)
+
     @extend_schema(
         summary="Récupérer les entrées au format calendrier",
-        description="Retourne les entrées groupées par jour avec humeur moyenne et catégories.",
-        responses={200: JournalEntryCalendarSerializer(many=True)}
+        description="""
+        Retourne, pour chaque jour avec au moins une entrée, le nombre d'entrées,
+        l'humeur moyenne et les catégories, agrégés en base.
+
+        - `from` / `to` : mois de début et de fin au format `AAAA-MM` (inclus), 12 mois au maximum.
+          Sans paramètre, le mois courant. Avec `from` seul, jusqu'au mois courant (12 mois au
+          plus) ; avec `to` seul, depuis le mois courant s'il précède `to`, sinon le mois `to` seul.
+        - Chaque mois est mis en cache côté serveur jusqu'à la prochaine écriture.
+        - La réponse porte un `ETag` : `If-None-Match` retourne `304` si rien n'a changé.
+        """,
+        parameters=[
+            OpenApiParameter(name="from", description="Premier mois (AAAA-MM, défaut : mois courant ou `to`)", required=False, type=str),
+            OpenApiParameter(name="to", description="Dernier mois (AAAA-MM, défaut : mois courant, 12 mois après `from` au plus)", required=False, type=str),
+        ],
+        responses={200: JournalEntryCalendarSerializer(many=True), 304: OpenApiResponse(description="Calendrier inchangé")}
     )
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated], url_path='calendar')
     def calendar(self, request):
         user = request.user
-        entries = JournalEntry.objects.filter(user=user).order_by('created_at')
-        serializer = JournalEntryCalendarSerializer(entries, many=True)
-        return Response(serializer.data)
+        current_month = localdate().replace(day=1)
+        first_month = self._parse_month(request.query_params.get('from'), None)
+        last_month = self._parse_month(request.query_params.get('to'), None)
+        # Une borne absente s'étend vers le mois courant, dans la limite de CALENDAR_MAX_MONTHS
+        if first_month is None and last_month is None:
+            first_month = last_month = current_month
+        elif last_month is None:
+            last_month = max(first_month, min(current_month, self._shift_month(first_month, CALENDAR_MAX_MONTHS - 1)))
+        elif first_month is None:
+            first_month = max(min(current_month, last_month), self._shift_month(last_month, 1 - CALENDAR_MAX_MONTHS))
+
+        if last_month < first_month:
+            raise ValidationError({"to": "Le mois de fin doit suivre le mois de début."})
+        span = (last_month.year - first_month.year) * 12 + last_month.month - first_month.month + 1
+        if span > CALENDAR_MAX_MONTHS:
+            raise ValidationError({"to": f"La période est limitée à {CALENDAR_MAX_MONTHS} mois."})
+
+        generation = get_generation(user.pk)
+        etag = quote_etag(f"{user.pk}-{generation}-{first_month:%Y%m}-{last_month:%Y%m}-{localdate():%Y%m%d}")
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            days = get_calendar(user, first_month, last_month)
+            response = Response(JournalEntryCalendarSerializer(days, many=True).data)
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+    @staticmethod
+    def _shift_month(month, delta):
+        """Premier jour du mois situé `delta` mois après `month` (avant si négatif)."""
+        index = month.year * 12 + month.month - 1 + delta
+        return month.replace(year=index // 12, month=index % 12 + 1)
+
+    @staticmethod
+    def _parse_month(value, default):
+        """Convertit `AAAA-MM` en premier jour du mois (ValidationError si invalide)."""
+        if not value:
+            return default
+        try:
+            return datetime.strptime(value, "%Y-%m").date()
+        except ValueError:
+            raise ValidationError({"month": f"Mois invalide : '{value}' (format attendu : AAAA-MM)."})
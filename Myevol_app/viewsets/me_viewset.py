@@ -1,15 +1,47 @@
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from Myevol_app.serializers.user_serializers import UserProfileSerializer
+from Myevol_app.services.profile_service import get_profile
+
+
+def _build_profile(user, context):
+    return UserProfileSerializer(user, context=context).data
+
+
+def profile_response(request, user):
+    """
+    Réponse du profil "me", servie depuis le cache versionné de l'utilisateur.
+
+    Gère les requêtes conditionnelles : `If-None-Match` (ETag) est prioritaire sur
+    `If-Modified-Since` ; un profil inchangé retourne 304 sans corps.
+    """
+    profile = get_profile(user, _build_profile, context={"request": request})
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        not_modified = profile["etag"] in parse_etags(if_none_match)
+    else:
+        since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        not_modified = since is not None and profile["last_modified"] <= since
+
+    if not_modified:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(profile["data"])
+    response["ETag"] = profile["etag"]
+    response["Last-Modified"] = http_date(profile["last_modified"])
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def me_view(request):
     """
-    ✅ Retourne les infos du user connecté.
+    ✅ Retourne les infos du user connecté (profil en cache, ETag / Last-Modified).
     """
-    user = request.user
-    serializer = UserProfileSerializer(user, context={'request': request})
-    return Response(serializer.data)
+    return profile_response(request, request.user)
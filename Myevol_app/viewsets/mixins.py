@@ -0,0 +1,220 @@
+# Myevol_app/viewsets/mixins.py
+
+import logging
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.db.models import Prefetch, QuerySet
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+logger = logging.getLogger(__name__)
+
+# Plan de requête dérivé du serializer actif :
+# - une source traversant une clé étrangère (ex : `user.username`) ou un serializer imbriqué
+#   simple donne un `select_related` ;
+# - un serializer imbriqué `many=True` sur une relation inverse ou many-to-many donne un
+#   `prefetch_related` (avec ses propres jointures) ;
+# - si chaque champ correspond à une colonne (aucun SerializerMethodField, propriété ni
+#   source '*'), les colonnes lues sont restreintes avec `only()`.
+# Les plans sont calculés une fois par (serializer, modèle).
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+_plans = {}
+
+
+class QueryPlan:
+    """Optimisations à appliquer à un queryset : jointures, préchargements et colonnes."""
+
+    def __init__(self, select_related=(), prefetch_related=(), only=None):
+        self.select_related = list(select_related)
+        self.prefetch_related = list(prefetch_related)
+        self.only = list(only) if only is not None else None
+
+    def apply(self, queryset, restrict_columns=True):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if restrict_columns and self.only:
+            queryset = queryset.only(*self.only)
+        return queryset
+
+
+def _field_serializer(field):
+    """Serializer imbriqué porté par un champ (None pour un champ simple)."""
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+    if isinstance(field, serializers.BaseSerializer) and getattr(getattr(field, "Meta", None), "model", None):
+        return field
+    return None
+
+
+def _walk(serializer, model):
+    """
+    Parcourt les champs lus d'un serializer.
+
+    Returns:
+        tuple: (select_related, prefetch_related, colonnes lues, plan exact)
+    """
+    select, prefetch, columns = [], [], []
+    exact = True
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.SerializerMethodField) or field.source == "*":
+            exact = False
+            continue
+
+        nested = _field_serializer(field)
+        current_model, path = model, []
+        for position, attr in enumerate(field.source_attrs):
+            last = position == len(field.source_attrs) - 1
+            try:
+                model_field = current_model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # Propriété ou méthode : colonnes lues inconnues
+                exact = False
+                break
+
+            lookup = "__".join(path + [attr])
+            if not model_field.is_relation:
+                columns.append(lookup)
+                break
+
+            if model_field.one_to_many or model_field.many_to_many:
+                related_model = model_field.related_model
+                if nested is not None and last:
+                    child_select, child_prefetch, _, _ = _walk(nested, related_model)
+                    child_queryset = related_model._default_manager.all()
+                    if child_select:
+                        child_queryset = child_queryset.select_related(*child_select)
+                    if child_prefetch:
+                        child_queryset = child_queryset.prefetch_related(*child_prefetch)
+                    prefetch.append(Prefetch(lookup, queryset=child_queryset))
+                else:
+                    prefetch.append(lookup)
+                # Les colonnes d'une relation multiple ne concernent pas le queryset principal
+                break
+
+            # Clé étrangère ou one-to-one
+            if model_field.concrete:
+                columns.append(lookup)
+            if last and nested is None:
+                # Clé primaire seule (PrimaryKeyRelatedField) : pas de jointure nécessaire
+                break
+
+            select.append(lookup)
+            path.append(attr)
+            current_model = model_field.related_model
+            if last:
+                child_select, child_prefetch, child_columns, child_exact = _walk(nested, current_model)
+                select += [f"{lookup}__{name}" for name in child_select]
+                prefetch += [f"{lookup}__{name}" for name in child_prefetch if isinstance(name, str)]
+                columns += [f"{lookup}__{name}" for name in child_columns]
+                exact = exact and child_exact and not child_prefetch
+
+    return select, prefetch, columns, exact
+
+
+def build_query_plan(serializer_class, model):
+    """
+    Construit (et mémorise) le plan de requête d'un serializer de modèle.
+
+    Args:
+        serializer_class (type): Serializer utilisé pour la réponse
+        model (Model): Modèle du queryset
+
+    Returns:
+        QueryPlan
+    """
+    key = (serializer_class, model)
+    if key not in _plans:
+        select, prefetch, columns, exact = _walk(serializer_class(), model)
+        only = None
+        if exact and columns:
+            only = list(dict.fromkeys([model._meta.pk.name] + columns))
+        _plans[key] = QueryPlan(
+            select_related=dict.fromkeys(select), prefetch_related=prefetch, only=only
+        )
+        logger.debug(
+            f"[QUERY] Plan {serializer_class.__name__} : select_related={select}, "
+            f"prefetch_related={[getattr(p, 'prefetch_through', p) for p in prefetch]}, only={only}"
+        )
+    return _plans[key]
+
+
+class QueryCounter:
+    """Compte les requêtes SQL exécutées (via `connection.execute_wrapper`)."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueryOptimizerMixin:
+    """
+    Mixin de ViewSet : applique au queryset le plan dérivé du serializer de l'action
+    (`select_related`, `prefetch_related`, `only()` en lecture seule).
+
+    Surcharges par serializer (classe) ou par action (nom), clé par clé (une valeur None
+    désactive l'optimisation) :
+
+        query_plan_overrides = {
+            "list": {"only": None, "prefetch_related": ["media"]},
+            ParticipantSerializer: {"select_related": ["user", "challenge"]},
+        }
+
+    Avec settings.MYEVOL_QUERY_COUNT_HEADER, chaque réponse porte l'en-tête
+    `X-Query-Count` (nombre de requêtes SQL exécutées pour la requête HTTP).
+    """
+
+    query_plan_overrides = {}
+
+    def get_query_plan(self, serializer_class=None):
+        serializer_class = serializer_class or self.get_serializer_class()
+        model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+        if model is None:
+            return None
+        plan = build_query_plan(serializer_class, model)
+
+        overrides = self.query_plan_overrides.get(serializer_class) or self.query_plan_overrides.get(self.action)
+        if overrides:
+            plan = QueryPlan(
+                select_related=overrides.get("select_related", plan.select_related) or (),
+                prefetch_related=overrides.get("prefetch_related", plan.prefetch_related) or (),
+                only=overrides["only"] if "only" in overrides else plan.only,
+            )
+        return plan
+
+    def optimize_queryset(self, queryset, serializer_class=None):
+        """Applique le plan du serializer (celui de l'action par défaut) à un queryset."""
+        if not isinstance(queryset, QuerySet):
+            return queryset
+        serializer_class = serializer_class or self.get_serializer_class()
+        plan = self.get_query_plan(serializer_class)
+        if plan is None or not issubclass(queryset.model, serializer_class.Meta.model):
+            return queryset
+        return plan.apply(queryset, restrict_columns=self.request.method in SAFE_METHODS)
+
+    def filter_queryset(self, queryset):
+        return self.optimize_queryset(super().filter_queryset(queryset))
+
+    def dispatch(self, request, *args, **kwargs):
+        if not getattr(settings, "MYEVOL_QUERY_COUNT_HEADER", False):
+            return super().dispatch(request, *args, **kwargs)
+
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = super().dispatch(request, *args, **kwargs)
+            # Le rendu (et donc la sérialisation paresseuse) est compté lui aussi
+            if hasattr(response, "render") and not getattr(response, "is_rendered", True):
+                response.render()
+        response[QUERY_COUNT_HEADER] = str(counter.count)
+        return response
@@ -1,5 +1,6 @@
 # Myevol_app/api_viewsets/notification_viewset.py
 
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import viewsets, filters, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -8,7 +9,7 @@ from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
 
 from Myevol_app.models.notification_model import Notification
-from Myevol_app.paginations import MyEvolPagination
+from Myevol_app.paginations import MyEvolHybridPagination
 from Myevol_app.serializers.notification_serializers import (
     NotificationSerializer,
     NotificationListSerializer,
@@ -18,6 +19,7 @@ from Myevol_app.serializers.notification_serializers import (
     NotificationBulkActionSerializer
 )
 from Myevol_app.permissions import IsOwnerOrAdmin
+from Myevol_app.viewsets.mixins import QueryOptimizerMixin
 
 
 @extend_schema(
@@ -27,17 +29,17 @@ from Myevol_app.permissions import IsOwnerOrAdmin
     - lister les notifications (`GET`)
     - en créer (`POST`)
     - les mettre à jour (`PATCH`)
-    - compter et filtrer (`/count/`, `/unread/`, `/bulk/`)
+    - compter et filtrer (`/count/`, `/unread-count/`, `/unread/`, `/bulk/`)
     """,
     tags=["Notifications"]
 )
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(QueryOptimizerMixin, viewsets.ModelViewSet):
     """
     ViewSet pour gérer les notifications utilisateur.
     """
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
-    pagination_class = MyEvolPagination
+    pagination_class = MyEvolHybridPagination
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     ordering = ['-created_at']
     search_fields = ['message', 'notif_type']
@@ -67,6 +69,31 @@ class NotificationViewSet(viewsets.ModelViewSet):
         serializer = NotificationCountSerializer(instance=request.user)
         return Response(serializer.data)
 
+    @extend_schema(
+        summary="Nombre de notifications non lues (polling)",
+        description="""
+        Lecture du compteur dénormalisé de l'utilisateur connecté : aucune requête
+        au-delà de l'authentification.
+        - La réponse porte un `ETag` : `If-None-Match` retourne `304` si le nombre n'a pas changé.
+        """,
+        responses={
+            200: OpenApiResponse(description="{\"unread\": <nombre>}"),
+            304: OpenApiResponse(description="Nombre inchangé"),
+        }
+    )
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated], url_path='unread-count')
+    def unread_count(self, request):
+        user = request.user
+        unread = user.unread_notifications_count
+        etag = quote_etag(f"{user.pk}-{unread}")
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response({"unread": unread})
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
     @extend_schema(
         summary="Actions de masse sur les notifications",
         description="Permet d'archiver ou de marquer comme lues plusieurs notifications à la fois.",
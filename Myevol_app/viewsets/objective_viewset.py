@@ -17,6 +17,8 @@ from Myevol_app.serializers.objective_serializers import (
     ObjectiveCategorySerializer
 )
 from Myevol_app.permissions import IsOwnerOrAdmin
+from Myevol_app.services.objective_progress_service import annotate_progress
+from Myevol_app.viewsets.mixins import QueryOptimizerMixin
 
 
 @extend_schema(
@@ -24,7 +26,7 @@ from Myevol_app.permissions import IsOwnerOrAdmin
     description="Créer, lister, modifier, supprimer et analyser ses objectifs personnels.",
     tags=["Objectifs"]
 )
-class ObjectiveViewSet(viewsets.ModelViewSet):
+class ObjectiveViewSet(QueryOptimizerMixin, viewsets.ModelViewSet):
     """
     ViewSet principal pour gérer les objectifs.
     """
@@ -35,7 +37,7 @@ class ObjectiveViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'category']
 
     def get_queryset(self):
-        return Objective.objects.filter(user=self.request.user)
+        return annotate_progress(Objective.objects.filter(user=self.request.user))
 
     def get_serializer_class(self):
         if self.action == 'list':
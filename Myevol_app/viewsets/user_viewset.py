@@ -13,6 +13,7 @@ from ..serializers.user_serializers import (
     UserXpSerializer,
     UserPreferencesSerializer,
 )
+from .me_viewset import profile_response
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -36,9 +37,7 @@ class UserViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'], url_path='me')
     def me(self, request):
-        user = self.get_object()
-        serializer = UserProfileSerializer(user)
-        return Response(serializer.data)
+        return profile_response(request, self.get_object())
 
     @extend_schema(
         summary="Mettre à jour mon profil",
@@ -172,7 +172,54 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Pipeline post-écriture des entrées (stats, défis, badges, streaks)
+MYEVOL_PIPELINE_SYNC = os.getenv('MYEVOL_PIPELINE_SYNC', 'False') == 'True'
+MYEVOL_PIPELINE_DELAY = int(os.getenv('MYEVOL_PIPELINE_DELAY', 5))
+
+# Profil "me" en cache (versionné par utilisateur)
+MYEVOL_PROFILE_CACHE_TTL = int(os.getenv('MYEVOL_PROFILE_CACHE_TTL', 3600))
+
+# Cache des métriques utilisateur : TTL (secondes) par espace de noms,
+# en surcharge de user_cache_service.DEFAULT_TTLS (ex : {"mood_average": 60})
+MYEVOL_USER_CACHE_TTLS = {}
+
+# En-tête X-Query-Count (nombre de requêtes SQL) sur les réponses des ViewSets optimisés
+MYEVOL_QUERY_COUNT_HEADER = os.getenv('MYEVOL_QUERY_COUNT_HEADER', str(DEBUG)) == 'True'
+
+# Recherche plein texte du journal : chemin d'une classe de backend (search_service).
+# Vide : choisi d'après la base (PostgreSQL tsvector, SQLite FTS5)
+MYEVOL_SEARCH_BACKEND = os.getenv('MYEVOL_SEARCH_BACKEND') or None
+
+# Journal d'événements : écriture différée par lots (event_log_service)
+MYEVOL_EVENT_LOG_SYNC = os.getenv('MYEVOL_EVENT_LOG_SYNC', 'False') == 'True'
+MYEVOL_EVENT_LOG_BATCH_SIZE = int(os.getenv('MYEVOL_EVENT_LOG_BATCH_SIZE', 100))
+MYEVOL_EVENT_LOG_FLUSH_INTERVAL = int(os.getenv('MYEVOL_EVENT_LOG_FLUSH_INTERVAL', 5))
+MYEVOL_EVENT_LOG_MAX_BUFFER = int(os.getenv('MYEVOL_EVENT_LOG_MAX_BUFFER', 10000))
+
+# Agrégats d'événements (event_analytics_service) : rétention des événements bruts et
+# des tranches horaires (jours), taille des lots de purge
+MYEVOL_EVENT_LOG_RETENTION_DAYS = int(os.getenv('MYEVOL_EVENT_LOG_RETENTION_DAYS', 90))
+MYEVOL_EVENT_LOG_HOURLY_RETENTION_DAYS = int(os.getenv('MYEVOL_EVENT_LOG_HOURLY_RETENTION_DAYS', 7))
+MYEVOL_EVENT_LOG_PURGE_CHUNK = int(os.getenv('MYEVOL_EVENT_LOG_PURGE_CHUNK', 5000))
+
+# Purges par lots (purge_service) : taille des lots, pause entre deux lots (secondes),
+# rétentions (jours) par politique en surcharge des valeurs par défaut (ex : {"notifications": 30})
+MYEVOL_PURGE_BATCH_SIZE = int(os.getenv('MYEVOL_PURGE_BATCH_SIZE', 5000))
+MYEVOL_PURGE_SLEEP = float(os.getenv('MYEVOL_PURGE_SLEEP', 0.1))
+MYEVOL_PURGE_RETENTION_DAYS = {}
+
+# Notifications programmées (notification_dispatch_service) : canaux de remise
+# (chemins de classes) et taille des lots réclamés par transaction
+MYEVOL_NOTIFICATION_CHANNELS = [
+    'Myevol_app.services.notification_dispatch_service.InAppChannel',
+]
+MYEVOL_NOTIFICATION_DISPATCH_BATCH_SIZE = int(os.getenv('MYEVOL_NOTIFICATION_DISPATCH_BATCH_SIZE', 500))
+
 CELERY_BEAT_SCHEDULE = {
+    'send_scheduled_notifications': {
+        'task': 'Myevol_app.tasks.send_scheduled_notifications',
+        'schedule': crontab(minute='*/5'),
+    },
     'ask_user_daily_activity': {
         'task': 'Myevol_app.tasks.ask_user_daily_activity',
         'schedule': crontab(hour=19, minute=0),
@@ -193,10 +240,14 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'Myevol_app.tasks.generate_all_annual_stats',
         'schedule': crontab(hour=9, minute=0, day_of_month=1, month_of_year=1),
     },
-    'clean_old_notifications': {
-        'task': 'Myevol_app.tasks.clean_old_notifications',
+    'purge_old_records': {
+        'task': 'Myevol_app.tasks.purge_old_records',
         'schedule': crontab(hour=3, minute=0),
     },
+    'reconcile_user_counters': {
+        'task': 'Myevol_app.tasks.reconcile_user_counters',
+        'schedule': crontab(hour=0, minute=45),
+    },
     'update_user_streaks': {
         'task': 'Myevol_app.tasks.recalculate_all_streaks',
         'schedule': crontab(hour=0, minute=30),
@@ -205,6 +256,10 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'Myevol_app.tasks.remind_inactive_users',
         'schedule': crontab(hour=18, minute=0),
     },
+    'rollup_event_logs': {
+        'task': 'Myevol_app.tasks.rollup_event_logs',
+        'schedule': crontab(minute=10),
+    },
 }
 
 # === EMAIL ===
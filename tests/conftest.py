@@ -0,0 +1,16 @@
+# tests/conftest.py
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def synchronous_pipelines(settings):
+    """
+    Exécute les traitements différés (Celery / on_commit) immédiatement pendant les tests
+    et repart d'un cache vide pour chaque test.
+    """
+    settings.MYEVOL_PIPELINE_SYNC = True
+    settings.MYEVOL_EVENT_LOG_SYNC = True
+    cache.clear()
+    yield
+    cache.clear()
@@ -93,38 +93,45 @@ class BadgeTemplateModelTestCase(TestCase):
         self.assertEqual(BadgeTemplate(name="Niveau 5").extract_level_number(), 5)
         self.assertIsNone(BadgeTemplate(name="Pas un niveau").extract_level_number())
 
-    def test_check_unlock_first_entry(self):
-        self.user.total_entries.return_value = 1
-        self.user.mood_average.return_value = None
-        self.user.has_entries_every_day.return_value = False
-        self.user.entries_today.return_value = 0
-        self.user.all_objectives_achieved.return_value = False
+    def _metrics(self, **overrides):
+        metrics = {
+            "total_entries": 0,
+            "mood_average_7d": None,
+            "entries_today": 0,
+            "current_streak": 0,
+            "has_pending_objectives": True,
+        }
+        metrics.update(overrides)
+        return metrics
 
-        result = self.template.check_unlock(self.user)
+    def test_check_unlock_first_entry(self):
+        result = self.template.check_unlock(self.user, metrics=self._metrics(total_entries=1))
         self.assertTrue(result)
 
     def test_check_unlock_failure(self):
-        self.user.total_entries.return_value = 0
-        self.user.mood_average.return_value = 5
-        self.user.has_entries_every_day.return_value = False
-        self.user.entries_today.return_value = 0
-        self.user.all_objectives_achieved.return_value = False
-
-        result = self.template.check_unlock(self.user)
+        result = self.template.check_unlock(self.user, metrics=self._metrics(mood_average_7d=5))
         self.assertFalse(result)
 
-    def test_get_progress_unlocked(self):
-        self.user.total_entries.return_value = 1
-        self.user.badges.filter.return_value.exists.return_value = True
+    def test_check_unlock_streak_and_level_rules(self):
+        regular = BadgeTemplate(name="Régulier")
+        level = BadgeTemplate(name="Niveau 2")
+        unknown = BadgeTemplate(name="Badge inconnu")
+
+        self.assertTrue(regular.check_unlock(self.user, metrics=self._metrics(current_streak=5)))
+        self.assertFalse(regular.check_unlock(self.user, metrics=self._metrics(current_streak=4)))
+        self.assertTrue(level.check_unlock(self.user, metrics=self._metrics(total_entries=5)))
+        self.assertFalse(unknown.check_unlock(self.user, metrics=self._metrics(total_entries=500)))
 
-        progress = self.template.get_progress(self.user)
+    def test_get_progress_unlocked(self):
+        progress = self.template.get_progress(
+            self.user, metrics=self._metrics(total_entries=1), earned_names={self.template.name}
+        )
         self.assertTrue(progress["unlocked"])
         self.assertEqual(progress["percent"], 100)
 
     def test_get_progress_locked(self):
-        self.user.total_entries.return_value = 0
-        self.user.badges.filter.return_value.exists.return_value = False
-
-        progress = self.template.get_progress(self.user)
+        progress = self.template.get_progress(
+            self.user, metrics=self._metrics(total_entries=0), earned_names=set()
+        )
         self.assertFalse(progress["unlocked"])
         self.assertEqual(progress["percent"], 0)
@@ -2,14 +2,14 @@
 
 from datetime import timedelta
 from django.test import TestCase
-from django.utils.timezone import now
+from django.utils.timezone import now, localtime
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from unittest.mock import patch, MagicMock
 from freezegun import freeze_time
 
-from Myevol_app.models import JournalEntry, JournalMedia
+from Myevol_app.models import JournalEntry, JournalMedia, DailyStat
 
 User = get_user_model()
 
@@ -56,12 +56,9 @@ class JournalEntryTests(TestCase, BaseUserTestMixin):
         with self.assertRaises(ValidationError):
             self.entry.clean()
 
-    @patch('Myevol_app.models.stats_model.DailyStat.generate_for_user')
     @patch('Myevol_app.services.challenge_service.check_challenges')
     @patch('Myevol_app.models.user_model.User.update_badges')
-    @patch('Myevol_app.models.user_model.User.update_streaks')
-    def test_save_method_triggers_updates(self, mock_update_streaks, mock_update_badges,
-                                          mock_check_challenges, mock_generate_stats):
+    def test_save_method_triggers_updates(self, mock_update_badges, mock_check_challenges):
         new_entry = JournalEntry(
             user=self.user,
             content="New entry to test save",
@@ -70,10 +67,11 @@ class JournalEntryTests(TestCase, BaseUserTestMixin):
         )
         new_entry.save()
 
-        mock_generate_stats.assert_called_with(self.user, new_entry.created_at.date())
+        daily = DailyStat.objects.get(user=self.user, date=localtime(new_entry.created_at).date())
+        self.assertEqual(daily.categories.get("save_test"), 1)
         mock_check_challenges.assert_called_with(self.user)
         mock_update_badges.assert_called()
-        mock_update_streaks.assert_called()
+        self.assertEqual(self.user.current_streak(localtime(new_entry.created_at).date()), 1)
 
     @freeze_time("2025-04-22")
     def test_count_today(self):
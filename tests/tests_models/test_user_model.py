@@ -53,7 +53,7 @@ class UserModelTests(TestCase):
     @patch('Myevol_app.models.user_model.update_user_badges')
     def test_update_badges(self, mock_update_badges):
         self.user.update_badges()
-        mock_update_badges.assert_called_once_with(self.user)
+        mock_update_badges.assert_called_once_with(self.user, changed_metrics=None)
 
     @patch('Myevol_app.models.user_model.update_user_streak')
     def test_update_streaks(self, mock_update_streak):
@@ -109,25 +109,14 @@ class TestJournalSerializers(TestCase):
 
     # --- Tests JournalEntryCalendar ---
     def test_journal_entry_calendar_serializer(self):
-        # Créer une entrée qui sera utilisée pour simuler le calendrier
-        entry = JournalEntry.objects.create(
-            user=self.user,
-            content="Entrée calendrier",
-            mood=7,
-            category="Vie"
-        )
-
-        # Annoter l'entrée manuellement pour simuler le queryset que le serializer attendrait
-        entry.day = entry.created_at.date()
-        entry.count = 1
-        entry.mood_avg = 7.0
-        entry.categories = ["Vie"]
+        # Jour agrégé tel que produit par journal_service.get_calendar
+        day = {"day": timezone.now().date(), "count": 1, "mood_avg": 7.0, "categories": ["Vie"]}
 
-        serializer = JournalEntryCalendarSerializer(instance=entry)
+        serializer = JournalEntryCalendarSerializer(instance=day)
         serialized = serializer.data
 
         self.assertIn('day', serialized)
-        self.assertEqual(serialized['day'], entry.day)
+        self.assertEqual(serialized['day'], day["day"].isoformat())
         self.assertIn('count', serialized)
         self.assertEqual(serialized['count'], 1)
         self.assertIn('mood_avg', serialized)
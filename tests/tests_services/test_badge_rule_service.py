@@ -0,0 +1,87 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from unittest.mock import patch
+
+from Myevol_app.models import JournalEntry, Objective, BadgeTemplate, Badge
+from Myevol_app.services import badge_rule_service, badge_service
+
+User = get_user_model()
+
+
+class BadgeRuleServiceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="badger", email="badger@example.com", password="testpass"
+        )
+        for name in ("Première entrée", "Productivité", "Objectif rempli !", "Niveau 1", "Badge libre"):
+            BadgeTemplate.objects.create(name=name, description=name, icon="🏅", condition=name)
+
+    def _create_entries(self, count, mood=9):
+        with patch("Myevol_app.models.user_model.User.update_badges"):
+            for _ in range(count):
+                JournalEntry.objects.create(user=self.user, content="Entrée", mood=mood, category="Travail")
+
+    def test_snapshot_is_a_single_query(self):
+        self._create_entries(3)
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(1):
+            metrics = badge_rule_service.build_user_metrics(user)
+
+        self.assertEqual(metrics["total_entries"], 3)
+        self.assertEqual(metrics["entries_today"], 3)
+        self.assertEqual(metrics["mood_average_7d"], 9.0)
+        self.assertEqual(metrics["current_streak"], 1)
+        self.assertFalse(metrics["has_pending_objectives"])
+
+    def test_update_awards_every_matching_template_from_one_snapshot(self):
+        self._create_entries(3)
+        Objective.objects.create(user=self.user, title="Lire", category="Lecture",
+                                 target_date=self.user.date_joined.date(), target_value=1)
+
+        with patch.object(badge_service, "build_user_metrics", wraps=badge_rule_service.build_user_metrics) as snapshot:
+            new_badges = badge_service.update_user_badges(self.user, return_new_badges=True)
+
+        snapshot.assert_called_once()
+        self.assertEqual(
+            {badge.name for badge in new_badges},
+            {"Niveau 1", "Productivité", "Première entrée"},
+        )
+
+    def test_only_affected_templates_are_rechecked(self):
+        self._create_entries(1)
+
+        with patch.object(BadgeTemplate, "check_unlock", return_value=False) as check_unlock:
+            badge_service.update_user_badges(self.user, changed_metrics={"has_pending_objectives"})
+
+        # Seul "Objectif rempli !" dépend des objectifs
+        self.assertEqual(check_unlock.call_count, 1)
+
+    def test_unrelated_metrics_skip_all_queries(self):
+        with self.assertNumQueries(0):
+            badge_service.update_user_badges(self.user, changed_metrics={"dark_mode"})
+
+    def test_entry_creation_unlocks_first_entry_badge(self):
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=5, category="Travail")
+        self.assertTrue(Badge.objects.filter(user=self.user, name="Première entrée").exists())
+
+    def test_deleting_last_pending_objective_unlocks_objective_badge(self):
+        objective = Objective.objects.create(
+            user=self.user, title="Lire", category="Loisir", target_date="2099-01-01", target_value=1
+        )
+        self.assertFalse(Badge.objects.filter(user=self.user, name="Objectif rempli !").exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            objective.delete()
+
+        self.assertTrue(Badge.objects.filter(user=self.user, name="Objectif rempli !").exists())
+
+    def test_account_deletion_does_not_recheck_objective_badges(self):
+        Objective.objects.create(
+            user=self.user, title="Lire", category="Loisir", target_date="2099-01-01", target_value=1
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+
+        self.assertFalse(Badge.objects.exists())
@@ -0,0 +1,96 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils.timezone import now
+
+from Myevol_app.models import Challenge, ChallengeProgress, EventLog, JournalEntry, Notification
+from Myevol_app.services import challenge_service
+
+User = get_user_model()
+
+
+class ChallengeEvaluationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="challenger", email="challenger@example.com", password="testpass"
+        )
+        today = now().date()
+        self.easy = Challenge.objects.create(
+            title="Facile", description="-", start_date=today - timedelta(days=3),
+            end_date=today + timedelta(days=3), target_entries=2,
+        )
+        self.hard = Challenge.objects.create(
+            title="Difficile", description="-", start_date=today,
+            end_date=today + timedelta(days=10), target_entries=5,
+        )
+        Challenge.objects.create(
+            title="Terminé", description="-", start_date=today - timedelta(days=20),
+            end_date=today - timedelta(days=10), target_entries=1,
+        )
+
+    def _create_entries(self, count):
+        with patch("Myevol_app.services.challenge_service.check_challenges"):
+            for _ in range(count):
+                JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Travail")
+
+    def test_counts_every_window_in_one_query(self):
+        self._create_entries(3)
+        challenges = [self.easy, self.hard]
+
+        with self.assertNumQueries(1):
+            counts = challenge_service.count_entries_per_challenge(self.user, challenges)
+
+        self.assertEqual(counts, {self.easy.pk: 3, self.hard.pk: 3})
+
+    def test_creates_progress_and_notifies_completed_challenges(self):
+        self._create_entries(2)
+
+        completed = challenge_service.check_user_challenges(self.user)
+
+        self.assertEqual(completed, [self.easy])
+        easy = ChallengeProgress.objects.get(user=self.user, challenge=self.easy)
+        self.assertTrue(easy.completed)
+        self.assertIsNotNone(easy.completed_at)
+        self.assertFalse(ChallengeProgress.objects.get(user=self.user, challenge=self.hard).completed)
+        self.assertEqual(
+            list(Notification.objects.filter(user=self.user, notif_type="objectif").values_list("message", flat=True)),
+            ["🎯 Félicitations ! Vous avez complété le défi : Facile"],
+        )
+
+    def test_completion_is_logged_and_rechecks_badges_once(self):
+        self._create_entries(2)
+
+        with patch.object(challenge_service, "update_user_badges") as badges:
+            challenge_service.check_user_challenges(self.user)
+            challenge_service.check_user_challenges(self.user)
+
+        badges.assert_called_once_with(self.user)
+        self.assertEqual(
+            list(EventLog.objects.filter(action="defi_termine").values_list("metadata", flat=True)),
+            [{"challenge_id": self.easy.pk}],
+        )
+
+    def test_completed_challenge_is_notified_once(self):
+        self._create_entries(2)
+        challenge_service.check_user_challenges(self.user)
+
+        self.assertEqual(challenge_service.check_user_challenges(self.user), [])
+        self.assertEqual(Notification.objects.filter(user=self.user, notif_type="objectif").count(), 1)
+
+    def test_query_count_does_not_depend_on_challenge_count(self):
+        today = now().date()
+        for index in range(10):
+            Challenge.objects.create(
+                title=f"Défi {index}", description="-", start_date=today,
+                end_date=today + timedelta(days=5), target_entries=1,
+            )
+        JournalEntry.objects.bulk_create([JournalEntry(user=self.user, content="Entrée", mood=6, category="Travail")])
+
+        # Défis actifs, agrégation, progressions existantes, upsert, notifications,
+        # compteur de notifications non lues, événements "defi_termine", vérification des badges
+        with self.assertNumQueries(9):
+            completed = challenge_service.check_user_challenges(self.user)
+
+        self.assertEqual(len(completed), 10)
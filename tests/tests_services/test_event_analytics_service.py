@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from freezegun import freeze_time
+from rest_framework.test import APIClient
+
+from Myevol_app.models import EventLog, EventLogBucket
+from Myevol_app.services import event_analytics_service
+
+User = get_user_model()
+
+
+@freeze_time("2025-04-23 12:30:00")
+class EventAnalyticsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="audit", email="audit@example.com", password="testpass")
+        self.other = User.objects.create_user(username="autre", email="autre@example.com", password="testpass")
+        EventLog.objects.all().delete()
+
+        current = timezone.now()
+        for age, action, severity, user in [
+            (timedelta(days=40), "a", "INFO", self.user),
+            (timedelta(days=40), "a", "INFO", self.user),
+            (timedelta(days=10), "b", "WARN", self.user),
+            (timedelta(days=3), "a", "INFO", self.other),
+            (timedelta(hours=2), "c", "ERROR", self.user),
+            (timedelta(minutes=10), "a", "INFO", None),
+        ]:
+            EventLog.objects.create(action=action, severity=severity, user=user, created_at=current - age)
+
+    def test_statistics_are_unchanged_by_rollup(self):
+        before = event_analytics_service.get_event_statistics(30)
+        event_analytics_service.rollup_events()
+
+        with self.assertNumQueries(4):
+            after = event_analytics_service.get_event_statistics(30)
+
+        self.assertEqual(after, before)
+        self.assertEqual(after["total_events"], 4)
+        self.assertEqual(after["events_by_action"], {"a": 2, "b": 1, "c": 1})
+        self.assertEqual(after["events_by_severity"], {"INFO": 2, "WARN": 1, "ERROR": 1})
+        self.assertEqual(after["events_by_time"], {"last_24h": 2, "last_7d": 3, "last_30d": 4})
+
+    def test_user_statistics(self):
+        event_analytics_service.rollup_events()
+
+        stats = event_analytics_service.get_event_statistics(60, user=self.user)
+
+        self.assertEqual(stats["total_events"], 4)
+        self.assertEqual(stats["events_by_action"], {"a": 2, "b": 1, "c": 1})
+
+    def test_rollup_is_incremental(self):
+        first = event_analytics_service.rollup_events()
+        second = event_analytics_service.rollup_events()
+
+        self.assertGreater(first["hourly_buckets"], 0)
+        self.assertGreater(first["daily_buckets"], 0)
+        self.assertEqual((second["hourly_buckets"], second["daily_buckets"]), (0, 0))
+        # Tranches horaires conservées 7 jours ; l'événement de l'heure en cours reste brut
+        hourly_total = sum(EventLogBucket.objects.filter(granularity=EventLogBucket.HOUR).values_list("count", flat=True))
+        daily_total = sum(EventLogBucket.objects.filter(granularity=EventLogBucket.DAY).values_list("count", flat=True))
+        self.assertEqual(hourly_total, 2)
+        self.assertEqual(daily_total, 4)
+
+    @override_settings(MYEVOL_EVENT_LOG_RETENTION_DAYS=30, MYEVOL_EVENT_LOG_PURGE_CHUNK=1)
+    def test_retention_purges_raw_events_in_chunks(self):
+        report = event_analytics_service.rollup_events()
+
+        self.assertEqual(report["purged_events"], 2)
+        self.assertEqual(EventLog.objects.count(), 4)
+        # Les événements purgés restent comptés dans les agrégats journaliers
+        self.assertEqual(event_analytics_service.get_event_statistics(60)["total_events"], 6)
+        # Les tranches horaires au-delà de leur rétention sont purgées
+        oldest_hourly = EventLogBucket.objects.filter(granularity=EventLogBucket.HOUR).order_by("bucket_start").first()
+        self.assertGreaterEqual(oldest_hourly.bucket_start, timezone.now() - timedelta(days=8))
+
+    def test_quiet_week_does_not_recount_rolled_up_events(self):
+        event_analytics_service.rollup_events()
+
+        # Une semaine sans événement : toutes les tranches horaires sont purgées
+        with freeze_time("2025-05-01 12:30:00"):
+            event_analytics_service.rollup_events()
+            self.assertFalse(EventLogBucket.objects.filter(granularity=EventLogBucket.HOUR).exists())
+
+            stats = event_analytics_service.get_event_statistics(60)
+            again = event_analytics_service.rollup_events()
+
+        self.assertEqual(stats["total_events"], 6)
+        self.assertEqual((again["hourly_buckets"], again["daily_buckets"]), (0, 0))
+
+    def test_statistics_endpoint(self):
+        event_analytics_service.rollup_events()
+        staff = User.objects.create_user(username="staff", email="staff@example.com", password="testpass", is_staff=True)
+        client = APIClient()
+
+        client.force_authenticate(user=staff)
+        response = client.get(reverse("eventlog-statistics"), {"days": 30})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total_events"], 4)
+        self.assertEqual(response.data["events_by_time"]["last_24h"], 2)
+
+        client.force_authenticate(user=self.other)
+        response = client.get(reverse("eventlog-statistics"))
+        self.assertEqual(response.data["total_events"], 1)
@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from Myevol_app.models import EventLog
+from Myevol_app.services import event_log_service
+from Myevol_app.services.event_log_service import EventLogBuffer
+
+User = get_user_model()
+
+
+@override_settings(
+    MYEVOL_EVENT_LOG_BATCH_SIZE=3,
+    MYEVOL_EVENT_LOG_FLUSH_INTERVAL=3600,
+    MYEVOL_EVENT_LOG_MAX_BUFFER=5,
+)
+class EventLogBufferTests(TestCase):
+    def setUp(self):
+        buffered = override_settings(MYEVOL_EVENT_LOG_SYNC=False)
+        buffered.enable()
+        self.addCleanup(buffered.disable)
+        self.user = User.objects.create_user(username="auditee", email="auditee@example.com", password="testpass")
+        self.buffer = EventLogBuffer()
+        patcher = patch.object(event_log_service, "event_buffer", self.buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.buffer.flush)
+
+    def _log_uncommitted(self, action="test", user=None):
+        return event_log_service.log_event(action, "Événement", user=user or self.user, source="test")
+
+    def _log(self, action="test", user=None):
+        # Simule la validation de la transaction appelante
+        with self.captureOnCommitCallbacks(execute=True):
+            return self._log_uncommitted(action, user)
+
+    def test_events_are_buffered_then_bulk_inserted_on_size(self):
+        self._log("a")
+        self._log("b")
+        self.assertEqual(EventLog.objects.count(), 0)
+        self.assertEqual(len(self.buffer), 2)
+
+        # Dans une transaction, la mise en tampon puis le vidage attendent sa validation ;
+        # puis une requête pour écarter les utilisateurs supprimés et une pour l'insertion groupée
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._log_uncommitted("c")
+        self.assertEqual(len(self.buffer), 2)
+        with self.captureOnCommitCallbacks() as flushes:
+            callbacks[0]()
+        self.assertEqual(EventLog.objects.count(), 0)
+        with self.assertNumQueries(2):
+            flushes[0]()
+
+        self.assertEqual(list(EventLog.objects.order_by("created_at").values_list("action", flat=True)), ["a", "b", "c"])
+        self.assertEqual(EventLog.objects.get(action="a").metadata, {"source": "test"})
+        self.assertEqual(self.buffer.get_stats()["flushed"], 3)
+
+    def test_events_of_rolled_back_transactions_are_never_written(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self._log_uncommitted("annulé")
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+            self._log_uncommitted("validé")
+
+        self.assertEqual(len(self.buffer), 1)
+        event_log_service.flush_events()
+        self.assertEqual(list(EventLog.objects.values_list("action", flat=True)), ["validé"])
+
+    @override_settings(MYEVOL_EVENT_LOG_FLUSH_INTERVAL=0)
+    def test_flushes_on_time_threshold(self):
+        self._log()
+        self.assertEqual(EventLog.objects.count(), 1)
+
+    def test_event_time_is_kept_when_flushed_later(self):
+        event = self._log()
+        event_log_service.flush_events()
+
+        self.assertEqual(EventLog.objects.get().created_at, event.created_at)
+
+    def test_overflow_drops_oldest_events(self):
+        with override_settings(MYEVOL_EVENT_LOG_BATCH_SIZE=100):
+            for i in range(7):
+                self._log(f"e{i}")
+
+        stats = self.buffer.get_stats()
+        self.assertEqual((stats["overflow"], stats["dropped"], stats["pending"]), (2, 2, 5))
+
+        self.buffer.flush()
+        self.assertFalse(EventLog.objects.filter(action__in=["e0", "e1"]).exists())
+        self.assertEqual(EventLog.objects.count(), 5)
+
+    def test_events_of_deleted_users_are_dropped_not_the_batch(self):
+        ghost = User.objects.create_user(username="ghost", email="ghost@example.com", password="testpass")
+        self._log("kept")
+        self._log("lost", user=ghost)
+        EventLog.objects.filter(user=ghost).delete()
+        User.objects.filter(pk=ghost.pk).delete()
+
+        self.buffer.flush()
+
+        self.assertEqual(list(EventLog.objects.values_list("action", flat=True)), ["kept"])
+        self.assertEqual(self.buffer.get_stats()["dropped"], 1)
+
+    def test_worker_shutdown_flushes_pending_events(self):
+        from Myevol_app.signals.event_log_signals import flush_event_log_buffer
+
+        self._log()
+        flush_event_log_buffer()
+
+        self.assertEqual(EventLog.objects.count(), 1)
+        self.assertEqual(self.buffer.get_stats()["pending"], 0)
+
+    @override_settings(MYEVOL_EVENT_LOG_SYNC=True)
+    def test_sync_mode_writes_immediately(self):
+        event = self._log()
+
+        self.assertIsNotNone(event.pk)
+        self.assertEqual(len(self.buffer), 0)
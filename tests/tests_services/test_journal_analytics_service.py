@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils.timezone import make_aware
+from freezegun import freeze_time
+
+from Myevol_app.models import JournalEntry
+from Myevol_app.serializers.journal_serializers import JournalStatsSerializer
+from Myevol_app.services import journal_analytics_service
+
+User = get_user_model()
+
+
+@freeze_time("2025-04-23 12:00:00")
+class JournalAnalyticsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="analyst", email="analyst@example.com", password="testpass"
+        )
+        for when, mood, category in [
+            (datetime(2024, 1, 10, 12), 2, "Travail"),   # hors de la fenêtre d'un an
+            (datetime(2025, 2, 10, 12), 3, "Travail"),   # mois précédent la fenêtre de 30 jours
+            (datetime(2025, 4, 10, 12), 8, "Santé"),
+            (datetime(2025, 4, 21, 12), 7, "Travail"),
+            (datetime(2025, 4, 22, 12), 9, "Santé"),
+            (datetime(2025, 4, 23, 9), 10, "Santé"),
+        ]:
+            JournalEntry.objects.create(
+                user=self.user, content="Entrée", mood=mood, category=category, created_at=make_aware(when)
+            )
+        self.user = User.objects.get(pk=self.user.pk)
+
+    def test_stats_in_two_queries(self):
+        with self.assertNumQueries(2):
+            stats = journal_analytics_service.compute_journal_stats(self.user)
+
+        self.assertEqual(stats["total_entries"], 6)
+        self.assertEqual(stats["entries_per_category"], {"Santé": 3, "Travail": 3})
+        self.assertEqual(stats["mood_distribution"]["10"], 1)
+        self.assertEqual(stats["mood_distribution"]["1"], 0)
+        self.assertEqual(sum(stats["mood_distribution"].values()), 6)
+        self.assertEqual(stats["monthly_entries"]["2025-04"], 4)
+        self.assertEqual(stats["monthly_entries"]["2025-02"], 1)
+        self.assertNotIn("2024-01", stats["monthly_entries"])
+        self.assertEqual(len(stats["monthly_entries"]), 12)
+        self.assertEqual(stats["average_mood"], {"overall": 6.5, "last_week": 8.7, "last_month": 8.5, "trend": "stable"})
+        self.assertEqual(stats["entries_streak"], {
+            "current": 3, "max": 3, "current_active": True, "last_entry_date": "2025-04-23",
+        })
+
+    def test_empty_journal(self):
+        other = User.objects.create_user(username="vide", email="vide@example.com", password="testpass")
+
+        stats = journal_analytics_service.compute_journal_stats(other)
+
+        self.assertEqual(stats["total_entries"], 0)
+        self.assertEqual(stats["entries_per_category"], {})
+        self.assertEqual(stats["average_mood"], {"overall": 0, "last_week": 0, "last_month": 0, "trend": "stable"})
+        self.assertEqual(stats["entries_streak"], {"current": 0, "max": 0, "dates": []})
+
+    def test_serializer_is_cached_until_next_write(self):
+        data = JournalStatsSerializer(self.user).data
+        self.assertEqual(data["total_entries"], 6)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(JournalStatsSerializer(self.user).data, data)
+
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=5, category="Sport")
+        self.assertEqual(JournalStatsSerializer(self.user).data["entries_per_category"]["Sport"], 1)
@@ -0,0 +1,54 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from unittest.mock import patch
+
+from Myevol_app.models import JournalEntry
+from Myevol_app.services import journal_pipeline_service
+
+User = get_user_model()
+
+
+class JournalPipelineServiceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="pipeline", email="pipeline@example.com", password="testpass"
+        )
+
+    def _create_entry(self, mood=6):
+        return JournalEntry.objects.create(
+            user=self.user, content="Entrée", mood=mood, category="Travail"
+        )
+
+    @override_settings(MYEVOL_PIPELINE_SYNC=False, MYEVOL_PIPELINE_DELAY=30)
+    @patch("Myevol_app.tasks.process_journal_pipeline.apply_async")
+    def test_burst_is_coalesced_after_commit(self, mock_apply_async):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for mood in (5, 6, 7):
+                self._create_entry(mood)
+            mock_apply_async.assert_not_called()
+
+        # Par entrée : planification du pipeline et invalidation du cache utilisateur
+        self.assertEqual(len(callbacks), 6)
+        mock_apply_async.assert_called_once()
+        self.assertEqual(mock_apply_async.call_args.kwargs["args"], [self.user.id])
+        self.assertEqual(mock_apply_async.call_args.kwargs["countdown"], 30)
+
+    @override_settings(MYEVOL_PIPELINE_SYNC=False)
+    @patch("Myevol_app.tasks.process_journal_pipeline.apply_async")
+    @patch("Myevol_app.services.challenge_service.check_challenges")
+    def test_deferred_mode_does_not_run_pipeline_inline(self, mock_check, mock_apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_entry()
+        mock_check.assert_not_called()
+
+    def test_process_pending_entries_runs_pipeline_once(self):
+        with patch.object(journal_pipeline_service, "run_journal_pipeline") as mock_run:
+            self.assertTrue(journal_pipeline_service.process_pending_entries(self.user.id))
+            self.assertFalse(journal_pipeline_service.process_pending_entries(0))
+        mock_run.assert_called_once_with(self.user)
+
+    def test_failing_step_does_not_block_others(self):
+        with patch("Myevol_app.services.challenge_service.check_challenges", side_effect=Exception("boom")), \
+             patch("Myevol_app.models.user_model.User.update_badges") as mock_badges:
+            self._create_entry()
+        mock_badges.assert_called_once()
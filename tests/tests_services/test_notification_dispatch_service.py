@@ -0,0 +1,74 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from Myevol_app import tasks
+from Myevol_app.models import Notification
+from Myevol_app.services.notification_dispatch_service import (
+    EmailChannel, InAppChannel, NotificationChannel, dispatch_due_notifications,
+)
+
+User = get_user_model()
+
+
+class NotificationDispatchTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f"dispatch{i}", email=f"dispatch{i}@example.com", password="testpass")
+            for i in range(3)
+        ]
+        Notification.objects.all().delete()
+        mail.outbox = []
+        past = timezone.now() - timedelta(minutes=5)
+        for user in self.users:
+            for i in range(2):
+                Notification.objects.create(user=user, message=f"Rappel {i}", scheduled_at=past)
+        self.future = Notification.objects.create(
+            user=self.users[0], message="Plus tard", scheduled_at=timezone.now() + timedelta(days=1)
+        )
+
+    def test_dispatches_due_notifications_in_batches(self):
+        # 6 notifications en 2 lots de 4 ; par lot : SAVEPOINT, réservation (utilisateur joint),
+        # variation des compteurs de non-lues, UPDATE groupé, RELEASE
+        with self.assertNumQueries(10):
+            sent = dispatch_due_notifications(batch_size=4)
+
+        self.assertEqual(sent, 6)
+        self.assertEqual(Notification.objects.filter(is_read=True).count(), 6)
+        self.future.refresh_from_db()
+        self.assertFalse(self.future.is_read)
+        self.assertEqual(dispatch_due_notifications(), 0)
+
+    def test_notifications_go_through_every_channel(self):
+        failing = MagicMock(name="failing")
+        failing.deliver.side_effect = RuntimeError("boom")
+        failing.name = "failing"
+
+        sent = dispatch_due_notifications(channels=[failing, EmailChannel(), InAppChannel()])
+
+        self.assertEqual(sent, 6)
+        self.assertEqual(len(mail.outbox), 6)
+        self.assertEqual(sorted(mail.outbox[0].to + mail.outbox[1].to), ["dispatch0@example.com"] * 2)
+
+    @override_settings(MYEVOL_NOTIFICATION_CHANNELS=[
+        "Myevol_app.services.notification_dispatch_service.EmailChannel",
+    ])
+    def test_task_uses_configured_channels(self):
+        result = tasks.send_scheduled_notifications()
+
+        self.assertIn("6 notification(s)", result)
+        self.assertEqual(len(mail.outbox), 6)
+
+
+    def test_incomplete_channel_fails_before_claiming_notifications(self):
+        class IncompleteChannel(NotificationChannel):
+            name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            dispatch_due_notifications(channels=[IncompleteChannel()])
+
+        self.assertFalse(Notification.objects.filter(is_read=True).exists())
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from Myevol_app import tasks
+from Myevol_app.models import JournalEntry, Notification, UserPreference
+from Myevol_app.services import notification_service
+
+User = get_user_model()
+
+
+class NotificationFanOutTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f"user{i}", email=f"user{i}@example.com", password="testpass")
+            for i in range(5)
+        ]
+        Notification.objects.all().delete()
+
+    def _recipients(self, notif_type):
+        return set(Notification.objects.filter(notif_type=notif_type).values_list("user_id", flat=True))
+
+    def test_query_count_does_not_grow_with_users(self):
+        # Une sélection, puis une insertion et une mise à jour des compteurs par lot de 2
+        # (3 lots pour 5 utilisateurs)
+        with self.assertNumQueries(7):
+            report = notification_service.bulk_notify(User.objects.all(), "Bonjour", notif_type="info", batch_size=2)
+
+        self.assertEqual(report["sent"], 5)
+        self.assertEqual(Notification.objects.filter(notif_type="info").count(), 5)
+
+    def test_preferences_are_respected(self):
+        muted = self.users[0]
+        UserPreference.objects.update_or_create(user=muted, defaults={"notif_info": False})
+
+        notification_service.bulk_notify(User.objects.all(), "Bonjour", notif_type="info")
+
+        self.assertNotIn(muted.pk, self._recipients("info"))
+        self.assertEqual(len(self._recipients("info")), 4)
+
+    def test_reminder_types_follow_info_preference_only_in_fan_out(self):
+        muted = self.users[0]
+        UserPreference.objects.update_or_create(user=muted, defaults={"notif_info": False})
+
+        tasks.ask_user_daily_activity()
+
+        self.assertEqual(self._recipients("journal_prompt"), {u.pk for u in self.users[1:]})
+        # Envoi individuel : types inconnus de UserPreference.NOTIFICATION_FIELDS toujours refusés
+        self.assertFalse(UserPreference.objects.get(user=self.users[1]).should_send_notification("journal_prompt"))
+
+    def test_rerun_does_not_duplicate(self):
+        notification_service.bulk_notify(User.objects.all(), "Bonjour", notif_type="info")
+        report = notification_service.bulk_notify(User.objects.all(), "Bonjour", notif_type="info")
+
+        self.assertEqual(report["sent"], 0)
+        self.assertEqual(Notification.objects.filter(notif_type="info").count(), 5)
+
+    def test_remind_inactive_users_skips_recent_writers(self):
+        writer, old_writer = self.users[0], self.users[1]
+        JournalEntry.objects.create(user=writer, content="Aujourd'hui", mood=7, category="Travail")
+        JournalEntry.objects.create(
+            user=old_writer, content="Il y a longtemps", mood=5, category="Travail",
+            created_at=timezone.now() - timedelta(days=5),
+        )
+        Notification.objects.all().delete()
+        self.users[4].is_active = False
+        self.users[4].save()
+
+        result = tasks.remind_inactive_users()
+
+        self.assertEqual(self._recipients("journal_reminder"), {u.pk for u in self.users[1:4]})
+        self.assertIn("3 notification(s)", result)
+
+    def test_daily_prompt_reaches_active_users(self):
+        tasks.ask_user_daily_activity()
+
+        self.assertEqual(self._recipients("journal_prompt"), {u.pk for u in self.users})
@@ -0,0 +1,162 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from Myevol_app.models import JournalEntry, Notification, Objective
+from Myevol_app.services.objective_progress_service import annotate_progress, attach_progress, track_entry
+from Myevol_app.services.stats_service import mark_stats_dirty
+from Myevol_app.viewsets.mixins import QUERY_COUNT_HEADER
+
+User = get_user_model()
+
+
+class ObjectiveProgressTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="obj", email="obj@example.com", password="testpass")
+        self.today = timezone.localdate()
+        self.sport = Objective.objects.create(
+            user=self.user, title="Courir", category="Sport", target_date=self.today, target_value=4
+        )
+        self.reading = Objective.objects.create(
+            user=self.user, title="Lire", category="Lecture", target_date=self.today + timedelta(days=1), target_value=2
+        )
+        for category in ("Sport", "Sport", "Lecture"):
+            JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category=category)
+
+    def test_annotation_matches_per_objective_count(self):
+        objectives = list(annotate_progress(Objective.objects.filter(user=self.user)).order_by("title"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual([o.entries_done() for o in objectives], [2, 0])  # Courir, Lire
+            self.assertEqual([o.progress() for o in objectives], [50, 0])
+
+    def test_attach_progress_uses_one_grouped_query(self):
+        objectives = list(Objective.objects.filter(user=self.user))
+
+        with self.assertNumQueries(1):
+            attach_progress(objectives)
+        with self.assertNumQueries(0):
+            self.assertEqual({o.title: o.entries_done() for o in objectives}, {"Courir": 2, "Lire": 0})
+
+    def test_changed_category_falls_back_to_a_fresh_count(self):
+        objective = annotate_progress(Objective.objects.filter(pk=self.reading.pk)).get()
+        objective.category = "Sport"
+        objective.target_date = self.today
+
+        self.assertEqual(objective.entries_done(), 2)
+
+    def test_save_reuses_the_annotation(self):
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Lecture",
+                                    created_at=timezone.now() + timedelta(days=1))
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Lecture",
+                                    created_at=timezone.now() + timedelta(days=1))
+        objective = annotate_progress(Objective.objects.filter(pk=self.reading.pk)).get()
+
+        with self.assertNumQueries(0):
+            objective.full_clean(exclude=["user"])
+            self.assertEqual(objective.progress(), 100)
+        objective.save()
+        self.assertTrue(Objective.objects.get(pk=self.reading.pk).done)
+
+
+@override_settings(MYEVOL_QUERY_COUNT_HEADER=True)
+class ObjectiveEndpointQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="objapi", email="objapi@example.com", password="testpass")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _create(self, count):
+        for i in range(count):
+            Objective.objects.create(
+                user=self.user, title=f"Objectif {i}", category="Sport",
+                target_date=timezone.localdate() + timedelta(days=i), target_value=2,
+            )
+
+    def test_list_query_count_is_constant(self):
+        self._create(2)
+        small = int(self.client.get(reverse("objective-list"))[QUERY_COUNT_HEADER])
+        self._create(6)
+        response = self.client.get(reverse("objective-list"))
+
+        self.assertEqual(int(response[QUERY_COUNT_HEADER]), small)
+        self.assertEqual(response.data["meta"]["count"], 8)
+
+    def test_detail_exposes_annotated_progress(self):
+        self._create(1)
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Sport")
+        objective = Objective.objects.get(user=self.user)
+
+        response = self.client.get(reverse("objective-detail", args=[objective.pk]))
+
+        self.assertEqual(response.data["entries_done"], 1)
+        self.assertEqual(response.data["progress_percent"], 50)
+
+
+class ObjectiveTrackingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="track", email="track@example.com", password="testpass")
+        self.today = timezone.localdate()
+        self.objective = Objective.objects.create(
+            user=self.user, title="Courir", category="Sport", target_date=self.today, target_value=2
+        )
+        self.other = Objective.objects.create(
+            user=self.user, title="Lire", category="Lecture", target_date=self.today, target_value=1
+        )
+
+    def _write(self, category):
+        return JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category=category)
+
+    def test_entry_writes_complete_matching_objective(self):
+        self._write("Sport")
+        self.objective.refresh_from_db()
+        self.assertFalse(self.objective.done)
+
+        self._write("Sport")
+        self.objective.refresh_from_db()
+        self.other.refresh_from_db()
+
+        self.assertTrue(self.objective.done)
+        self.assertFalse(self.other.done)
+        self.assertEqual(
+            Notification.objects.filter(user=self.user, notif_type="objectif").count(), 1
+        )
+
+    def test_completed_objective_is_not_notified_twice(self):
+        self._write("Lecture")
+        self._write("Lecture")
+
+        self.assertEqual(
+            list(Notification.objects.filter(user=self.user, notif_type="objectif").values_list("message", flat=True)),
+            ["🎯 Objectif atteint : Lire"],
+        )
+
+    def test_track_entry_completes_all_reached_objectives_in_one_update(self):
+        Objective.objects.create(user=self.user, title="Marcher", category="Sport", target_date=self.today, target_value=1)
+        Objective.objects.create(user=self.user, title="Nager", category="Sport", target_date=self.today, target_value=5)
+        JournalEntry.objects.bulk_create([
+            JournalEntry(user=self.user, content="Entrée", mood=6, category="Sport") for _ in range(2)
+        ])
+        mark_stats_dirty(self.user.pk)  # Cumuls non tenus par bulk_create : recomptage
+
+        completed = track_entry(self.user, "Sport", self.today)
+
+        self.assertEqual(sorted(o.title for o in completed), ["Courir", "Marcher"])
+        self.assertEqual(
+            set(Objective.objects.filter(user=self.user, done=True).values_list("title", flat=True)),
+            {"Courir", "Marcher"},
+        )
+        self.assertEqual(Notification.objects.filter(user=self.user, notif_type="objectif").count(), 2)
+
+    def test_track_entry_without_matching_objective_runs_one_select(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(track_entry(self.user, "Musique", self.today), [])
+
+        selects = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(len(selects), 1)
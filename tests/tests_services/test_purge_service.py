@@ -0,0 +1,109 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models.signals import post_delete
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from Myevol_app.models import EventLog, Notification
+from Myevol_app.models.stats_model import DailyStat
+from Myevol_app.services import event_analytics_service, purge_service
+
+User = get_user_model()
+
+
+@override_settings(MYEVOL_PURGE_SLEEP=0)
+class PurgeServiceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="purge", email="purge@example.com", password="testpass")
+        Notification.objects.all().delete()
+        old = timezone.now() - timedelta(days=120)
+        for i in range(5):
+            notification = Notification.objects.create(user=self.user, message=f"Ancienne {i}", notif_type="info")
+            Notification.objects.filter(pk=notification.pk).update(created_at=old)
+        self.recent = Notification.objects.create(user=self.user, message="Récente", notif_type="info")
+
+    def test_deletes_in_bounded_batches(self):
+        report = purge_service.run_policy("notifications", size=2)
+
+        self.assertEqual(report["deleted"], 5)
+        self.assertEqual(report["batches"], 3)
+        self.assertTrue(report["completed"])
+        self.assertEqual(list(Notification.objects.values_list("pk", flat=True)), [self.recent.pk])
+        self.assertIsNone(purge_service.get_checkpoint("notifications"))
+        self.assertEqual(purge_service.get_progress("notifications")["deleted"], 5)
+
+    def test_interrupted_purge_resumes_from_checkpoint(self):
+        first = purge_service.run_policy("notifications", size=2, max_batches=1)
+
+        self.assertFalse(first["completed"])
+        self.assertEqual(first["deleted"], 2)
+        checkpoint = purge_service.get_checkpoint("notifications")
+        self.assertIsNotNone(checkpoint)
+
+        # 2 lots (sélection, variation des compteurs de non-lues, suppression),
+        # repris après le point de reprise
+        with self.assertNumQueries(6):
+            second = purge_service.run_policy("notifications", size=2)
+        self.assertTrue(second["completed"])
+        self.assertEqual(second["deleted"], 3)
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_dry_run_deletes_nothing(self):
+        report = purge_service.run_policy("notifications", dry_run=True)
+
+        self.assertEqual(report["candidates"], 5)
+        self.assertEqual(Notification.objects.count(), 6)
+
+    @override_settings(MYEVOL_PURGE_RETENTION_DAYS={"notifications": 200, "daily_stats": 30})
+    def test_retention_overrides_and_daily_stats(self):
+        DailyStat.objects.all().delete()
+        DailyStat.objects.create(user=self.user, date=date.today() - timedelta(days=60))
+        DailyStat.objects.create(user=self.user, date=date.today())
+
+        self.assertEqual(purge_service.run_policy("notifications")["deleted"], 0)
+        self.assertEqual(purge_service.run_policy("daily_stats")["deleted"], 1)
+        self.assertEqual(DailyStat.objects.filter(user=self.user).count(), 1)
+
+    @override_settings(MYEVOL_PURGE_RETENTION_DAYS={"daily_stats": 30})
+    def test_daily_stats_are_raw_deleted_without_signals(self):
+        DailyStat.objects.all().delete()
+        for days in range(40, 45):
+            DailyStat.objects.create(user=self.user, date=date.today() - timedelta(days=days))
+        deleted_signals = []
+
+        def receiver(sender, instance, **kwargs):
+            deleted_signals.append(instance.pk)
+
+        post_delete.connect(receiver, sender=DailyStat)
+        try:
+            # 2 lots : sélection des identifiants puis DELETE direct, sans chargement des lignes
+            with self.assertNumQueries(4):
+                report = purge_service.run_policy("daily_stats", size=3)
+        finally:
+            post_delete.disconnect(receiver, sender=DailyStat)
+
+        self.assertEqual(report["deleted"], 5)
+        self.assertEqual(deleted_signals, [])
+        self.assertFalse(DailyStat.objects.filter(user=self.user).exists())
+
+    @override_settings(MYEVOL_EVENT_LOG_RETENTION_DAYS=30)
+    def test_event_logs_are_purged_only_once_rolled_up(self):
+        EventLog.objects.all().delete()
+        EventLog.objects.create(action="old", created_at=timezone.now() - timedelta(days=40))
+
+        self.assertEqual(purge_service.run_policy("event_logs", dry_run=True)["candidates"], 0)
+
+        # L'agrégation purge elle-même les événements bruts au-delà de la rétention
+        event_analytics_service.rollup_events()
+        self.assertFalse(EventLog.objects.filter(action="old").exists())
+
+    def test_command(self):
+        out = StringIO()
+        call_command("purge_old_records", "--policy", "notifications", "--dry-run", stdout=out)
+        self.assertIn("5 ligne(s) purgeable(s)", out.getvalue())
+
+        call_command("purge_old_records", "--policy", "notifications", "--batch-size", "2", stdout=out)
+        self.assertEqual(Notification.objects.count(), 1)
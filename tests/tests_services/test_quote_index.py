@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from Myevol_app.models import JournalEntry, Quote
+from Myevol_app.services import quote_service
+
+User = get_user_model()
+
+
+class QuoteIndexTests(TestCase):
+    def setUp(self):
+        self.positive = [Quote.objects.create(text=f"Positive {i}", author="A", mood_tag="positive") for i in range(3)]
+        self.low = Quote.objects.create(text="Courage", author="B", mood_tag="low")
+        self.user = User.objects.create_user(username="quote", email="quote@example.com", password="testpass")
+
+    def test_random_pick_is_a_single_primary_key_lookup(self):
+        quote_service.get_quote_index()
+
+        with self.assertNumQueries(1):
+            quote = quote_service.get_random_quote("positive")
+
+        self.assertIn(quote, self.positive)
+        self.assertIsNone(quote_service.get_random_quote("inexistant"))
+
+    def test_daily_quote_is_computed_once_and_shared(self):
+        other = User.objects.create_user(username="quote2", email="quote2@example.com", password="testpass")
+        first = quote_service.get_daily_quote()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(quote_service.get_daily_quote(), first)
+
+        for user in (self.user, other):
+            JournalEntry.objects.create(user=user, content="Dur", mood=2, category="Travail")
+        self.assertEqual(quote_service.get_daily_quote(self.user), self.low)
+        with self.assertNumQueries(1):  # humeur récente de l'autre utilisateur ; citation partagée
+            self.assertEqual(quote_service.get_daily_quote(other), self.low)
+
+    def test_mood_tag_ignores_old_entries(self):
+        JournalEntry.objects.create(
+            user=self.user, content="Ancienne", mood=1, category="Travail",
+            created_at=timezone.now() - timedelta(days=10),
+        )
+
+        self.assertIsNone(quote_service.get_mood_tag(self.user))
+
+    def test_index_follows_quote_changes(self):
+        self.assertEqual(len(quote_service.get_quote_index().ids("low")), 1)
+
+        extra = Quote.objects.create(text="Encore", author="B", mood_tag="low")
+        self.assertEqual(quote_service.get_quote_index().ids("low"), [self.low.pk, extra.pk])
+
+        self.low.delete()
+        self.assertEqual(quote_service.get_quote_index().ids("low"), [extra.pk])
+        self.assertEqual(Quote.get_random("low"), extra)
@@ -0,0 +1,113 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from Myevol_app.models import JournalEntry
+from Myevol_app.services import search_service
+
+User = get_user_model()
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="chercheur", email="chercheur@example.com", password="testpass")
+        self.other = User.objects.create_user(username="autre", email="autre@example.com", password="testpass")
+        self.backend = search_service.get_search_backend()
+
+    def _ids(self, query, user=None):
+        return [entry.pk for entry in search_service.search_entries(user or self.user, query)[:20]]
+
+    def test_backend_matches_database(self):
+        expected = search_service.BACKENDS_BY_VENDOR[connection.vendor]
+        self.assertIsInstance(self.backend, expected)
+
+    def test_backend_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            search_service.SearchBackend()
+
+    def test_unsupported_database_does_not_block_entry_writes(self):
+        with patch.dict(search_service.BACKENDS_BY_VENDOR, clear=True), self.assertLogs(
+            "Myevol_app.signals.search_signals", "WARNING"
+        ):
+            entry = JournalEntry.objects.create(user=self.user, content="Sans index", mood=5, category="Travail")
+            entry.delete()
+
+        self.assertFalse(JournalEntry.objects.filter(pk=entry.pk).exists())
+
+    def test_index_follows_create_update_delete(self):
+        entry = JournalEntry.objects.create(user=self.user, content="Séance de natation", mood=7, category="Sport")
+        self.assertEqual(self._ids("natation"), [entry.pk])
+
+        entry.content = "Balade en forêt"
+        entry.save()
+        self.assertEqual(self._ids("natation"), [])
+        self.assertEqual(self._ids("foret"), [entry.pk])
+
+        entry.delete()
+        self.assertEqual(self._ids("foret"), [])
+
+    def test_results_are_ranked_highlighted_and_scoped_to_user(self):
+        once = JournalEntry.objects.create(user=self.user, content="Lecture d'un roman policier", mood=6, category="Loisirs")
+        twice = JournalEntry.objects.create(user=self.user, content="Lecture, encore de la lecture", mood=8, category="Lecture")
+        JournalEntry.objects.create(user=self.other, content="Lecture partagée", mood=5, category="Loisirs")
+
+        results = search_service.search_entries(self.user, "lecture")
+        hits = results[:10]
+
+        self.assertEqual(results.count(), 2)
+        self.assertEqual([entry.pk for entry in hits], [twice.pk, once.pk])
+        self.assertGreater(hits[0].search_rank, hits[1].search_rank)
+        self.assertIn("<mark>", hits[0].search_highlight)
+
+    def test_query_syntax_is_not_exposed(self):
+        JournalEntry.objects.create(user=self.user, content="Réunion d'équipe", mood=5, category="Travail")
+
+        entry_ids = self._ids("équipe")
+        self.assertEqual(len(entry_ids), 1)
+        self.assertEqual(self._ids('"équipe*'), entry_ids)
+        self.assertEqual(self._ids('équipe" NEAR('), [])
+        self.assertEqual(self._ids("***"), [])
+
+    def test_rebuild_command(self):
+        entry = JournalEntry.objects.create(user=self.user, content="Yoga du matin", mood=8, category="Santé")
+        self.backend.remove_entry(entry)
+        self.assertEqual(self._ids("yoga"), [])
+
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+
+        self.assertEqual(self._ids("yoga"), [entry.pk])
+        self.assertIn("1 entrée(s) indexée(s)", out.getvalue())
+
+
+class JournalSearchEndpointTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="api", email="api@example.com", password="testpass")
+        self.client.force_authenticate(user=self.user)
+        for content in ["Course à pied le matin", "Course au marché", "Méditation du soir"]:
+            JournalEntry.objects.create(user=self.user, content=content, mood=7, category="Santé")
+
+    def test_search_action_is_paginated(self):
+        response = self.client.get(reverse("journalentry-search"), {"q": "course", "page_size": 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["meta"]["count"], 2)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIn("<mark>", response.data["results"][0]["highlight"])
+        self.assertIn("rank", response.data["results"][0])
+
+    def test_search_requires_query(self):
+        response = self.client.get(reverse("journalentry-search"))
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_search_uses_index(self):
+        response = self.client.get(reverse("journalentry-list"), {"search": "meditation"})
+
+        self.assertEqual(response.data["meta"]["count"], 1)
+        self.assertEqual(response.data["results"][0]["content"], "Méditation du soir")
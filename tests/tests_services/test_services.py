@@ -8,10 +8,10 @@ from Myevol_app.services import (
 
 # Badge Service
 class BadgeServiceTests(TestCase):
-    @patch("Myevol_app.services.badge_service.EventLog")
+    @patch("Myevol_app.services.badge_service.build_user_metrics")
     @patch("Myevol_app.services.badge_service.BadgeTemplate")
     @patch("Myevol_app.services.badge_service.Badge")
-    def test_update_user_badges_creates_new_badge(self, mock_badge, mock_template, mock_eventlog):
+    def test_update_user_badges_creates_new_badge(self, mock_badge, mock_template, mock_metrics):
         user = MagicMock(username="mockuser")
         user.badges.values_list.return_value = []
         template = MagicMock(name="Test Badge", icon="star.png", description="Test description", level=1)
@@ -25,27 +25,29 @@ class BadgeServiceTests(TestCase):
         mock_badge.objects.create.assert_called_once_with(
             user=user, name=template.name, icon=template.icon, description=template.description, level=template.level
         )
-        mock_eventlog.objects.create.assert_called_once()
         self.assertIn(mock_created_badge, result)
 
-# Challenge Service
-class ChallengeServiceTests(TestCase):
-    @patch("Myevol_app.services.challenge_service.update_challenge_progress")
-    @patch("Myevol_app.services.challenge_service.ChallengeProgress.objects.get_or_create")
-    @patch("Myevol_app.services.challenge_service.Challenge.objects.filter")
-    def test_check_user_challenges(self, mock_filter, mock_get_or_create, mock_update_progress):
-        user = MagicMock(username="mockuser")
-        challenge = MagicMock(title="Mock Challenge")
-        mock_filter.return_value = [challenge]
-        progress = MagicMock()
-        mock_get_or_create.return_value = (progress, False)
+    def test_update_user_badges_logs_one_event_per_badge(self):
+        from django.contrib.auth import get_user_model
+        from Myevol_app.models import BadgeTemplate, EventLog, JournalEntry
 
-        challenge_service.check_user_challenges(user)
+        user = get_user_model().objects.create_user(username="badged", email="badged@example.com", password="testpass")
+        for name in ("Première entrée", "Niveau 1"):
+            BadgeTemplate.objects.create(name=name, description=name, icon="🏅", condition=name)
+        with patch("Myevol_app.models.user_model.User.update_badges"):
+            JournalEntry.objects.create(user=user, content="Entrée", mood=6, category="Travail")
+        EventLog.objects.all().delete()
 
-        mock_filter.assert_called_once()
-        mock_get_or_create.assert_called_once_with(user=user, challenge=challenge)
-        mock_update_progress.assert_called_once_with(progress)
+        new_badges = badge_service.update_user_badges(user, return_new_badges=True)
 
+        self.assertEqual(len(new_badges), 2)
+        # Un seul événement par badge, écrit par le signal post_save de Badge
+        self.assertEqual(
+            list(EventLog.objects.filter(user=user).values_list("action", flat=True)), ["attribution_badge"] * 2
+        )
+
+# Challenge Service
+class ChallengeServiceTests(TestCase):
     @patch("Myevol_app.services.challenge_service.check_user_challenges")
     def test_check_challenges(self, mock_check):
         user = MagicMock()
@@ -153,13 +155,11 @@ class NotificationServiceTests(TestCase):
         notification_service.create_user_notification(user, "Hello", "badge")
         mock_create.assert_called_once_with(user=user, message="Hello", notif_type="badge", scheduled_at=None)
 
-    @patch("Myevol_app.services.notification_service.Notification.objects.filter")
-    def test_send_scheduled_notifications(self, mock_filter):
-        notif1, notif2 = MagicMock(), MagicMock()
-        mock_filter.return_value = [notif1, notif2]
-        notification_service.send_scheduled_notifications()
-        notif1.mark_as_read.assert_called_once()
-        notif2.mark_as_read.assert_called_once()
+    @patch("Myevol_app.services.notification_service.dispatch_due_notifications")
+    def test_send_scheduled_notifications(self, mock_dispatch):
+        mock_dispatch.return_value = 2
+        self.assertEqual(notification_service.send_scheduled_notifications(), 2)
+        mock_dispatch.assert_called_once_with()
 
     @patch("Myevol_app.services.notification_service.Notification.objects.filter")
     def test_archive_user_notifications(self, mock_filter):
@@ -172,15 +172,17 @@ class NotificationServiceTests(TestCase):
 
 # Quote Service
 class QuoteServiceTests(TestCase):
-    @patch("Myevol_app.services.quote_service.Quote.objects.all")
-    def test_get_random_quote(self, mock_all):
-        mock_all.return_value.count.return_value = 1
-        mock_all.return_value.__getitem__.return_value = "Quote"
+    @patch("Myevol_app.services.quote_service.Quote.objects.filter")
+    @patch("Myevol_app.services.quote_service.get_quote_index")
+    def test_get_random_quote(self, mock_index, mock_filter):
+        mock_index.return_value.random_id.return_value = 1
+        mock_filter.return_value.first.return_value = "Quote"
         self.assertEqual(quote_service.get_random_quote(), "Quote")
+        mock_filter.assert_called_once_with(pk=1)
 
-    @patch("Myevol_app.services.quote_service.Quote.objects.all")
-    def test_get_random_quote_empty(self, mock_all):
-        mock_all.return_value.count.return_value = 0
+    @patch("Myevol_app.services.quote_service.get_quote_index")
+    def test_get_random_quote_empty(self, mock_index):
+        mock_index.return_value.random_id.return_value = None
         self.assertIsNone(quote_service.get_random_quote())
 
 # Stats Service
@@ -251,30 +253,15 @@ class UserPreferenceServiceTests(TestCase):
         prefs.reset_to_defaults.assert_called_once()
         self.assertEqual(result, prefs)
 
-    @patch("Myevol_app.services.challenge_service.update_challenge_progress")
-    @patch("Myevol_app.services.challenge_service.ChallengeProgress.objects.get_or_create")
-    @patch("Myevol_app.services.challenge_service.Challenge.objects.filter")
-    def test_check_user_challenges_creates_progress(self, mock_filter, mock_get_or_create, mock_update_progress):
-        user = MagicMock()
-        challenge = MagicMock()
-        mock_filter.return_value = [challenge]
-        progress = MagicMock()
-        mock_get_or_create.return_value = (progress, True)  # created = True
-
-        challenge_service.check_user_challenges(user)
-
-        mock_get_or_create.assert_called_once_with(user=user, challenge=challenge)
-        mock_update_progress.assert_called_once_with(progress)
-
-    @patch("Myevol_app.services.notification_service.Notification.objects.filter")
-    def test_send_scheduled_notifications_none(self, mock_filter):
-        mock_filter.return_value = []
+    @patch("Myevol_app.services.notification_service.dispatch_due_notifications")
+    def test_send_scheduled_notifications_none(self, mock_dispatch):
+        mock_dispatch.return_value = 0
         notification_service.send_scheduled_notifications()  # doit passer sans erreur
 
+    @patch("Myevol_app.services.badge_service.build_user_metrics")
     @patch("Myevol_app.services.badge_service.Badge.objects.create")
     @patch("Myevol_app.services.badge_service.BadgeTemplate")
-    @patch("Myevol_app.services.badge_service.EventLog")
-    def test_update_user_badges_creation_failure(self, mock_eventlog, mock_template, mock_create_badge):
+    def test_update_user_badges_creation_failure(self, mock_template, mock_create_badge, mock_metrics):
         user = MagicMock()
         template = MagicMock()
         template.check_unlock.return_value = True
@@ -0,0 +1,175 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils.timezone import make_aware
+
+from Myevol_app.models import JournalEntry, DailyStat, WeeklyStat, MonthlyStat, AnnualStat
+from Myevol_app.services import stats_service
+
+User = get_user_model()
+
+
+class StatsRollupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="rollup", email="rollup@example.com", password="testpass"
+        )
+        self.moment = make_aware(datetime(2025, 4, 23, 12, 0))
+        self.day = self.moment.date()
+
+    def _create_entry(self, mood, category="Travail", created_at=None):
+        return JournalEntry.objects.create(
+            user=self.user, content="Entrée", mood=mood, category=category,
+            created_at=created_at or self.moment,
+        )
+
+    def test_create_updates_every_period(self):
+        self._create_entry(6)
+        self._create_entry(9, category="Santé")
+
+        for model, lookup in [
+            (DailyStat, {"date": self.day}),
+            (WeeklyStat, {"week_start": self.day - timedelta(days=self.day.weekday())}),
+            (MonthlyStat, {"month_start": self.day.replace(day=1)}),
+            (AnnualStat, {"year_start": self.day.replace(month=1, day=1)}),
+        ]:
+            stat = model.objects.get(user=self.user, **lookup)
+            self.assertEqual(stat.entries_count, 2)
+            self.assertEqual(stat.mood_sum, 15)
+            self.assertEqual(stat.mood_average, 7.5)
+            self.assertEqual(stat.categories, {"Travail": 1, "Santé": 1})
+
+    def test_edit_moves_contribution(self):
+        entry = self._create_entry(4)
+        self._create_entry(8)
+
+        entry.mood = 10
+        entry.category = "Sport"
+        entry.save()
+
+        stat = DailyStat.objects.get(user=self.user, date=self.day)
+        self.assertEqual(stat.entries_count, 2)
+        self.assertEqual(stat.mood_average, 9.0)
+        self.assertEqual(stat.categories, {"Travail": 1, "Sport": 1})
+
+    def test_edit_of_date_moves_entry_to_another_day(self):
+        entry = self._create_entry(5)
+        entry.created_at = self.moment - timedelta(days=1)
+        entry.save()
+
+        self.assertEqual(DailyStat.objects.get(user=self.user, date=self.day).entries_count, 0)
+        self.assertEqual(DailyStat.objects.get(user=self.user, date=self.day - timedelta(days=1)).entries_count, 1)
+
+    def test_delete_removes_contribution(self):
+        entry = self._create_entry(4)
+        self._create_entry(8)
+        entry.delete()
+
+        stat = DailyStat.objects.get(user=self.user, date=self.day)
+        self.assertEqual(stat.entries_count, 1)
+        self.assertEqual(stat.mood_average, 8.0)
+        self.assertEqual(stat.categories, {"Travail": 1})
+
+    def test_row_without_mood_sum_is_rebuilt_once(self):
+        self._create_entry(6)
+        DailyStat.objects.filter(user=self.user).update(mood_sum=None, entries_count=42)
+
+        self._create_entry(8)
+
+        stat = DailyStat.objects.get(user=self.user, date=self.day)
+        self.assertEqual(stat.entries_count, 2)
+        self.assertEqual(stat.mood_sum, 14)
+
+    def test_write_cost_does_not_depend_on_history(self):
+        for offset in range(20):
+            self._create_entry(5, created_at=self.moment - timedelta(days=offset + 1))
+        self._create_entry(5)
+
+        # Une lecture verrouillée et une mise à jour par période, dans un savepoint
+        with self.assertNumQueries(10):
+            stats_service.apply_entry_delta(self.user, self.day, 7, "Travail")
+
+    def test_rebuild_command_repairs_rows(self):
+        self._create_entry(6)
+        self._create_entry(8)
+        AnnualStat.objects.filter(user=self.user).update(entries_count=0, mood_sum=0, categories={})
+
+        out = StringIO()
+        call_command("rebuild_stats", "--user", str(self.user.pk), stdout=out)
+
+        stat = AnnualStat.objects.get(user=self.user)
+        self.assertEqual(stat.entries_count, 2)
+        self.assertEqual(stat.categories, {"Travail": 2})
+        self.assertIn("4 ligne(s)", out.getvalue())
+
+    def test_rebuild_deletes_rows_of_periods_without_entries(self):
+        self._create_entry(6)
+        stale = self.moment - timedelta(days=400)
+        JournalEntry.objects.bulk_create([
+            JournalEntry(user=self.user, content="Entrée", mood=4, category="Travail", created_at=stale)
+        ])
+        stats_service.rebuild_user_stats(self.user)
+        self.assertEqual(DailyStat.objects.filter(user=self.user).count(), 2)
+
+        JournalEntry.objects.filter(created_at=stale).delete()
+        self.assertEqual(stats_service.rebuild_user_stats(self.user), 4)
+
+        self.assertEqual(list(DailyStat.objects.filter(user=self.user).values_list("date", flat=True)), [self.day])
+        self.assertEqual(AnnualStat.objects.filter(user=self.user).count(), 1)
+
+    def test_partial_rebuild_deletes_emptied_day(self):
+        entry = self._create_entry(6)
+        JournalEntry.objects.filter(pk=entry.pk).delete()
+
+        self.assertEqual(stats_service.rebuild_user_stats(self.user, days=[self.day]), 0)
+
+        for model in (DailyStat, WeeklyStat, MonthlyStat, AnnualStat):
+            self.assertFalse(model.objects.filter(user=self.user).exists())
+
+
+class BulkStatsGenerationTests(TestCase):
+    def setUp(self):
+        self.moment = make_aware(datetime(2025, 4, 23, 12, 0))
+        self.day = self.moment.date()
+        self.users = [
+            User.objects.create_user(username=f"bulk{i}", email=f"bulk{i}@example.com", password="testpass")
+            for i in range(3)
+        ]
+        for index, user in enumerate(self.users):
+            for mood, category in [(4, "Travail"), (8, "Santé"), (6, "Travail")][: index + 1]:
+                JournalEntry.objects.create(
+                    user=user, content="Entrée", mood=mood, category=category, created_at=self.moment
+                )
+
+    def test_generates_rows_for_every_active_user(self):
+        DailyStat.objects.all().delete()
+
+        report = stats_service.bulk_generate_stats("daily", self.day, batch_size=2)
+
+        self.assertEqual(report["rows"], 3)
+        self.assertIn("duration", report)
+        self.assertIn("rate", report)
+        stat = DailyStat.objects.get(user=self.users[2], date=self.day)
+        self.assertEqual(stat.entries_count, 3)
+        self.assertEqual(stat.mood_sum, 18)
+        self.assertEqual(stat.mood_average, 6.0)
+        self.assertEqual(stat.categories, {"Travail": 2, "Santé": 1})
+
+    def test_overwrites_stale_rows(self):
+        week_start = self.day - timedelta(days=self.day.weekday())
+        WeeklyStat.objects.filter(user=self.users[1]).update(entries_count=99, mood_sum=0, categories={})
+
+        stats_service.bulk_generate_stats("weekly", self.day)
+
+        stat = WeeklyStat.objects.get(user=self.users[1], week_start=week_start)
+        self.assertEqual(stat.entries_count, 2)
+        self.assertEqual(stat.categories, {"Travail": 1, "Santé": 1})
+        self.assertEqual(WeeklyStat.objects.filter(week_start=week_start).count(), 3)
+
+    def test_query_count_does_not_depend_on_user_count(self):
+        # Une lecture groupée + une écriture par lot
+        with self.assertNumQueries(2):
+            stats_service.bulk_generate_stats("monthly", self.day, batch_size=10)
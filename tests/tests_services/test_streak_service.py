@@ -0,0 +1,124 @@
+from datetime import date, datetime, timedelta
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils.timezone import make_aware
+from freezegun import freeze_time
+
+from Myevol_app.models import JournalEntry
+from Myevol_app.services import streak_service
+
+User = get_user_model()
+
+
+class StreakBitmapTests(TestCase):
+    def test_streak_ending_at(self):
+        origin = date(2025, 4, 1)
+        value = 0
+        for offset in (0, 1, 3, 4, 5):
+            value, origin = streak_service.set_day(value, origin, origin + timedelta(days=offset))
+
+        self.assertEqual(streak_service.streak_ending_at(value, origin, date(2025, 4, 6)), 3)
+        self.assertEqual(streak_service.streak_ending_at(value, origin, date(2025, 4, 2)), 2)
+        self.assertEqual(streak_service.streak_ending_at(value, origin, date(2025, 4, 3)), 0)
+        self.assertEqual(streak_service.streak_ending_at(value, origin, date(2025, 3, 1)), 0)
+        self.assertEqual(streak_service.longest_run(value), 3)
+
+    def test_set_day_before_origin_shifts_bitmap(self):
+        value, origin = streak_service.set_day(0, None, date(2025, 4, 10))
+        value, origin = streak_service.set_day(value, origin, date(2025, 4, 9))
+
+        self.assertEqual(origin, date(2025, 4, 9))
+        self.assertEqual(streak_service.streak_ending_at(value, origin, date(2025, 4, 10)), 2)
+
+    def test_bytes_round_trip(self):
+        value = 0b1011_0000_0001
+        self.assertEqual(streak_service.bitmap_to_int(streak_service.int_to_bitmap(value)), value)
+
+
+@freeze_time("2025-04-23 12:00:00")
+class StreakActivityTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="streaker", email="streaker@example.com", password="testpass"
+        )
+
+    def _create_entry(self, days_ago, user=None):
+        return JournalEntry.objects.create(
+            user=user or self.user, content="Entrée", mood=6, category="Travail",
+            created_at=make_aware(datetime(2025, 4, 23, 12, 0)) - timedelta(days=days_ago),
+        )
+
+    def test_current_and_longest_streak_without_queries(self):
+        for days_ago in (0, 1, 2, 5, 6):
+            self._create_entry(days_ago)
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.current_streak(), 3)
+            self.assertTrue(user.has_entries_every_day(3))
+            self.assertFalse(user.has_entries_every_day(4))
+        self.assertEqual(user.longest_streak, 3)
+
+    def test_delete_clears_day_only_when_empty(self):
+        self._create_entry(0)
+        middle = self._create_entry(1)
+        self._create_entry(1)
+        self._create_entry(2)
+
+        middle.delete()
+        self.assertEqual(User.objects.get(pk=self.user.pk).current_streak(), 3)
+
+        JournalEntry.objects.filter(user=self.user, created_at__date=date(2025, 4, 22)).delete()
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(user.current_streak(), 1)
+        self.assertEqual(user.longest_streak, 1)
+
+    def test_new_user_bitmap_is_initialised_on_creation(self):
+        user = User.objects.get(pk=self.user.pk)
+
+        self.assertEqual(user.activity_origin, date(2025, 4, 23))
+        with self.assertNumQueries(0):
+            self.assertEqual(user.current_streak(), 0)
+
+    def test_legacy_user_is_rebuilt_in_memory_without_writing(self):
+        self._create_entry(0)
+        self._create_entry(1)
+        User.objects.filter(pk=self.user.pk).update(activity_bitmap=b"", activity_origin=None)
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.current_streak(), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.current_streak(), 2)
+        self.assertIsNone(User.objects.get(pk=self.user.pk).activity_origin)
+
+        # La prochaine écriture enregistre le bitmap reconstruit
+        self._create_entry(2)
+        self.assertEqual(User.objects.get(pk=self.user.pk).current_streak(), 3)
+
+    def test_moving_an_entry_releases_its_previous_day(self):
+        self._create_entry(0)
+        moved = self._create_entry(1)
+
+        moved.created_at -= timedelta(days=2)
+        moved.save()
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(user.current_streak(), 1)
+        self.assertEqual(streak_service.streak_ending_at(*streak_service.get_activity(user), date(2025, 4, 20)), 1)
+
+    def test_rebuild_all_activity(self):
+        other = User.objects.create_user(username="idle", email="idle@example.com", password="testpass")
+        for days_ago in (0, 1, 3):
+            self._create_entry(days_ago)
+        User.objects.update(activity_bitmap=b"", activity_origin=None, longest_streak=0)
+
+        with self.assertNumQueries(3):
+            updated = streak_service.rebuild_all_activity()
+
+        self.assertEqual(updated, 2)
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(user.current_streak(), 2)
+        self.assertEqual(user.longest_streak, 2)
+        self.assertEqual(User.objects.get(pk=other.pk).current_streak(), 0)
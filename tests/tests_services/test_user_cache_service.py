@@ -0,0 +1,88 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from Myevol_app.models import Badge, JournalEntry, Objective
+from Myevol_app.services import user_cache_service
+
+User = get_user_model()
+
+
+class UserCacheServiceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cached", email="cached@example.com", password="testpass"
+        )
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Travail")
+        user_cache_service.reset_stats()
+
+    def test_second_call_is_served_from_cache(self):
+        self.assertEqual(self.user.mood_average(), 6.0)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.user.mood_average(days=7), 6.0)
+
+        stats = user_cache_service.get_stats()["mood_average"]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 50.0)
+
+    def test_every_argument_variant_is_invalidated_by_a_new_entry(self):
+        self.assertEqual(self.user.entries_by_category(), {"Travail": 1})
+        self.assertEqual(self.user.entries_by_category(days=30), {"Travail": 1})
+
+        JournalEntry.objects.create(user=self.user, content="Autre", mood=8, category="Santé")
+
+        self.assertEqual(self.user.entries_by_category(), {"Travail": 1, "Santé": 1})
+        self.assertEqual(self.user.entries_by_category(days=30), {"Travail": 1, "Santé": 1})
+        self.assertEqual(self.user.total_entries, 2)
+
+    def test_objective_and_badge_writes_bump_the_generation(self):
+        generation = user_cache_service.get_generation(self.user.pk)
+
+        Objective.objects.create(user=self.user, title="Lire", category="Lecture",
+                                 target_date=self.user.date_joined.date(), target_value=1)
+        self.assertGreater(user_cache_service.get_generation(self.user.pk), generation)
+
+        generation = user_cache_service.get_generation(self.user.pk)
+        Badge.objects.create(user=self.user, name="Manuel", description="-", icon="🏅")
+        self.assertGreater(user_cache_service.get_generation(self.user.pk), generation)
+
+    def test_generation_is_bumped_again_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            JournalEntry.objects.create(user=self.user, content="Autre", mood=8, category="Santé")
+
+        # Génération sous laquelle une lecture concurrente aurait mis en cache l'état d'avant validation
+        generation = user_cache_service.get_generation(self.user.pk)
+        for callback in callbacks:
+            callback()
+
+        self.assertNotEqual(user_cache_service.get_generation(self.user.pk), generation)
+
+    def test_users_do_not_share_values(self):
+        other = User.objects.create_user(username="other", email="other@example.com", password="testpass")
+
+        self.assertEqual(self.user.total_entries, 1)
+        self.assertEqual(other.total_entries, 0)
+
+    @override_settings(MYEVOL_USER_CACHE_TTLS={"level": 5})
+    def test_ttl_is_configurable(self):
+        self.assertEqual(user_cache_service.get_ttl("level"), 5)
+        self.assertEqual(user_cache_service.get_ttl("mood_average"), user_cache_service.DEFAULT_TTLS["mood_average"])
+
+        with patch.object(user_cache_service.cache, "set", wraps=user_cache_service.cache.set) as cache_set:
+            self.user.level()
+        self.assertEqual(cache_set.call_args.kwargs["timeout"], 5)
+
+    def test_stats_command(self):
+        self.user.level()
+        self.user.level()
+
+        out = StringIO()
+        call_command("user_cache_stats", "--reset", stdout=out)
+
+        self.assertIn("level", out.getvalue())
+        self.assertIn("hits=1", out.getvalue())
+        self.assertEqual(user_cache_service.get_stats()["level"]["hits"], 0)
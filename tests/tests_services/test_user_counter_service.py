@@ -0,0 +1,140 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from Myevol_app import tasks
+from Myevol_app.models import Badge, JournalEntry, Notification
+from Myevol_app.services import user_counter_service
+
+User = get_user_model()
+
+
+class UserCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="count", email="count@example.com", password="testpass")
+        Notification.objects.all().delete()
+        Badge.objects.all().delete()
+        user_counter_service.refresh_counters([self.user.pk])
+        self.user.refresh_from_db()
+
+    def _stored(self):
+        return User.objects.values("entries_count", "badges_count", "unread_notifications_count").get(pk=self.user.pk)
+
+    def test_entry_writes_maintain_entries_count(self):
+        entry = JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Travail")
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Travail")
+
+        self.assertEqual(self.user.total_entries, 2)
+        self.assertEqual(self._stored()["entries_count"], 2)
+
+        entry.delete()
+        self.assertEqual(self._stored()["entries_count"], 1)
+
+    def test_badge_writes_maintain_badges_count(self):
+        badge = Badge.objects.create(user=self.user, name="Manuel", description="-", icon="🏅")
+        self.assertEqual(self._stored()["badges_count"], 1)
+
+        badge.delete()
+        self.assertEqual(self._stored()["badges_count"], 0)
+
+    def test_read_archive_and_delete_maintain_unread_count(self):
+        first = Notification.objects.create(user=self.user, message="Un")
+        second = Notification.objects.create(user=self.user, message="Deux")
+        third = Notification.objects.create(user=self.user, message="Trois")
+        self.assertEqual(self._stored()["unread_notifications_count"], 3)
+
+        Notification.objects.get(pk=first.pk).mark_as_read()
+        Notification.objects.get(pk=second.pk).archive()
+        self.assertEqual(self._stored()["unread_notifications_count"], 1)
+
+        Notification.objects.get(pk=third.pk).delete()
+        Notification.objects.get(pk=first.pk).delete()
+        self.assertEqual(self._stored()["unread_notifications_count"], 0)
+
+    def test_read_path_runs_one_counter_update(self):
+        notification = Notification.objects.create(user=self.user, message="Un")
+        notification = Notification.objects.select_related("user").get(pk=notification.pk)
+
+        # UPDATE de la notification + UPDATE ... SET compteur = compteur - 1
+        with self.assertNumQueries(2):
+            notification.mark_as_read()
+
+    def test_bulk_paths_maintain_unread_count(self):
+        other = User.objects.create_user(username="other", email="other@example.com", password="testpass")
+        Notification.objects.filter(user=other).delete()
+        Notification.objects.bulk_create(
+            [Notification(user=self.user, message=f"N{i}") for i in range(3)]
+            + [Notification(user=other, message="Autre"), Notification(user=other, message="Lue", is_read=True)]
+        )
+        self.assertEqual(self._stored()["unread_notifications_count"], 3)
+        self.assertEqual(User.objects.get(pk=other.pk).unread_notifications_count, 1)
+
+        self.assertEqual(Notification.mark_all_as_read(self.user), 3)
+        self.assertEqual(self._stored()["unread_notifications_count"], 0)
+
+        Notification.objects.filter(user=self.user).update(is_read=False)
+        self.assertEqual(self._stored()["unread_notifications_count"], 3)
+
+        Notification.objects.filter(user=self.user).delete()
+        self.assertEqual(self._stored()["unread_notifications_count"], 0)
+        self.assertEqual(User.objects.get(pk=other.pk).unread_notifications_count, 1)
+
+    def test_bulk_update_shifts_counters_in_one_query(self):
+        Notification.objects.bulk_create([Notification(user=self.user, message=f"N{i}") for i in range(3)])
+        Notification.objects.filter(message="N0").update(archived=True)
+
+        # Variation calculée depuis la condition de la mise à jour, puis UPDATE des notifications
+        with self.assertNumQueries(2):
+            Notification.objects.filter(user=self.user).update(is_read=True)
+        self.assertEqual(self._stored()["unread_notifications_count"], 0)
+
+        # Seules les lignes qui redeviennent non lues (non archivées) sont ajoutées
+        with self.assertNumQueries(2):
+            Notification.objects.filter(user=self.user).update(is_read=False)
+        self.assertEqual(self._stored()["unread_notifications_count"], 2)
+
+        Notification.objects.filter(user=self.user).update(archived=False)
+        self.assertEqual(self._stored()["unread_notifications_count"], 3)
+
+    def test_full_save_does_not_overwrite_counters(self):
+        stale = User.objects.get(pk=self.user.pk)
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=6, category="Travail")
+
+        stale.first_name = "Nouveau"
+        stale.save()
+
+        self.assertEqual(self._stored()["entries_count"], 1)
+        self.assertEqual(User.objects.get(pk=self.user.pk).first_name, "Nouveau")
+
+    def test_save_of_deferred_instance_does_not_load_deferred_fields(self):
+        user = User.objects.only("first_name").get(pk=self.user.pk)
+        user.first_name = "Différé"
+
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+
+        # Première requête : UPDATE des seuls champs chargés, sans relecture des champs différés
+        self.assertTrue(queries[0]["sql"].startswith('UPDATE "Myevol_app_user" SET "first_name"'))
+        self.assertNotIn(",", queries[0]["sql"].split(" WHERE ")[0])
+
+        self.assertEqual(User.objects.get(pk=self.user.pk).first_name, "Différé")
+
+    def test_reconcile_repairs_drift_in_batches(self):
+        others = [
+            User.objects.create_user(username=f"u{i}", email=f"u{i}@example.com", password="testpass")
+            for i in range(3)
+        ]
+        JournalEntry.objects.bulk_create([
+            JournalEntry(user=self.user, content="Entrée", mood=6, category="Travail") for _ in range(4)
+        ])
+        Notification.objects.all().update(is_read=True)
+        User.objects.filter(pk=others[0].pk).update(badges_count=7, unread_notifications_count=9)
+
+        repaired = user_counter_service.reconcile_counters(batch_size=2)
+
+        self.assertEqual(repaired, 2)
+        self.assertEqual(self._stored(), {"entries_count": 4, "badges_count": 0, "unread_notifications_count": 0})
+        self.assertEqual(User.objects.get(pk=others[0].pk).badges_count, 0)
+        self.assertEqual(user_counter_service.reconcile_counters(), 0)
+        self.assertIn("0 utilisateur", tasks.reconcile_user_counters())
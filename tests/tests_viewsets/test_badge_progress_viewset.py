@@ -0,0 +1,60 @@
+# tests/tests_viewsets/test_badge_progress_viewset.py
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from Myevol_app.models import BadgeTemplate, JournalEntry
+from tests.tests_viewsets.factories import BadgeFactory, UserFactory
+
+
+class BadgeTemplateProgressTests(APITestCase):
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("badgetemplate-progress")
+        for name in ("Première entrée", "Productivité", "Niveau 1", "Niveau 2", "Badge libre"):
+            BadgeTemplate.objects.create(name=name, description=name, icon="🏅", condition=name)
+
+    def test_progress_for_every_template(self):
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=7, category="Travail")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        progress = {item["name"]: item["progress"] for item in response.data}
+        self.assertEqual(len(progress), 5)
+        self.assertTrue(progress["Première entrée"]["unlocked"])
+        self.assertFalse(progress["Productivité"]["unlocked"])
+        self.assertEqual(progress["Niveau 2"]["current"], 1)
+
+    def test_query_count_does_not_depend_on_template_count(self):
+        self.client.get(self.url)  # Initialise le bitmap d'activité
+
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+        for index in range(10):
+            BadgeTemplate.objects.create(name=f"Niveau {index + 3}", description="-", icon="🏅", condition="-")
+
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+    def test_unchanged_progress_returns_304(self):
+        first = self.client.get(self.url)
+        etag = first["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        BadgeFactory(user=self.user, name="Badge libre")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
@@ -0,0 +1,94 @@
+# tests/tests_viewsets/test_cursor_pagination.py
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from Myevol_app.models import EventLog, Notification
+from tests.tests_viewsets.factories import UserFactory
+
+
+class CursorPaginationTests(APITestCase):
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        base = timezone.now() - timedelta(days=1)
+        # Deux notifications partagent le même horodatage : départage par id
+        for i, offset in enumerate([0, 1, 1, 2, 3]):
+            notification = Notification.objects.create(user=self.user, message=f"Notif {i}", notif_type="info")
+            Notification.objects.filter(pk=notification.pk).update(created_at=base + timedelta(minutes=offset))
+        self.url = reverse("notification-list")
+
+    def test_walks_all_pages_without_count_query(self):
+        seen = []
+        url, params = self.url, {"pagination": "cursor", "page_size": 2}
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse(any("COUNT(" in q["sql"].upper() for q in context.captured_queries))
+            self.assertTrue(response.data["success"])
+            self.assertIsNone(response.data["meta"]["count"])
+            seen += [item["id"] for item in response.data["results"]]
+            url, params = response.data["meta"]["next"], None
+
+        expected = list(Notification.objects.filter(user=self.user).order_by("-created_at", "-id")
+                        .values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_page_sharing_one_timestamp_uses_keyset_not_offset(self):
+        Notification.objects.filter(user=self.user).delete()
+        Notification.objects.bulk_create([
+            Notification(user=self.user, message=f"Lot {i}", notif_type="info") for i in range(7)
+        ])
+        Notification.objects.filter(user=self.user).update(created_at=timezone.now() - timedelta(hours=1))
+        expected = list(Notification.objects.filter(user=self.user).order_by("-id").values_list("id", flat=True))
+
+        seen, pages = [], []
+        url, params = self.url, {"pagination": "cursor", "page_size": 3}
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, params)
+            self.assertFalse(any(" OFFSET " in q["sql"].upper() for q in context.captured_queries))
+            pages.append(response)
+            seen += [item["id"] for item in response.data["results"]]
+            url, params = response.data["meta"]["next"], None
+        self.assertEqual(seen, expected)
+
+        # Retour en arrière depuis la dernière page
+        previous = self.client.get(pages[-1].data["meta"]["previous"])
+        self.assertEqual([item["id"] for item in previous.data["results"]], expected[3:6])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(self.url, {"cursor": "cD1ub3QtanNvbg=="})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_optional_count(self):
+        response = self.client.get(self.url, {"pagination": "cursor", "count": "exact"})
+        self.assertEqual(response.data["meta"]["count"], 5)
+        self.assertFalse(response.data["meta"]["count_is_estimate"])
+
+        # Estimation du planificateur uniquement sur PostgreSQL, COUNT(*) sinon
+        response = self.client.get(self.url, {"pagination": "cursor", "count": "estimate"})
+        self.assertIsNotNone(response.data["meta"]["count"])
+
+    def test_page_number_mode_is_unchanged(self):
+        response = self.client.get(self.url, {"page": 2, "page_size": 2})
+
+        self.assertEqual(response.data["meta"]["count"], 5)
+        self.assertEqual(response.data["meta"]["total_pages"], 3)
+        self.assertEqual(response.data["meta"]["current_page"], 2)
+
+    def test_event_logs_and_journal_entries_support_cursor(self):
+        EventLog.log_action("test_event", "Événement", user=self.user)
+
+        for name in ("eventlog-list", "journalentry-list"):
+            response = self.client.get(reverse(name), {"pagination": "cursor"})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn("count_is_estimate", response.data["meta"])
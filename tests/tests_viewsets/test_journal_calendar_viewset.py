@@ -0,0 +1,88 @@
+# tests/tests_viewsets/test_journal_calendar_viewset.py
+
+from datetime import datetime
+
+from django.urls import reverse
+from django.utils.timezone import make_aware
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from Myevol_app.models import JournalEntry
+from tests.tests_viewsets.factories import UserFactory
+
+
+@freeze_time("2025-04-23 12:00:00")
+class JournalCalendarTests(APITestCase):
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("journalentry-calendar")
+        for when, mood, category in [
+            (datetime(2025, 3, 30, 10), 4, "Travail"),
+            (datetime(2025, 4, 2, 9), 6, "Travail"),
+            (datetime(2025, 4, 2, 18), 9, "Santé"),
+            (datetime(2025, 4, 2, 20), 7, "Travail"),
+            (datetime(2025, 4, 20, 8), 5, "Sport"),
+        ]:
+            JournalEntry.objects.create(
+                user=self.user, content="Entrée", mood=mood, category=category, created_at=make_aware(when)
+            )
+
+    def test_defaults_to_current_month(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [
+            {"day": "2025-04-02", "count": 3, "mood_avg": 7.3, "categories": ["Santé", "Travail"]},
+            {"day": "2025-04-20", "count": 1, "mood_avg": 5.0, "categories": ["Sport"]},
+        ])
+
+    def test_month_range_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"from": "2025-03", "to": "2025-04"})
+
+        self.assertEqual([day["day"] for day in response.data], ["2025-03-30", "2025-04-02", "2025-04-20"])
+
+    def test_months_are_cached_until_next_write(self):
+        self.client.get(self.url, {"from": "2025-03", "to": "2025-04"})
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {"from": "2025-04"})
+
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=8, category="Sport")
+        response = self.client.get(self.url)
+        self.assertEqual(response.data[-1], {"day": "2025-04-23", "count": 1, "mood_avg": 8.0, "categories": ["Sport"]})
+
+    def test_unchanged_calendar_returns_304(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, {"from": "2025-03"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_missing_bound_extends_towards_current_month(self):
+        response = self.client.get(self.url, {"from": "2025-03"})
+        self.assertEqual([day["day"] for day in response.data], ["2025-03-30", "2025-04-02", "2025-04-20"])
+
+        # `from` seul, plus de 12 mois avant le mois courant : plafonné à 12 mois
+        self.assertEqual(self.client.get(self.url, {"from": "2024-01"}).status_code, status.HTTP_200_OK)
+
+        # `to` seul, antérieur au mois courant : ce mois uniquement
+        response = self.client.get(self.url, {"to": "2025-03"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([day["day"] for day in response.data], ["2025-03-30"])
+
+    def test_invalid_bounds(self):
+        self.assertEqual(self.client.get(self.url, {"from": "avril"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.client.get(self.url, {"from": "2025-04", "to": "2025-03"}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(
+            self.client.get(self.url, {"from": "2023-01", "to": "2025-04"}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
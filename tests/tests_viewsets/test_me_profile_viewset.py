@@ -0,0 +1,100 @@
+# tests/tests_viewsets/test_me_profile_viewset.py
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from Myevol_app.models import Badge, JournalEntry
+from Myevol_app.services import profile_service
+from Myevol_app.viewsets import me_viewset
+from tests.tests_viewsets.factories import UserFactory
+
+
+class MeProfileTests(APITestCase):
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        JournalEntry.objects.create(user=self.user, content="Entrée", mood=8, category="Travail")
+
+    def test_profile_content(self):
+        response = self.client.get(reverse("me"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_entries"], 1)
+        self.assertEqual(response.data["stats_summary"]["current_streak"], 1)
+        self.assertEqual(response.data["mood_average"]["week"], 8.0)
+        self.assertEqual(response.data["activity_summary"]["entries_today"], 1)
+        self.assertEqual(response.data["level"], 1)
+
+    def test_profile_is_built_with_the_request_context(self):
+        with patch.object(me_viewset, "UserProfileSerializer", wraps=me_viewset.UserProfileSerializer) as serializer:
+            self.client.get(reverse("me"))
+
+        self.assertEqual(serializer.call_args.kwargs["context"]["request"].user, self.user)
+
+    def test_cached_profile_is_served_without_queries(self):
+        first = self.client.get(reverse("me"))
+
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse("user-me"))
+
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_unchanged_profile_returns_304(self):
+        etag = self.client.get(reverse("me"))["ETag"]
+
+        response = self.client.get(reverse("me"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(reverse("me"))["Last-Modified"]
+
+        response = self.client.get(reverse("me"), HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(reverse("me"), HTTP_IF_MODIFIED_SINCE=http_date(0))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_rebuilt_profile_keeps_the_last_write_date(self):
+        written_at = timezone.now().replace(hour=12)
+        with freeze_time(written_at):
+            JournalEntry.objects.create(user=self.user, content="Midi", mood=6, category="Travail")
+            last_modified = self.client.get(reverse("me"))["Last-Modified"]
+
+        # Profil évincé puis reconstruit plus tard, sans nouvelle écriture
+        with freeze_time(written_at + timedelta(hours=2)):
+            cache.delete(profile_service._profile_key(self.user.pk))
+            response = self.client.get(reverse("me"), HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["Last-Modified"], last_modified)
+
+    def test_total_entries_reads_the_denormalized_counter(self):
+        type(self.user).objects.filter(pk=self.user.pk).update(entries_count=42)
+
+        self.assertEqual(profile_service.compute_profile_metrics(self.user)["total_entries"], 42)
+
+    def test_writes_bump_the_version(self):
+        etag = self.client.get(reverse("me"))["ETag"]
+
+        JournalEntry.objects.create(user=self.user, content="Autre", mood=4, category="Travail")
+        response = self.client.get(reverse("me"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_entries"], 2)
+
+        etag = response["ETag"]
+        Badge.objects.create(user=self.user, name="Manuel", description="-", icon="🏅")
+        response = self.client.get(reverse("me"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["badges_count"], Badge.objects.filter(user=self.user).count())
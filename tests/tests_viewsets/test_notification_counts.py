@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from Myevol_app.models import Notification
+
+User = get_user_model()
+
+
+class NotificationCountEndpointTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="notif", email="notif@example.com", password="testpass")
+        Notification.objects.filter(user=self.user).delete()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        Notification.objects.create(user=self.user, message="Badge", notif_type="badge")
+        Notification.objects.create(user=self.user, message="Lue", notif_type="badge", is_read=True)
+        Notification.objects.create(user=self.user, message="Info", notif_type="info")
+        Notification.objects.create(user=self.user, message="Archivée", notif_type="info", archived=True)
+
+    def test_counts_come_from_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("notification-count"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["total"], response.data["unread"], response.data["today"]), (3, 2, 3))
+        self.assertEqual(response.data["by_type"]["badge"], {"total": 2, "unread": 1})
+        self.assertEqual(response.data["by_type"]["info"], {"total": 1, "unread": 1})
+        self.assertEqual(response.data["by_type"]["objectif"], {"total": 0, "unread": 0})
+
+    def test_unread_count_is_served_without_queries(self):
+        url = reverse("notification-unread-count")
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data, {"unread": 2})
+        etag = response["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unread_count_etag_changes_when_a_notification_is_read(self):
+        url = reverse("notification-unread-count")
+        etag = self.client.get(url)["ETag"]
+
+        Notification.objects.get(user=self.user, message="Info").mark_as_read()
+        self.user.refresh_from_db()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"unread": 1})
+        self.assertNotEqual(response["ETag"], etag)
@@ -0,0 +1,88 @@
+# tests/tests_viewsets/test_query_optimizer.py
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+
+from Myevol_app.models import Badge, EventLog, JournalEntry, Notification
+from Myevol_app.serializers.badge_serializers import BadgeSerializer
+from Myevol_app.serializers.challenge_serializers import ParticipantSerializer
+from Myevol_app.serializers.journal_serializers import JournalEntrySerializer
+from Myevol_app.models.challenge_model import ChallengeProgress
+from Myevol_app.viewsets.mixins import QUERY_COUNT_HEADER, build_query_plan
+from tests.tests_viewsets.factories import (
+    BadgeFactory, ChallengeFactory, ChallengeProgressFactory, JournalEntryFactory, NotificationFactory, UserFactory,
+)
+
+
+class NotificationColumnsSerializer(serializers.ModelSerializer):
+    user_username = serializers.ReadOnlyField(source='user.username')
+
+    class Meta:
+        model = Notification
+        fields = ['id', 'message', 'user', 'user_username']
+
+
+class QueryPlanTests(APITestCase):
+
+    def test_plan_follows_serializer_fields(self):
+        journal = build_query_plan(JournalEntrySerializer, JournalEntry)
+        self.assertEqual(journal.select_related, ['user'])
+        self.assertEqual([p.prefetch_through for p in journal.prefetch_related], ['media'])
+        self.assertIsNone(journal.only)  # champs calculés : colonnes lues inconnues
+
+        self.assertEqual(build_query_plan(BadgeSerializer, Badge).select_related, ['user'])
+        self.assertEqual(build_query_plan(ParticipantSerializer, ChallengeProgress).select_related, ['user'])
+
+    def test_only_when_every_field_is_a_column(self):
+        plan = build_query_plan(NotificationColumnsSerializer, Notification)
+
+        self.assertEqual(plan.select_related, ['user'])
+        self.assertEqual(plan.only, ['id', 'message', 'user', 'user__username'])
+
+
+@override_settings(MYEVOL_QUERY_COUNT_HEADER=True)
+class QueryCountHeaderTests(APITestCase):
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+
+    def _query_count(self, url, params=None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return int(response[QUERY_COUNT_HEADER])
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        for name, factory in [
+            ("notification-list", NotificationFactory),
+            ("journalentry-list", JournalEntryFactory),
+            ("badge-list", BadgeFactory),
+        ]:
+            factory.create_batch(2, user=self.user)
+            small = self._query_count(reverse(name))
+            factory.create_batch(6, user=self.user)
+            self.assertEqual(self._query_count(reverse(name)), small, name)
+
+    def test_event_log_list(self):
+        EventLog.log_action("a", "Événement", user=self.user)
+        small = self._query_count(reverse("eventlog-list"))
+        for _ in range(5):
+            EventLog.log_action("a", "Événement", user=self.user)
+        self.assertEqual(self._query_count(reverse("eventlog-list")), small)
+
+    def test_challenge_participants(self):
+        challenge = ChallengeFactory()
+        ChallengeProgressFactory(challenge=challenge, user=self.user)
+        url = reverse("challenge-participants", args=[challenge.pk])
+        small = self._query_count(url)
+        for _ in range(4):
+            ChallengeProgressFactory(challenge=challenge, user=UserFactory())
+        # Seul le calcul de progression (une requête par participant) dépend encore des lignes
+        self.assertEqual(self._query_count(url), small + 4)
+
+    @override_settings(MYEVOL_QUERY_COUNT_HEADER=False)
+    def test_header_is_disabled_by_setting(self):
+        response = self.client.get(reverse("notification-list"))
+        self.assertNotIn(QUERY_COUNT_HEADER, response)
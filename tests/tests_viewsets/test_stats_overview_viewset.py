@@ -0,0 +1,99 @@
+# tests/tests_viewsets/test_stats_overview_viewset.py
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import make_aware
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from Myevol_app.models import JournalEntry
+from Myevol_app.models.stats_model import DailyStat, MonthlyStat
+from Myevol_app.services import stats_service
+from tests.tests_viewsets.factories import UserFactory
+
+WRITE_KEYWORDS = ("INSERT", "UPDATE", "DELETE")
+
+
+def _writes(context):
+    return [q["sql"] for q in context.captured_queries if q["sql"].lstrip().upper().startswith(WRITE_KEYWORDS)]
+
+
+@freeze_time("2025-04-23 12:00:00")
+class StatsOverviewReadModelTests(APITestCase):
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        for when, mood, category in [
+            (datetime(2025, 4, 2, 9), 6, "Travail"),
+            (datetime(2025, 4, 23, 9), 8, "Santé"),
+            (datetime(2025, 4, 23, 10), 4, "Santé"),
+        ]:
+            JournalEntry.objects.create(
+                user=self.user, content="Entrée", mood=mood, category=category, created_at=make_aware(when)
+            )
+
+    def test_overview_serves_stored_rollups_without_writes(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("stats-overview"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(_writes(context), [])
+        self.assertEqual(response.data["daily"]["entries_count"], 2)
+        self.assertEqual(response.data["daily"]["mood_average"], 6.0)
+        self.assertEqual(response.data["monthly"]["entries_count"], 3)
+        self.assertEqual(response.data["annual"]["categories"], {"Travail": 1, "Santé": 2})
+
+    def test_categories_without_writes(self):
+        for period in ("week", "month", "year", "all"):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(reverse("stats-categories"), {"period": period})
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(_writes(context), [])
+        self.assertEqual(response.data["total_entries"], 3)
+        self.assertEqual(response.data["categories"]["Santé"]["count"], 2)
+
+    def test_missing_period_is_empty_and_not_created(self):
+        other = UserFactory()
+        self.client.force_authenticate(user=other)
+
+        response = self.client.get(reverse("stats-overview"))
+
+        self.assertEqual(response.data["weekly"]["entries_count"], 0)
+        self.assertIsNone(response.data["weekly"]["id"])
+        self.assertFalse(DailyStat.objects.filter(user=other).exists())
+
+    def test_dirty_user_is_recomputed_in_memory(self):
+        # Cumul corrompu (ex. écriture ayant contourné les signaux)
+        MonthlyStat.objects.filter(user=self.user).update(entries_count=99)
+        stats_service.mark_stats_dirty(self.user.pk)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("stats-overview"))
+
+        self.assertEqual(_writes(context), [])
+        self.assertEqual(response.data["monthly"]["entries_count"], 3)
+        self.assertEqual(MonthlyStat.objects.get(user=self.user).entries_count, 99)
+
+    def test_failed_delta_marks_user_dirty(self):
+        with patch("Myevol_app.signals.stats_signals.apply_entry_delta", side_effect=RuntimeError("boom")):
+            JournalEntry.objects.create(user=self.user, content="Entrée", mood=10, category="Sport")
+
+        self.assertTrue(stats_service.is_stats_dirty(self.user.pk))
+        response = self.client.get(reverse("stats-overview"))
+        self.assertEqual(response.data["daily"]["entries_count"], 3)
+
+    def test_rebuild_clears_the_marker(self):
+        MonthlyStat.objects.filter(user=self.user).update(entries_count=99)
+        stats_service.mark_stats_dirty(self.user.pk)
+
+        stats_service.refresh_user_stats(self.user)
+
+        self.assertFalse(stats_service.is_stats_dirty(self.user.pk))
+        self.assertEqual(MonthlyStat.objects.get(user=self.user, month_start=date(2025, 4, 1)).entries_count, 3)